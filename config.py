@@ -8,16 +8,61 @@ You can import this from anywhere:
 
 import os
 import socket
+from typing import Any, Callable
 
 from app_paths import streams_file_path
 
-DEFAULT_ROV_HOST = os.environ.get("TRITON_ROV_DEFAULT_HOST", "192.168.1.4")
-TETHER_ROV_HOST = os.environ.get("TRITON_TETHER_ROV_HOST", DEFAULT_ROV_HOST)
-TETHER_WINDOWS_HOST = os.environ.get("TRITON_TETHER_WINDOWS_HOST", "192.168.1.1")
+# One plain-dict snapshot of the environment. Every setting below reads from
+# this instead of going through os.environ's per-key __getitem__/decode path.
+_ENV: dict[str, str] = dict(os.environ)
+
+
+def refresh_env_cache() -> None:
+    """Re-snapshot os.environ and drop memoized lazy settings.
+
+    Eagerly-evaluated constants keep their import-time values; reload the
+    module to recompute those.
+    """
+    global _ENV
+    _ENV = dict(os.environ)
+    _CACHE.clear()
+
+
+# Settings only some processes need (controller mapping, arm tuning, lens
+# correction, ...) are registered here and parsed on first attribute access
+# through the module-level __getattr__ below (PEP 562). Results are memoized in
+# _CACHE, which importlib.reload() resets along with _ENV.
+_LAZY: dict[str, Callable[[], Any]] = {}
+_CACHE: dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        return _CACHE[name]
+    except KeyError:
+        pass
+    try:
+        compute = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = _CACHE[name] = compute()
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+DEFAULT_ROV_HOST = _ENV.get("TRITON_ROV_DEFAULT_HOST", "192.168.1.4")
+TETHER_ROV_HOST = _ENV.get("TRITON_TETHER_ROV_HOST", DEFAULT_ROV_HOST)
+TETHER_WINDOWS_HOST = _ENV.get("TRITON_TETHER_WINDOWS_HOST", "192.168.1.1")
 
 
 def _env_bool(name: str, default: bool) -> bool:
-    raw = os.environ.get(name, "").strip().lower()
+    try:
+        raw = _ENV[name].strip().lower()
+    except KeyError:
+        return bool(default)
     if not raw:
         return bool(default)
     return raw in ("1", "true", "yes", "on")
@@ -66,7 +111,7 @@ def _auto_detect_rov_host() -> str:
     TRITON_ROV_ALLOW_WIFI_FALLBACK=1 or by providing TRITON_ROV_HOSTS.
     Explicit ROV_HOST/ROV_* endpoint environment variables still win.
     """
-    explicit = os.environ.get("ROV_HOST", "").strip()
+    explicit = _ENV.get("ROV_HOST", "").strip()
     if explicit:
         return explicit
 
@@ -74,7 +119,7 @@ def _auto_detect_rov_host() -> str:
     if not _env_bool("TRITON_ROV_AUTO_DETECT", True):
         return default_host
 
-    raw_hosts = os.environ.get("TRITON_ROV_HOSTS", "").strip()
+    raw_hosts = _ENV.get("TRITON_ROV_HOSTS", "").strip()
     if raw_hosts:
         candidates = _split_hosts(raw_hosts)
     elif _env_bool("TRITON_ROV_ALLOW_WIFI_FALLBACK", False):
@@ -82,7 +127,7 @@ def _auto_detect_rov_host() -> str:
     else:
         candidates = [default_host]
     ports = (6001, 5556)
-    timeout_s = float(os.environ.get("TRITON_ROV_HOST_PROBE_TIMEOUT", "0.25"))
+    timeout_s = float(_ENV.get("TRITON_ROV_HOST_PROBE_TIMEOUT", "0.25"))
     for host in candidates:
         for port in ports:
             reachable = _tcp_reachable_host(host, port, timeout_s)
@@ -95,27 +140,27 @@ def _auto_detect_rov_host() -> str:
 ROV_HOST = _auto_detect_rov_host()
 
 # ZMQ endpoints
-PILOT_PUB_ENDPOINT = os.environ.get("ROV_PILOT_EP", f"tcp://{ROV_HOST}:6000")
-SENSOR_SUB_ENDPOINT = os.environ.get("ROV_SENSOR_EP", f"tcp://{ROV_HOST}:6001")
-VIDEO_RPC_ENDPOINT = os.environ.get("ROV_VIDEO_RPC", f"tcp://{ROV_HOST}:5555")
-MANAGEMENT_RPC_ENDPOINT = os.environ.get("ROV_MANAGEMENT_RPC", f"tcp://{ROV_HOST}:5556")
+PILOT_PUB_ENDPOINT = _ENV.get("ROV_PILOT_EP", f"tcp://{ROV_HOST}:6000")
+SENSOR_SUB_ENDPOINT = _ENV.get("ROV_SENSOR_EP", f"tcp://{ROV_HOST}:6001")
+VIDEO_RPC_ENDPOINT = _ENV.get("ROV_VIDEO_RPC", f"tcp://{ROV_HOST}:5555")
+MANAGEMENT_RPC_ENDPOINT = _ENV.get("ROV_MANAGEMENT_RPC", f"tcp://{ROV_HOST}:5556")
 
 # Video reconnect policy. Four 1080p streams can take a few seconds to settle,
 # especially while the Pi is starting every camera pipeline at once.
-VIDEO_STALL_TIMEOUT_S = float(os.environ.get("TRITON_VIDEO_STALL_TIMEOUT_S", "8.0"))
-VIDEO_FIRST_FRAME_TIMEOUT_S = float(os.environ.get("TRITON_VIDEO_FIRST_FRAME_TIMEOUT_S", "14.0"))
-VIDEO_WARM_HIDDEN_STREAMS = os.environ.get("TRITON_VIDEO_WARM_HIDDEN_STREAMS", "0").strip().lower() in (
+VIDEO_STALL_TIMEOUT_S = float(_ENV.get("TRITON_VIDEO_STALL_TIMEOUT_S", "8.0"))
+VIDEO_FIRST_FRAME_TIMEOUT_S = float(_ENV.get("TRITON_VIDEO_FIRST_FRAME_TIMEOUT_S", "14.0"))
+VIDEO_WARM_HIDDEN_STREAMS = _ENV.get("TRITON_VIDEO_WARM_HIDDEN_STREAMS", "0").strip().lower() in (
     "1",
     "true",
     "yes",
     "on",
 )
-VIDEO_WARMUP_INTERVAL_MS = int(os.environ.get("TRITON_VIDEO_WARMUP_INTERVAL_MS", "750"))
+VIDEO_WARMUP_INTERVAL_MS = int(_ENV.get("TRITON_VIDEO_WARMUP_INTERVAL_MS", "750"))
 # Delay between bringing cameras back one-at-a-time when a multi-pane layout is
 # restored (e.g. leaving the transect tab). Avoids the simultaneous start spike
 # that can make a camera fail to come up. 0 disables staggering.
-VIDEO_RESTART_STAGGER_MS = int(os.environ.get("TRITON_VIDEO_RESTART_STAGGER_MS", "400"))
-VIDEO_DEFER_STREAMS_UNTIL_LINK = os.environ.get("TRITON_VIDEO_DEFER_UNTIL_LINK", "1").strip().lower() not in (
+VIDEO_RESTART_STAGGER_MS = int(_ENV.get("TRITON_VIDEO_RESTART_STAGGER_MS", "400"))
+VIDEO_DEFER_STREAMS_UNTIL_LINK = _ENV.get("TRITON_VIDEO_DEFER_UNTIL_LINK", "1").strip().lower() not in (
     "0",
     "false",
     "no",
@@ -124,7 +169,10 @@ VIDEO_DEFER_STREAMS_UNTIL_LINK = os.environ.get("TRITON_VIDEO_DEFER_UNTIL_LINK",
 
 
 def _float_env(name: str, default: float, *, min_value: float, max_value: float) -> float:
-    raw = os.environ.get(name, "").strip()
+    try:
+        raw = _ENV[name].strip()
+    except KeyError:
+        return float(default)
     if not raw:
         return float(default)
     try:
@@ -137,7 +185,10 @@ def _float_env(name: str, default: float, *, min_value: float, max_value: float)
 
 
 def _layout_count_env(name: str, default: int) -> int:
-    raw = os.environ.get(name, "").strip()
+    try:
+        raw = _ENV[name].strip()
+    except KeyError:
+        return int(default)
     if not raw:
         return int(default)
     try:
@@ -150,7 +201,7 @@ def _layout_count_env(name: str, default: int) -> int:
 # Default to quad view for piloting, and keep hidden streams warm once started
 # so layout/camera switches do not need to ask TritonOS to recreate pipelines.
 VIDEO_DEFAULT_LAYOUT_COUNT = _layout_count_env("TRITON_VIDEO_DEFAULT_LAYOUT_COUNT", 4)
-VIDEO_STOP_HIDDEN_STREAMS = os.environ.get("TRITON_VIDEO_STOP_HIDDEN_STREAMS", "0").strip().lower() in (
+VIDEO_STOP_HIDDEN_STREAMS = _ENV.get("TRITON_VIDEO_STOP_HIDDEN_STREAMS", "0").strip().lower() in (
     "1",
     "true",
     "yes",
@@ -173,7 +224,7 @@ STREAMS_FILE = streams_file_path()
 #
 # You can override at runtime:
 #   TRITON_CONTROLLER_DEADZONE=0.15 python -m main
-CONTROLLER_DEADZONE = float(os.environ.get("TRITON_CONTROLLER_DEADZONE", "0.15"))
+_LAZY["CONTROLLER_DEADZONE"] = lambda: float(_ENV.get("TRITON_CONTROLLER_DEADZONE", "0.15"))
 
 
 # Controller selection / mapping
@@ -190,7 +241,10 @@ CONTROLLER_DEADZONE = float(os.environ.get("TRITON_CONTROLLER_DEADZONE", "0.15")
 #   TRITON_CONTROLLER_AXIS_MAP=0,1,3,4,2,5 python -m main_topside
 #
 def _parse_int_list_env(var: str, default: list[int]) -> list[int]:
-    s = os.environ.get(var, "").strip()
+    try:
+        s = _ENV[var].strip()
+    except KeyError:
+        return list(default)
     if not s:
         return list(default)
     try:
@@ -199,11 +253,11 @@ def _parse_int_list_env(var: str, default: list[int]) -> list[int]:
         return list(default)
 
 
-CONTROLLER_INDEX = int(os.environ.get("TRITON_CONTROLLER_INDEX", "0"))
+_LAZY["CONTROLLER_INDEX"] = lambda: int(_ENV.get("TRITON_CONTROLLER_INDEX", "0"))
 
 # Optional diagnostic logging.
-CONTROLLER_DEBUG = os.environ.get("TRITON_CONTROLLER_DEBUG", "0").strip().lower() in ("1", "true", "yes")
-CONTROLLER_DUMP_RAW_EVERY_S = float(os.environ.get("TRITON_CONTROLLER_DUMP_RAW_EVERY", "0"))
+_LAZY["CONTROLLER_DEBUG"] = lambda: _ENV.get("TRITON_CONTROLLER_DEBUG", "0").strip().lower() in ("1", "true", "yes")
+_LAZY["CONTROLLER_DUMP_RAW_EVERY_S"] = lambda: float(_ENV.get("TRITON_CONTROLLER_DUMP_RAW_EVERY", "0"))
 
 # Axis mapping (lx,ly,rx,ry,lt,rt) -> pygame axis indices.
 #
@@ -218,19 +272,22 @@ CONTROLLER_DUMP_RAW_EVERY_S = float(os.environ.get("TRITON_CONTROLLER_DUMP_RAW_E
 # To force a mapping, set one of these examples:
 #   TRITON_CONTROLLER_AXIS_MAP=0,1,2,3,4,5   (layout A)
 #   TRITON_CONTROLLER_AXIS_MAP=0,1,3,4,2,5   (layout B)
-_AXIS_MAP_ENV = os.environ.get("TRITON_CONTROLLER_AXIS_MAP", "").strip().lower()
-if (not _AXIS_MAP_ENV) or _AXIS_MAP_ENV in ("auto", "detect", "default"):
-    CONTROLLER_AXIS_MAP = None
-else:
-    CONTROLLER_AXIS_MAP = _parse_int_list_env("TRITON_CONTROLLER_AXIS_MAP", [0, 1, 2, 3, 4, 5])
+def _controller_axis_map() -> list[int] | None:
+    raw = _ENV.get("TRITON_CONTROLLER_AXIS_MAP", "").strip().lower()
+    if (not raw) or raw in ("auto", "detect", "default"):
+        return None
+    return _parse_int_list_env("TRITON_CONTROLLER_AXIS_MAP", [0, 1, 2, 3, 4, 5])
+
+
+_LAZY["CONTROLLER_AXIS_MAP"] = _controller_axis_map
 
 # D-pad hat index (usually 0).
-CONTROLLER_HAT_INDEX = int(os.environ.get("TRITON_CONTROLLER_HAT_INDEX", "0"))
+_LAZY["CONTROLLER_HAT_INDEX"] = lambda: int(_ENV.get("TRITON_CONTROLLER_HAT_INDEX", "0"))
 
 # Button candidate overrides (comma-separated indices). If provided, these take
 # precedence over the built-in heuristics.
-CONTROLLER_MENU_BUTTONS = _parse_int_list_env("TRITON_CONTROLLER_MENU_BUTTONS", [])
-CONTROLLER_WIN_BUTTONS = _parse_int_list_env("TRITON_CONTROLLER_WIN_BUTTONS", [])
+_LAZY["CONTROLLER_MENU_BUTTONS"] = lambda: _parse_int_list_env("TRITON_CONTROLLER_MENU_BUTTONS", [])
+_LAZY["CONTROLLER_WIN_BUTTONS"] = lambda: _parse_int_list_env("TRITON_CONTROLLER_WIN_BUTTONS", [])
 
 # ---------------------------------------------------------------------------
 # Control modes
@@ -238,69 +295,69 @@ CONTROLLER_WIN_BUTTONS = _parse_int_list_env("TRITON_CONTROLLER_WIN_BUTTONS", []
 # Depth hold is toggled topside and transmitted in PilotFrame.modes.
 # Default button: press down the RIGHT stick (rstick).
 
-DEPTH_HOLD_TOGGLE_BUTTON = os.environ.get("TRITON_DEPTH_HOLD_TOGGLE", "rstick").strip().lower()
-DEPTH_HOLD_DEFAULT = os.environ.get("TRITON_DEPTH_HOLD_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
+DEPTH_HOLD_TOGGLE_BUTTON = _ENV.get("TRITON_DEPTH_HOLD_TOGGLE", "rstick").strip().lower()
+DEPTH_HOLD_DEFAULT = _ENV.get("TRITON_DEPTH_HOLD_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
 
 # Roll/pitch leveling and yaw hold are sent as part of
 # PilotFrame.modes["autopilot"].
 # Roll/pitch leveling is intentionally GUI-first by default; yaw hold mirrors
 # depth hold and is toggled by pressing down the LEFT stick (lstick).
-ROLL_PITCH_LEVEL_TOGGLE_BUTTON = os.environ.get("TRITON_RP_LEVEL_TOGGLE", "").strip().lower()
-ROLL_PITCH_LEVEL_DEFAULT = os.environ.get("TRITON_RP_LEVEL_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
-YAW_HOLD_TOGGLE_BUTTON = os.environ.get("TRITON_YAW_HOLD_TOGGLE", "lstick").strip().lower()
-YAW_HOLD_DEFAULT = os.environ.get("TRITON_YAW_HOLD_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
+ROLL_PITCH_LEVEL_TOGGLE_BUTTON = _ENV.get("TRITON_RP_LEVEL_TOGGLE", "").strip().lower()
+ROLL_PITCH_LEVEL_DEFAULT = _ENV.get("TRITON_RP_LEVEL_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
+YAW_HOLD_TOGGLE_BUTTON = _ENV.get("TRITON_YAW_HOLD_TOGGLE", "lstick").strip().lower()
+YAW_HOLD_DEFAULT = _ENV.get("TRITON_YAW_HOLD_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
 
 # Transect optical-hold experimental defaults. The size/altitude loop regulates
 # apparent target size, not a pressure-sensor depth. Larger blue width percent
 # means lower/closer to the square; smaller means higher/farther.
 TRANSECT_ROTATION_SERVO_DEFAULT = (
-    os.environ.get("TRITON_TRANSECT_ROTATION_SERVO_DEFAULT", "1").strip().lower()
+    _ENV.get("TRITON_TRANSECT_ROTATION_SERVO_DEFAULT", "1").strip().lower()
     in ("1", "true", "yes", "on")
 )
 
 
 def _transect_target_blue_width_percent_default() -> float:
-    s = os.environ.get("TRITON_TRANSECT_TARGET_BLUE_WIDTH_PERCENT", "").strip()
+    s = _ENV.get("TRITON_TRANSECT_TARGET_BLUE_WIDTH_PERCENT", "").strip()
     if s:
         return float(s)
     # Backwards-compatible bridge for the previous footprint-cm knob.
-    footprint_s = os.environ.get("TRITON_TRANSECT_TARGET_FOOTPRINT_CM", "").strip()
+    footprint_s = _ENV.get("TRITON_TRANSECT_TARGET_FOOTPRINT_CM", "").strip()
     if footprint_s:
         return 100.0 * 50.0 / max(1e-6, float(footprint_s))
     return 50.0
 
 
 TRANSECT_TARGET_BLUE_WIDTH_PERCENT_DEFAULT = _transect_target_blue_width_percent_default()
-TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MIN = float(os.environ.get("TRITON_TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MIN", "25.0"))
-TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MAX = float(os.environ.get("TRITON_TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MAX", "95.0"))
+TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MIN = float(_ENV.get("TRITON_TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MIN", "25.0"))
+TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MAX = float(_ENV.get("TRITON_TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MAX", "95.0"))
 
 # Topside-only fallback attitude estimator convention. The onboard estimator is
 # authoritative when available; these settings keep the raw-sensor page aligned
 # during local fallback/replay.
-ATTITUDE_VEHICLE_ROLL_AXIS = os.environ.get("TRITON_ATTITUDE_VEHICLE_ROLL_AXIS", "z").strip() or "z"
-ATTITUDE_ROLL_SIGN = float(os.environ.get("TRITON_ATTITUDE_ROLL_SIGN", "1.0"))
-ATTITUDE_PITCH_SIGN = float(os.environ.get("TRITON_ATTITUDE_PITCH_SIGN", "1.0"))
+ATTITUDE_VEHICLE_ROLL_AXIS = _ENV.get("TRITON_ATTITUDE_VEHICLE_ROLL_AXIS", "z").strip() or "z"
+ATTITUDE_ROLL_SIGN = float(_ENV.get("TRITON_ATTITUDE_ROLL_SIGN", "1.0"))
+ATTITUDE_PITCH_SIGN = float(_ENV.get("TRITON_ATTITUDE_PITCH_SIGN", "1.0"))
 
 # Lights are toggled by sending TritonOS its normal synthetic button edge.
 # Default control: keyboard L. Set TRITON_LIGHTS_TOGGLE_BUTTON if you want a
 # physical button in addition to the keyboard shortcut.
-LIGHTS_TOGGLE_SHORTCUT = os.environ.get("TRITON_LIGHTS_TOGGLE_SHORTCUT", "L").strip() or "L"
-LIGHTS_TOGGLE_BUTTON = os.environ.get("TRITON_LIGHTS_TOGGLE_BUTTON", "").strip().lower()
-LIGHTS_TOGGLE_EDGE = os.environ.get("TRITON_LIGHTS_TOGGLE_EDGE", "lights").strip().lower() or "lights"
+LIGHTS_TOGGLE_SHORTCUT = _ENV.get("TRITON_LIGHTS_TOGGLE_SHORTCUT", "L").strip() or "L"
+LIGHTS_TOGGLE_BUTTON = _ENV.get("TRITON_LIGHTS_TOGGLE_BUTTON", "").strip().lower()
+LIGHTS_TOGGLE_EDGE = _ENV.get("TRITON_LIGHTS_TOGGLE_EDGE", "lights").strip().lower() or "lights"
 
 # Arm/disarm is sent as TritonOS' normal controller menu/start edge. The laptop
 # keyboard shortcut gives the pilot a backup when that hardware button fails.
-ARM_DISARM_TOGGLE_SHORTCUT = os.environ.get("TRITON_ARM_DISARM_SHORTCUT", "O").strip() or "O"
-ARM_DISARM_TOGGLE_EDGE = os.environ.get("TRITON_ARM_DISARM_EDGE", "menu").strip().lower() or "menu"
+ARM_DISARM_TOGGLE_SHORTCUT = _ENV.get("TRITON_ARM_DISARM_SHORTCUT", "O").strip() or "O"
+ARM_DISARM_TOGGLE_EDGE = _ENV.get("TRITON_ARM_DISARM_EDGE", "menu").strip().lower() or "menu"
 
 # Reverse drive mode rotates the pilot's translation commands by 180 degrees
 # so surge/sway still match when the operator swaps to a rear camera. Yaw keeps
 # its normal left/right sign.
 # By default this is toggleable from the controller's left bumper (`lb`) and
 # from the GUI/menu with the `R` shortcut.
-REVERSE_MODE_DEFAULT = os.environ.get("TRITON_REVERSE_MODE_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
-REVERSE_TOGGLE_BUTTON = os.environ.get("TRITON_REVERSE_TOGGLE", "lb").strip().lower()
-REVERSE_TOGGLE_SHORTCUT = os.environ.get("TRITON_REVERSE_SHORTCUT", "R").strip() or "R"
+REVERSE_MODE_DEFAULT = _ENV.get("TRITON_REVERSE_MODE_DEFAULT", "0").strip().lower() in ("1", "true", "yes")
+REVERSE_TOGGLE_BUTTON = _ENV.get("TRITON_REVERSE_TOGGLE", "lb").strip().lower()
+REVERSE_TOGGLE_SHORTCUT = _ENV.get("TRITON_REVERSE_SHORTCUT", "R").strip() or "R"
 
 # Intelligent current (fuse) limiter -- the live pilot-side enable for the ROV's
 # feed-forward thruster current budget. This only has an effect when the ROV
@@ -308,18 +365,21 @@ REVERSE_TOGGLE_SHORTCUT = os.environ.get("TRITON_REVERSE_SHORTCUT", "R").strip()
 # off the ROV never loads the model and this toggle is a harmless no-op. Default
 # ON so that whenever the feature is enabled on the ROV it starts protecting,
 # with the top-bar checkbox as an instant live kill switch.
-CURRENT_BUDGET_DEFAULT = os.environ.get("TRITON_CURRENT_BUDGET_DEFAULT", "1").strip().lower() in ("1", "true", "yes")
+CURRENT_BUDGET_DEFAULT = _ENV.get("TRITON_CURRENT_BUDGET_DEFAULT", "1").strip().lower() in ("1", "true", "yes")
 # Live total-thruster-current cap (amps, before the ROV's reserve) that the pilot
 # can dial from the top bar. Streamed in modes["current_budget_max_a"] and used by
 # the ROV to override rov_config.CURRENT_BUDGET_MAX_A when the limiter is loaded.
 # Keep it under the fuse rating with margin (25 A fuse -> ~22 A is a sane start).
-CURRENT_BUDGET_MAX_A_DEFAULT = float(os.environ.get("TRITON_CURRENT_BUDGET_MAX_A", "22"))
-CURRENT_BUDGET_MAX_A_MIN = float(os.environ.get("TRITON_CURRENT_BUDGET_MAX_A_MIN", "5"))
-CURRENT_BUDGET_MAX_A_MAX = float(os.environ.get("TRITON_CURRENT_BUDGET_MAX_A_MAX", "40"))
+CURRENT_BUDGET_MAX_A_DEFAULT = float(_ENV.get("TRITON_CURRENT_BUDGET_MAX_A", "22"))
+CURRENT_BUDGET_MAX_A_MIN = float(_ENV.get("TRITON_CURRENT_BUDGET_MAX_A_MIN", "5"))
+CURRENT_BUDGET_MAX_A_MAX = float(_ENV.get("TRITON_CURRENT_BUDGET_MAX_A_MAX", "40"))
 
 
 def _parse_str_list_env(var: str, default: list[str]) -> list[str]:
-    s = os.environ.get(var, "").strip()
+    try:
+        s = _ENV[var].strip()
+    except KeyError:
+        return list(default)
     if not s:
         return list(default)
     parts = [p.strip() for p in s.split(",")]
@@ -344,95 +404,95 @@ FORWARD_CAMERA_KEYWORDS = _parse_str_list_env(
 # Y = +5%, A = -5% by default (handled in input/pilot_service.py).
 # Values are normalized fractions (0.0..1.0) and interpreted on the ROV side as
 # a multiplier of the configured POWER_SCALE baseline.
-PILOT_MAX_GAIN_DEFAULT = float(os.environ.get("TRITON_PILOT_MAX_GAIN_DEFAULT", "0.4"))
-PILOT_MAX_GAIN_MIN = float(os.environ.get("TRITON_PILOT_MAX_GAIN_MIN", "0.05"))
-PILOT_MAX_GAIN_MAX = float(os.environ.get("TRITON_PILOT_MAX_GAIN_MAX", "0.8"))
-PILOT_MAX_GAIN_STEP = float(os.environ.get("TRITON_PILOT_MAX_GAIN_STEP", "0.05"))
+_LAZY["PILOT_MAX_GAIN_DEFAULT"] = lambda: float(_ENV.get("TRITON_PILOT_MAX_GAIN_DEFAULT", "0.4"))
+_LAZY["PILOT_MAX_GAIN_MIN"] = lambda: float(_ENV.get("TRITON_PILOT_MAX_GAIN_MIN", "0.05"))
+_LAZY["PILOT_MAX_GAIN_MAX"] = lambda: float(_ENV.get("TRITON_PILOT_MAX_GAIN_MAX", "0.8"))
+_LAZY["PILOT_MAX_GAIN_STEP"] = lambda: float(_ENV.get("TRITON_PILOT_MAX_GAIN_STEP", "0.05"))
 
 # Pilot-adjustable gain for the back rotating gripper / T200 wrist motor. This
 # is transmitted separately from the main vehicle max gain so the manipulator
 # can be tuned independently by TritonOS. The older TRITON_T200_* environment
 # names remain accepted as fallbacks.
-BACK_GRIPPER_GAIN_DEFAULT = float(
-    os.environ.get(
+_LAZY["BACK_GRIPPER_GAIN_DEFAULT"] = lambda: float(
+    _ENV.get(
         "TRITON_BACK_GRIPPER_GAIN_DEFAULT",
-        os.environ.get("TRITON_T200_WRIST_GAIN_DEFAULT", "0.50"),
+        _ENV.get("TRITON_T200_WRIST_GAIN_DEFAULT", "0.50"),
     )
 )
-BACK_GRIPPER_GAIN_MIN = float(
-    os.environ.get(
+_LAZY["BACK_GRIPPER_GAIN_MIN"] = lambda: float(
+    _ENV.get(
         "TRITON_BACK_GRIPPER_GAIN_MIN",
-        os.environ.get("TRITON_T200_WRIST_GAIN_MIN", "0.10"),
+        _ENV.get("TRITON_T200_WRIST_GAIN_MIN", "0.10"),
     )
 )
-BACK_GRIPPER_GAIN_MAX = float(
-    os.environ.get(
+_LAZY["BACK_GRIPPER_GAIN_MAX"] = lambda: float(
+    _ENV.get(
         "TRITON_BACK_GRIPPER_GAIN_MAX",
-        os.environ.get("TRITON_T200_WRIST_GAIN_MAX", "1.0"),
+        _ENV.get("TRITON_T200_WRIST_GAIN_MAX", "1.0"),
     )
 )
-BACK_GRIPPER_GAIN_STEP = float(
-    os.environ.get(
+_LAZY["BACK_GRIPPER_GAIN_STEP"] = lambda: float(
+    _ENV.get(
         "TRITON_BACK_GRIPPER_GAIN_STEP",
-        os.environ.get("TRITON_T200_WRIST_GAIN_STEP", "0.05"),
+        _ENV.get("TRITON_T200_WRIST_GAIN_STEP", "0.05"),
     )
 )
 
 # Backwards-compatible names used by older Pilot code/tests/docs.
-T200_WRIST_GAIN_DEFAULT = BACK_GRIPPER_GAIN_DEFAULT
-T200_WRIST_GAIN_MIN = BACK_GRIPPER_GAIN_MIN
-T200_WRIST_GAIN_MAX = BACK_GRIPPER_GAIN_MAX
-T200_WRIST_GAIN_STEP = BACK_GRIPPER_GAIN_STEP
+_LAZY["T200_WRIST_GAIN_DEFAULT"] = _LAZY["BACK_GRIPPER_GAIN_DEFAULT"]
+_LAZY["T200_WRIST_GAIN_MIN"] = _LAZY["BACK_GRIPPER_GAIN_MIN"]
+_LAZY["T200_WRIST_GAIN_MAX"] = _LAZY["BACK_GRIPPER_GAIN_MAX"]
+_LAZY["T200_WRIST_GAIN_STEP"] = _LAZY["BACK_GRIPPER_GAIN_STEP"]
 
 # Pilot-adjustable gain for controller-driven arm/gripper-head movement.
-ARM_GAIN_DEFAULT = float(os.environ.get("TRITON_ARM_GAIN_DEFAULT", "0.50"))
-ARM_GAIN_MIN = float(os.environ.get("TRITON_ARM_GAIN_MIN", "0.10"))
-ARM_GAIN_MAX = float(os.environ.get("TRITON_ARM_GAIN_MAX", "1.0"))
-ARM_GAIN_STEP = float(os.environ.get("TRITON_ARM_GAIN_STEP", "0.05"))
+_LAZY["ARM_GAIN_DEFAULT"] = lambda: float(_ENV.get("TRITON_ARM_GAIN_DEFAULT", "0.50"))
+_LAZY["ARM_GAIN_MIN"] = lambda: float(_ENV.get("TRITON_ARM_GAIN_MIN", "0.10"))
+_LAZY["ARM_GAIN_MAX"] = lambda: float(_ENV.get("TRITON_ARM_GAIN_MAX", "1.0"))
+_LAZY["ARM_GAIN_STEP"] = lambda: float(_ENV.get("TRITON_ARM_GAIN_STEP", "0.05"))
 
 # --- Differential arm (servo wrist) input ----------------------------------
 # Publish rate for the pilot control stream (Hz). Match the ROV control loop
 # (50 Hz) to minimize manipulator latency.
-PILOT_PUBLISH_RATE_HZ = float(os.environ.get("TRITON_PILOT_PUBLISH_RATE_HZ", "50.0"))
+_LAZY["PILOT_PUBLISH_RATE_HZ"] = lambda: float(_ENV.get("TRITON_PILOT_PUBLISH_RATE_HZ", "50.0"))
 
 # The differential arm is driven by a centralized POSITION integrator in
 # PilotPublisherService. The right stick feeds it while the modifier button is
 # held, so it does not fight driving. While the modifier is held, the yaw/heave
 # stick axes are zeroed so the ROV holds station while you aim the arm.
-ARM_AIM_MODIFIER_BUTTON = os.environ.get("TRITON_ARM_AIM_MODIFIER", "rb").strip().lower()
-ARM_STICK_PITCH_AXIS = os.environ.get("TRITON_ARM_STICK_PITCH_AXIS", "ry").strip().lower()
-ARM_STICK_WRIST_AXIS = os.environ.get("TRITON_ARM_STICK_WRIST_AXIS", "rx").strip().lower()
-ARM_STICK_DEADZONE = float(os.environ.get("TRITON_ARM_STICK_DEADZONE", "0.12"))
-ARM_STICK_PITCH_INVERT = float(os.environ.get("TRITON_ARM_STICK_PITCH_INVERT", "-1.0"))
-ARM_STICK_WRIST_INVERT = float(os.environ.get("TRITON_ARM_STICK_WRIST_INVERT", "1.0"))
+ARM_AIM_MODIFIER_BUTTON = _ENV.get("TRITON_ARM_AIM_MODIFIER", "rb").strip().lower()
+ARM_STICK_PITCH_AXIS = _ENV.get("TRITON_ARM_STICK_PITCH_AXIS", "ry").strip().lower()
+ARM_STICK_WRIST_AXIS = _ENV.get("TRITON_ARM_STICK_WRIST_AXIS", "rx").strip().lower()
+_LAZY["ARM_STICK_DEADZONE"] = lambda: float(_ENV.get("TRITON_ARM_STICK_DEADZONE", "0.12"))
+_LAZY["ARM_STICK_PITCH_INVERT"] = lambda: float(_ENV.get("TRITON_ARM_STICK_PITCH_INVERT", "-1.0"))
+_LAZY["ARM_STICK_WRIST_INVERT"] = lambda: float(_ENV.get("TRITON_ARM_STICK_WRIST_INVERT", "1.0"))
 
 # Arm motion rate in normalized position units/sec at 100% ARM gain. Stick
 # deflection scales this rate. 2.5 crosses the full -1..+1 range in ~0.8 s at
 # 100% gain.
-ARM_RATE = float(os.environ.get("TRITON_ARM_RATE", "2.5"))
+_LAZY["ARM_RATE"] = lambda: float(_ENV.get("TRITON_ARM_RATE", "2.5"))
 
 # Startup arm position (normalized): pitch -1 = flat/folded, wrist +1 = 90 deg.
-ARM_INIT_PITCH = float(os.environ.get("TRITON_ARM_INIT_PITCH", "-1.0"))
-ARM_INIT_WRIST = float(os.environ.get("TRITON_ARM_INIT_WRIST", "1.0"))
+_LAZY["ARM_INIT_PITCH"] = lambda: float(_ENV.get("TRITON_ARM_INIT_PITCH", "-1.0"))
+_LAZY["ARM_INIT_WRIST"] = lambda: float(_ENV.get("TRITON_ARM_INIT_WRIST", "1.0"))
 
 # Keyboard A commands this pilot-side park target. Vehicle Setup refreshes this
 # target from the ROV's GRIPPER_ARM_* / GRIPPER_DISARM_* config when available.
-ARM_PARK_SHORTCUT = os.environ.get("TRITON_ARM_PARK_SHORTCUT", "A").strip() or "A"
-ARM_PARK_PITCH = float(os.environ.get("TRITON_ARM_PARK_PITCH", "-1.0"))
-ARM_PARK_WRIST = float(os.environ.get("TRITON_ARM_PARK_WRIST", "1.0"))
-ARM_PARK_RATE = float(os.environ.get("TRITON_ARM_PARK_RATE", "0.80"))
+ARM_PARK_SHORTCUT = _ENV.get("TRITON_ARM_PARK_SHORTCUT", "A").strip() or "A"
+_LAZY["ARM_PARK_PITCH"] = lambda: float(_ENV.get("TRITON_ARM_PARK_PITCH", "-1.0"))
+_LAZY["ARM_PARK_WRIST"] = lambda: float(_ENV.get("TRITON_ARM_PARK_WRIST", "1.0"))
+_LAZY["ARM_PARK_RATE"] = lambda: float(_ENV.get("TRITON_ARM_PARK_RATE", "0.80"))
 
 
 # Legacy topside walk-target display settings. Current depth-hold manual
 # override/latching behavior is owned by TritonOS; keep these only for older
 # environments that still reference the names.
-DEPTH_HOLD_WALK_DEADBAND = float(os.environ.get("TRITON_DEPTH_HOLD_WALK_DEADBAND", "0.10"))
-DEPTH_HOLD_WALK_RATE_MPS = float(os.environ.get("TRITON_DEPTH_HOLD_WALK_RATE_MPS", "0.45"))
-DEPTH_HOLD_SENSOR_STALE_S = float(os.environ.get("TRITON_DEPTH_HOLD_SENSOR_STALE_S", "2.0"))
+_LAZY["DEPTH_HOLD_WALK_DEADBAND"] = lambda: float(_ENV.get("TRITON_DEPTH_HOLD_WALK_DEADBAND", "0.10"))
+_LAZY["DEPTH_HOLD_WALK_RATE_MPS"] = lambda: float(_ENV.get("TRITON_DEPTH_HOLD_WALK_RATE_MPS", "0.45"))
+_LAZY["DEPTH_HOLD_SENSOR_STALE_S"] = lambda: float(_ENV.get("TRITON_DEPTH_HOLD_SENSOR_STALE_S", "2.0"))
 
 # Topside yaw-hold display freshness. Manual-yaw override and release latching
 # are owned by TritonOS.
-YAW_HOLD_ATTITUDE_STALE_S = float(os.environ.get("TRITON_YAW_HOLD_ATTITUDE_STALE_S", "1.0"))
+_LAZY["YAW_HOLD_ATTITUDE_STALE_S"] = lambda: float(_ENV.get("TRITON_YAW_HOLD_ATTITUDE_STALE_S", "1.0"))
 
 
 # ---------------------------------------------------------------------------
@@ -447,10 +507,10 @@ YAW_HOLD_ATTITUDE_STALE_S = float(os.environ.get("TRITON_YAW_HOLD_ATTITUDE_STALE
 #   1.00 = use the configured target FOV
 #   >1.0 = slightly tighter crop
 #   <1.0 = slightly wider crop
-WATER_CORRECTION_ZOOM = float(os.environ.get("TRITON_WATER_ZOOM", "1.0"))
-WATER_CORRECTION_K1   = float(os.environ.get("TRITON_WATER_K1",   "0.0"))
-WATER_CORRECTION_K2   = float(os.environ.get("TRITON_WATER_K2",   "0.0"))
-WATER_CORRECTION_K3   = float(os.environ.get("TRITON_WATER_K3",   "0.0"))
-WATER_CORRECTION_AIR_HFOV_DEG = float(os.environ.get("TRITON_WATER_AIR_HFOV_DEG", "138.0"))
-WATER_CORRECTION_TARGET_HFOV_DEG = float(os.environ.get("TRITON_WATER_TARGET_HFOV_DEG", "96.0"))
+_LAZY["WATER_CORRECTION_ZOOM"] = lambda: float(_ENV.get("TRITON_WATER_ZOOM", "1.0"))
+_LAZY["WATER_CORRECTION_K1"] = lambda: float(_ENV.get("TRITON_WATER_K1",   "0.0"))
+_LAZY["WATER_CORRECTION_K2"] = lambda: float(_ENV.get("TRITON_WATER_K2",   "0.0"))
+_LAZY["WATER_CORRECTION_K3"] = lambda: float(_ENV.get("TRITON_WATER_K3",   "0.0"))
+_LAZY["WATER_CORRECTION_AIR_HFOV_DEG"] = lambda: float(_ENV.get("TRITON_WATER_AIR_HFOV_DEG", "138.0"))
+_LAZY["WATER_CORRECTION_TARGET_HFOV_DEG"] = lambda: float(_ENV.get("TRITON_WATER_TARGET_HFOV_DEG", "96.0"))
 
@@ -776,6 +776,7 @@ class DirectGstVideoWidget(QWidget):
     """Low-latency video widget that lets GStreamer render directly to Direct3D."""
 
     activated = pyqtSignal()
+    stateChanged = pyqtSignal(str)  # waiting|connecting|playing
 
     def __init__(self, manager: RemoteCameraManager, stream_name: str, parent=None, *, autostart: bool = True):
         super().__init__(parent)
@@ -860,7 +861,7 @@ class DirectGstVideoWidget(QWidget):
             return
         if self._proc is not None and self._proc.poll() is None:
             return
-        self._state = "connecting"
+        self._set_state("connecting")
         self._last_error = None
         self._embedded_hwnd = None
         self._connect_started_ts = time.time()
@@ -946,7 +947,7 @@ class DirectGstVideoWidget(QWidget):
         self._rov_link_lost = False
         if embedded_hwnd:
             self._embedded_hwnd = int(embedded_hwnd)
-        self._state = "playing"
+        self._set_state("playing")
         self._connected_ts = time.time()
         self._retry_backoff_s = 0.5
         if self._embedded_hwnd:
@@ -971,7 +972,7 @@ class DirectGstVideoWidget(QWidget):
         self._proc = None
         self._embedded_hwnd = None
         self._last_error = error
-        self._state = "waiting"
+        self._set_state("waiting")
         self._retry_backoff_s = min(self._retry_backoff_s * 1.5, 5.0)
         self._schedule_retry(self._retry_backoff_s)
         self._show_message(f"{self.stream_name}\nDirect renderer unavailable. Retrying...\n\n{error}")
@@ -1045,7 +1046,7 @@ class DirectGstVideoWidget(QWidget):
                 self._embed_timer.stop()
             except Exception:
                 pass
-            self._state = "waiting"
+            self._set_state("waiting")
             self._last_error = f"GStreamer renderer exited with code {proc.returncode}"
             try:
                 self.manager.rov.stop_stream(name=self.stream_name)
@@ -1105,7 +1106,7 @@ class DirectGstVideoWidget(QWidget):
             self.shutdown(release_only=True, async_release=True)
         except Exception:
             pass
-        self._state = "waiting"
+        self._set_state("waiting")
         self._last_error = message.replace("\n", " ")
         self._show_message(message)
         self._retry_backoff_s = 0.5
@@ -1140,6 +1141,11 @@ class DirectGstVideoWidget(QWidget):
                 retry_delay_s=0.1,
             )
 
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            self._state = state
+            self.stateChanged.emit(state)
+
     def status(self) -> dict:
         age = max(0.0, time.time() - self._connected_ts) if self._connected_ts > 0 else None
         return {
@@ -1231,7 +1237,7 @@ class DirectGstVideoWidget(QWidget):
                 pass
         else:
             _stop_remote_stream()
-        self._state = "waiting"
+        self._set_state("waiting")
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
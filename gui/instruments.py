@@ -6,8 +6,8 @@ import math
 import time
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QRectF, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
+from PyQt6.QtCore import Qt, QLine, QRectF, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QPixmap, QTransform
 from PyQt6.QtWidgets import (
     QWidget,
     QFrame,
@@ -25,6 +25,64 @@ from PyQt6.QtWidgets import (
 from network.management_rpc import ManagementRpcService
 
 
+def _new_layer(widget: QWidget) -> QPixmap:
+    """Transparent, DPR-aware pixmap covering ``widget`` for cached painting."""
+    dpr = max(1.0, float(widget.devicePixelRatioF()))
+    pix = QPixmap(max(1, int(widget.width() * dpr)), max(1, int(widget.height() * dpr)))
+    pix.setDevicePixelRatio(dpr)
+    pix.fill(Qt.GlobalColor.transparent)
+    return pix
+
+
+_ANALYSIS_SHARE_STYLES = {
+    "alert": "color: #ffd9d9; font-weight: 700;",
+    "warn": "color: #ffe6ae; font-weight: 700;",
+}
+_ANALYSIS_SHARE_STYLE_DEFAULT = "color: #f0f4ff; font-weight: 600;"
+_LEAK_STYLE_DETECTED = "color: #ff8d8d; font-weight: bold;"
+_LEAK_STYLE_OK = "color: #9be89b;"
+
+
+def _set_style_sheet(widget: QWidget, sheet: str) -> None:
+    """Apply ``sheet`` only if it differs: every setStyleSheet call re-polishes."""
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)
+
+
+# Telemetry (IMU especially) can arrive faster than the screen refreshes. The
+# gauges repaint at most once per interval no matter how many samples land.
+_REPAINT_INTERVAL_MS = 33
+
+
+class _RepaintThrottle:
+    """Rate-limit ``widget.update()``: paint now if idle, else once more at the end of the window."""
+
+    def __init__(self, widget: QWidget, interval_ms: int = _REPAINT_INTERVAL_MS):
+        self._widget = widget
+        self._pending = False
+        self._timer = QTimer(widget)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(int(interval_ms))
+        self._timer.timeout.connect(self._on_timeout)
+
+    def request(self) -> None:
+        if self._timer.isActive():
+            self._pending = True
+            return
+        self._widget.update()
+        self._timer.start()
+
+    def _on_timeout(self) -> None:
+        if self._pending:
+            self._pending = False
+            self._widget.update()
+            self._timer.start()
+
+
+# Read-only stand-in for a missing message; never mutate it.
+_EMPTY: dict = {}
+
+
 def _finite_float(value) -> Optional[float]:
     try:
         numeric = float(value)
@@ -83,51 +141,93 @@ class _Card(QFrame):
 class VerticalGaugeWidget(QWidget):
     """Compact vertical gauge used by the pilot instrument panel."""
 
+    # Paint resources shared by every gauge instead of rebuilt on each paint.
+    _FRAME_PEN = QPen(QColor(42, 42, 50), 1)
+    _FRAME_BRUSH = QColor(22, 22, 27)
+    _TEXT_COLOR = QColor(235, 235, 235)
+    _SUBTEXT_COLOR = QColor(190, 190, 200)
+    _TUBE_PEN = QPen(QColor(70, 70, 84), 1)
+    _TUBE_BRUSH = QColor(12, 12, 16)
+    _TICK_PEN = QPen(QColor(90, 90, 105), 1)
+    _FILL_BRUSH = QColor(90, 134, 255)
+    _MARKER_PEN = QPen(QColor(255, 220, 90), 2)
+
     def __init__(self, *, label: str, unit: str, vmin: float, vmax: float, invert: bool = False, parent=None):
         super().__init__(parent)
         self.label = label
         self.unit = unit
         self.vmin = float(vmin)
         self.vmax = float(vmax)
+        self._inv_span = 1.0 / max(1e-6, self.vmax - self.vmin)
         self.invert = bool(invert)
         self.value: Optional[float] = None
         self.secondary: str = ""
         self.state_text: str = "-"
         self.setMinimumSize(90, 140)
+        # Size-dependent chrome (frame, title, tube, ticks), rebuilt on resize.
+        self._chrome_key: Optional[tuple[int, int, float]] = None
+        self._chrome_pix: Optional[QPixmap] = None
+        self._tube = QRectF()
+        self._repaint = _RepaintThrottle(self)
 
     def set_value(self, value: Optional[float], *, secondary: str = "", state_text: str = ""):
-        self.value = None if value is None else float(value)
-        self.secondary = str(secondary or "")
-        self.state_text = str(state_text or "")
-        self.update()
-
-    def paintEvent(self, _event):  # noqa: N802
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        # Quantize to the 0.01 shown on the gauge (well under a pixel of fill),
+        # so sensor noise below that does not repaint an identical gauge.
+        value = None if value is None else round(float(value), 2)
+        secondary = str(secondary or "")
+        state_text = str(state_text or "")
+        if value == self.value and secondary == self.secondary and state_text == self.state_text:
+            return
+        self.value = value
+        self.secondary = secondary
+        self.state_text = state_text
+        self._repaint.request()
+
+    def _ensure_chrome(self) -> None:
+        key = (self.width(), self.height(), float(self.devicePixelRatioF()))
+        if key == self._chrome_key and self._chrome_pix is not None:
+            return
         r = self.rect().adjusted(6, 6, -6, -6)
+        tube = QRectF(r.left() + r.width() * 0.28, r.top() + 26, r.width() * 0.44, r.height() - 64)
+        self._tube = tube
 
-        p.setPen(QPen(QColor(42, 42, 50), 1))
-        p.setBrush(QColor(22, 22, 27))
+        pix = _new_layer(self)
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.setPen(self._FRAME_PEN)
+        p.setBrush(self._FRAME_BRUSH)
         p.drawRoundedRect(QRectF(r), 10.0, 10.0)
 
-        p.setPen(QColor(235, 235, 235))
+        p.setPen(self._TEXT_COLOR)
         p.drawText(r.adjusted(6, 4, -6, -4), Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter, self.label)
 
-        tube = QRectF(r.left() + r.width() * 0.28, r.top() + 26, r.width() * 0.44, r.height() - 64)
-        p.setBrush(QColor(12, 12, 16))
-        p.setPen(QPen(QColor(70, 70, 84), 1))
+        p.setBrush(self._TUBE_BRUSH)
+        p.setPen(self._TUBE_PEN)
         p.drawRoundedRect(tube, 7.0, 7.0)
 
-        p.setPen(QPen(QColor(90, 90, 105), 1))
+        p.setPen(self._TICK_PEN)
         for i in range(6):
             y = tube.bottom() - (tube.height() * i / 5.0)
             p.drawLine(int(tube.right() + 4), int(y), int(tube.right() + 10), int(y))
+        p.end()
+
+        self._chrome_pix = pix
+        self._chrome_key = key
+
+    def paintEvent(self, _event):  # noqa: N802
+        self._ensure_chrome()
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.drawPixmap(0, 0, self._chrome_pix)
+        r = self.rect().adjusted(6, 6, -6, -6)
+        tube = self._tube
 
         frac = None
-        if self.value is not None and math.isfinite(self.value):
-            span = max(1e-6, self.vmax - self.vmin)
-            frac = (self.value - self.vmin) / span
-            frac = max(0.0, min(1.0, frac))
+        v = self.value
+        # v - v is 0.0 only for finite floats (NaN/inf give NaN).
+        if v is not None and v - v == 0.0:
+            frac = (v - self.vmin) * self._inv_span
+            frac = 0.0 if frac < 0.0 else 1.0 if frac > 1.0 else frac
             if self.invert:
                 frac = 1.0 - frac
 
@@ -135,19 +235,19 @@ class VerticalGaugeWidget(QWidget):
             fill_h = tube.height() * frac
             fill = QRectF(tube.left() + 2, tube.bottom() - fill_h + 2, tube.width() - 4, max(0.0, fill_h - 4))
             p.setPen(Qt.PenStyle.NoPen)
-            p.setBrush(QColor(90, 134, 255))
+            p.setBrush(self._FILL_BRUSH)
             p.drawRoundedRect(fill, 5.0, 5.0)
 
             y = tube.bottom() - tube.height() * frac
-            p.setPen(QPen(QColor(255, 220, 90), 2))
+            p.setPen(self._MARKER_PEN)
             p.drawLine(int(tube.left() - 6), int(y), int(tube.right() + 6), int(y))
 
         vtxt = "-" if self.value is None else f"{self.value:.2f} {self.unit}".strip()
-        p.setPen(QColor(235, 235, 235))
+        p.setPen(self._TEXT_COLOR)
         p.drawText(r.adjusted(4, 0, -4, -20), Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, vtxt)
 
         if self.secondary or self.state_text:
-            p.setPen(QColor(190, 190, 200))
+            p.setPen(self._SUBTEXT_COLOR)
             line = self.secondary if self.secondary else self.state_text
             p.drawText(r.adjusted(4, 0, -4, -4), Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, line)
 
@@ -155,6 +255,16 @@ class VerticalGaugeWidget(QWidget):
 class AttitudeIndicatorWidget(QWidget):
     """Compact artificial-horizon attitude indicator for the pilot page."""
 
+    # Paint resources shared by every indicator instead of rebuilt on each paint.
+    _SKY_COLOR = QColor(46, 92, 142)
+    _GROUND_COLOR = QColor(74, 94, 80)
+    _HORIZON_PEN = QPen(QColor(246, 248, 255), 2)
+    _LADDER_PEN = QPen(QColor(230, 234, 246), 1)
+    _WAITING_COLOR = QColor(160, 168, 190)
+    _TAPE_WAITING_COLOR = QColor(150, 158, 180)
+    _TAPE_TICK_PEN = QPen(QColor(112, 122, 148), 1)
+    _MARKER_PEN = QPen(QColor(245, 220, 104), 2)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.roll_deg: Optional[float] = None
@@ -162,12 +272,39 @@ class AttitudeIndicatorWidget(QWidget):
         self.yaw_deg: Optional[float] = None
         self.setMinimumSize(150, 176)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        # Attitude-independent chrome, rendered once per size: the dial face and
+        # tape background go under the horizon, the wings/bank scale/bezel on top.
+        self._chrome_key: Optional[tuple[int, int, float]] = None
+        self._face_pix: Optional[QPixmap] = None
+        self._overlay_pix: Optional[QPixmap] = None
+        self._dial = QRectF()
+        self._tape = QRectF()
+        self._dial_clip = QPainterPath()
+        self._tape_clip = QPainterPath()
+        self._pitch_px_per_deg = 1.0
+        # (pitch mark, half-width px, whole-pixel half-width, label) per ladder rung.
+        self._ladder: tuple[tuple[int, float, int, str], ...] = ()
+        # Last fully rendered frame, keyed by chrome size + displayed attitude.
+        self._frame_pix: Optional[QPixmap] = None
+        self._frame_key: Optional[tuple] = None
+        self._roll_tr = QTransform()
+        self._roll_key: Optional[tuple[float, float, float]] = None
+        self._repaint = _RepaintThrottle(self)
+
+    def _display_key(self) -> tuple[Optional[float], Optional[float], Optional[float]]:
+        """Attitude quantized to the 0.1 deg the indicator can actually show."""
+        return tuple(None if v is None else round(v, 1) for v in (self.roll_deg, self.pitch_deg, self.yaw_deg))
+
+    def _request_repaint_if_changed(self) -> None:
+        frame_key = self._frame_key
+        if frame_key is None or frame_key[1] != self._display_key():
+            self._repaint.request()
 
     def clear(self) -> None:
         self.roll_deg = None
         self.pitch_deg = None
         self.yaw_deg = None
-        self.update()
+        self._request_repaint_if_changed()
 
     def set_attitude(self, msg: dict | None) -> None:
         msg = msg or {}
@@ -180,11 +317,12 @@ class AttitudeIndicatorWidget(QWidget):
         self.roll_deg = roll if roll is not None else self.roll_deg
         self.pitch_deg = pitch if pitch is not None else self.pitch_deg
         self.yaw_deg = yaw if yaw is not None else self.yaw_deg
-        self.update()
+        self._request_repaint_if_changed()
 
-    def paintEvent(self, _event):  # noqa: N802
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    def _ensure_chrome(self) -> None:
+        key = (self.width(), self.height(), float(self.devicePixelRatioF()))
+        if key == self._chrome_key:
+            return
         bounds = self.rect().adjusted(8, 8, -8, -8)
         heading_h = 36
         dial_bounds = bounds.adjusted(0, 0, 0, -heading_h)
@@ -195,55 +333,45 @@ class AttitudeIndicatorWidget(QWidget):
         cx = dial.center().x()
         cy = dial.center().y()
         radius = dial.width() / 2
+        tape = QRectF(bounds.left() + 10, bounds.bottom() - 30, bounds.width() - 20, 28)
+        self._dial, self._tape = dial, tape
+        self._dial_clip = QPainterPath()
+        self._dial_clip.addEllipse(dial.adjusted(3, 3, -3, -3))
+        self._tape_clip = QPainterPath()
+        self._tape_clip.addRoundedRect(tape.adjusted(2, 2, -2, -2), 6.0, 6.0)
+        self._pitch_px_per_deg = radius / 42.0
+        ladder = []
+        for mark in (-30, -20, -10, 10, 20, 30):
+            half = radius * (0.34 if mark % 20 == 0 else 0.24)
+            ladder.append((mark, half, int(half), str(abs(mark))))
+        self._ladder = tuple(ladder)
 
+        self._face_pix = _new_layer(self)
+        p = QPainter(self._face_pix)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         p.setPen(QPen(QColor(58, 62, 76), 2))
         p.setBrush(QColor(12, 13, 18))
         p.drawEllipse(dial)
+        p.setPen(QPen(QColor(58, 62, 76), 1))
+        p.setBrush(QColor(15, 16, 22))
+        p.drawRoundedRect(tape, 7.0, 7.0)
+        p.end()
 
-        if self.roll_deg is None and self.pitch_deg is None:
-            p.setPen(QColor(160, 168, 190))
-            p.drawText(dial, Qt.AlignmentFlag.AlignCenter, "Attitude\nwaiting")
-            self._draw_heading_tape(p, bounds, None)
-            return
-
-        roll = float(self.roll_deg or 0.0)
-        pitch = max(-45.0, min(45.0, float(self.pitch_deg or 0.0)))
-        pitch_px_per_deg = radius / 42.0
-        horizon_y = pitch * pitch_px_per_deg
-
-        clip = QPainterPath()
-        clip.addEllipse(dial.adjusted(3, 3, -3, -3))
-        p.save()
-        p.setClipPath(clip)
-        p.translate(cx, cy)
-        p.rotate(-roll)
-
-        span = radius * 3.0
-        p.fillRect(QRectF(-span, -span + horizon_y, span * 2, span), QColor(46, 92, 142))
-        p.fillRect(QRectF(-span, horizon_y, span * 2, span), QColor(74, 94, 80))
-        p.setPen(QPen(QColor(246, 248, 255), 2))
-        p.drawLine(int(-span), int(horizon_y), int(span), int(horizon_y))
-
-        p.setPen(QPen(QColor(230, 234, 246), 1))
-        for mark in range(-30, 31, 10):
-            if mark == 0:
-                continue
-            y = horizon_y - (mark * pitch_px_per_deg)
-            half = radius * (0.34 if mark % 20 == 0 else 0.24)
-            p.drawLine(int(-half), int(y), int(half), int(y))
-            label = str(abs(mark))
-            p.drawText(QRectF(-half - 28, y - 8, 22, 16), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
-            p.drawText(QRectF(half + 6, y - 8, 22, 16), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, label)
-
-        p.restore()
-
-        p.setPen(QPen(QColor(245, 220, 104), 2))
+        self._overlay_pix = _new_layer(self)
+        p = QPainter(self._overlay_pix)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.setPen(self._MARKER_PEN)
         wing_y = cy
-        p.drawLine(int(cx - radius * 0.42), int(wing_y), int(cx - radius * 0.12), int(wing_y))
-        p.drawLine(int(cx + radius * 0.12), int(wing_y), int(cx + radius * 0.42), int(wing_y))
-        p.drawLine(int(cx), int(wing_y - radius * 0.08), int(cx), int(wing_y + radius * 0.08))
+        p.drawLines(
+            [
+                QLine(int(cx - radius * 0.42), int(wing_y), int(cx - radius * 0.12), int(wing_y)),
+                QLine(int(cx + radius * 0.12), int(wing_y), int(cx + radius * 0.42), int(wing_y)),
+                QLine(int(cx), int(wing_y - radius * 0.08), int(cx), int(wing_y + radius * 0.08)),
+            ]
+        )
 
         p.setPen(QPen(QColor(210, 216, 232), 1))
+        bank_ticks = []
         for deg in (-60, -45, -30, -20, -10, 0, 10, 20, 30, 45, 60):
             rad = math.radians(deg)
             outer = radius * 0.96
@@ -252,21 +380,89 @@ class AttitudeIndicatorWidget(QWidget):
             y1 = cy - math.cos(rad) * inner
             x2 = cx + math.sin(rad) * outer
             y2 = cy - math.cos(rad) * outer
-            p.drawLine(int(x1), int(y1), int(x2), int(y2))
+            bank_ticks.append(QLine(int(x1), int(y1), int(x2), int(y2)))
+        p.drawLines(bank_ticks)
 
         p.setPen(QPen(QColor(78, 84, 104), 2))
         p.setBrush(Qt.BrushStyle.NoBrush)
         p.drawEllipse(dial)
-        self._draw_heading_tape(p, bounds, self.yaw_deg)
+        p.end()
+        self._chrome_key = key
 
-    def _draw_heading_tape(self, p: QPainter, bounds, yaw: Optional[float]) -> None:
-        tape = QRectF(bounds.left() + 10, bounds.bottom() - 30, bounds.width() - 20, 28)
-        p.setPen(QPen(QColor(58, 62, 76), 1))
-        p.setBrush(QColor(15, 16, 22))
-        p.drawRoundedRect(tape, 7.0, 7.0)
+    def paintEvent(self, _event):  # noqa: N802
+        self._ensure_chrome()
+        key = (self._chrome_key, self._display_key())
+        if key != self._frame_key or self._frame_pix is None:
+            if self._frame_pix is None or self._frame_key is None or self._frame_key[0] != key[0]:
+                self._frame_pix = _new_layer(self)
+            else:
+                self._frame_pix.fill(Qt.GlobalColor.transparent)
+            fp = QPainter(self._frame_pix)
+            self._render(fp)
+            fp.end()
+            self._frame_key = key
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._frame_pix)
+        p.end()
+
+    def _render(self, p: QPainter) -> None:
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.drawPixmap(0, 0, self._face_pix)
+        dial = self._dial
+        cx = dial.center().x()
+        cy = dial.center().y()
+        radius = dial.width() / 2
 
+        if self.roll_deg is None and self.pitch_deg is None:
+            p.setPen(self._WAITING_COLOR)
+            p.drawText(dial, Qt.AlignmentFlag.AlignCenter, "Attitude\nwaiting")
+            self._draw_heading_tape(p, None)
+            return
+
+        roll = float(self.roll_deg or 0.0)
+        pitch = max(-45.0, min(45.0, float(self.pitch_deg or 0.0)))
+        pitch_px_per_deg = self._pitch_px_per_deg
+        horizon_y = pitch * pitch_px_per_deg
+
+        p.setClipPath(self._dial_clip)
+        p.setTransform(self._roll_transform(cx, cy, roll))
+
+        span = radius * 3.0
+        p.fillRect(QRectF(-span, -span + horizon_y, span * 2, span), self._SKY_COLOR)
+        p.fillRect(QRectF(-span, horizon_y, span * 2, span), self._GROUND_COLOR)
+        p.setPen(self._HORIZON_PEN)
+        p.drawLine(int(-span), int(horizon_y), int(span), int(horizon_y))
+
+        p.setPen(self._LADDER_PEN)
+        rungs = []
+        for mark, half, half_px, label in self._ladder:
+            y = horizon_y - (mark * pitch_px_per_deg)
+            rungs.append(QLine(-half_px, int(y), half_px, int(y)))
+            p.drawText(QRectF(-half - 28, y - 8, 22, 16), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+            p.drawText(QRectF(half + 6, y - 8, 22, 16), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, label)
+        p.drawLines(rungs)
+
+        p.resetTransform()
+        p.setClipping(False)
+
+        p.drawPixmap(0, 0, self._overlay_pix)
+        self._draw_heading_tape(p, self.yaw_deg)
+
+    def _roll_transform(self, cx: float, cy: float, roll: float) -> QTransform:
+        """Dial-centred roll rotation, reused while the displayed roll is steady."""
+        key = (cx, cy, round(roll, 1))
+        if key != self._roll_key:
+            tr = QTransform()
+            tr.translate(cx, cy)
+            tr.rotate(-roll)
+            self._roll_tr = tr
+            self._roll_key = key
+        return self._roll_tr
+
+    def _draw_heading_tape(self, p: QPainter, yaw: Optional[float]) -> None:
+        tape = self._tape
         if yaw is None:
-            p.setPen(QColor(150, 158, 180))
+            p.setPen(self._TAPE_WAITING_COLOR)
             p.drawText(tape, Qt.AlignmentFlag.AlignCenter, "deg -")
             return
 
@@ -276,10 +472,9 @@ class AttitudeIndicatorWidget(QWidget):
         nearest = int(round(heading / 30.0) * 30)
 
         p.save()
-        clip = QPainterPath()
-        clip.addRoundedRect(tape.adjusted(2, 2, -2, -2), 6.0, 6.0)
-        p.setClipPath(clip)
-        p.setPen(QPen(QColor(112, 122, 148), 1))
+        p.setClipPath(self._tape_clip)
+        p.setPen(self._TAPE_TICK_PEN)
+        ticks = []
         for mark in range(nearest - 90, nearest + 91, 15):
             normalized = mark % 360
             offset = ((float(mark) - heading + 540.0) % 360.0) - 180.0
@@ -289,13 +484,14 @@ class AttitudeIndicatorWidget(QWidget):
             is_major = normalized % 30 == 0
             y1 = tape.top() + (5 if is_major else 9)
             y2 = tape.top() + 14
-            p.drawLine(int(x), int(y1), int(x), int(y2))
+            ticks.append(QLine(int(x), int(y1), int(x), int(y2)))
             if is_major:
                 text = f"{int(normalized):03d}"
                 p.drawText(QRectF(x - 16, tape.top() + 12, 32, 13), Qt.AlignmentFlag.AlignCenter, text)
+        p.drawLines(ticks)
         p.restore()
 
-        p.setPen(QPen(QColor(245, 220, 104), 2))
+        p.setPen(self._MARKER_PEN)
         p.drawLine(int(center_x), int(tape.top() + 3), int(center_x), int(tape.bottom() - 3))
 
 
@@ -414,12 +610,13 @@ class PilotTelemetryColumn(QWidget):
         layout.addWidget(self.analysis_card, 1)
 
     def update_from_sensor(self, msg: dict) -> None:
-        typ = (msg or {}).get("type")
+        msg = msg or _EMPTY
+        typ = msg.get("type")
         if typ == "attitude":
-            self.attitude_indicator.set_attitude(msg or {})
-            roll = _finite_float((msg or {}).get("roll_deg"))
-            pitch = _finite_float((msg or {}).get("pitch_deg"))
-            yaw = _finite_float((msg or {}).get("yaw_deg"))
+            self.attitude_indicator.set_attitude(msg)
+            roll = _finite_float(msg.get("roll_deg"))
+            pitch = _finite_float(msg.get("pitch_deg"))
+            yaw = _finite_float(msg.get("yaw_deg"))
             parts = [
                 f"roll {roll:.1f}" if roll is not None else "roll -",
                 f"pitch {pitch:.1f}" if pitch is not None else "pitch -",
@@ -429,13 +626,13 @@ class PilotTelemetryColumn(QWidget):
             return
 
         if typ == "external_depth":
-            if (msg or {}).get("error"):
+            if msg.get("error"):
                 self.depth_gauge.set_value(None, state_text="ERR")
-                self.depth_text.setText(str((msg or {}).get("error") or "sensor error"))
+                self.depth_text.setText(str(msg.get("error") or "sensor error"))
                 return
-            depth = _finite_float((msg or {}).get("depth_m"))
-            temp = _finite_float((msg or {}).get("temperature_c"))
-            pressure = _finite_float((msg or {}).get("pressure_mbar"))
+            depth = _finite_float(msg.get("depth_m"))
+            temp = _finite_float(msg.get("temperature_c"))
+            pressure = _finite_float(msg.get("pressure_mbar"))
             self.depth_gauge.set_value(depth, secondary=(f"{temp:.1f} C" if temp is not None else ""))
             parts = []
             if depth is not None:
@@ -450,12 +647,7 @@ class PilotTelemetryColumn(QWidget):
         text = str(text or "Analysis Share: -")
         self.analysis_text.setText(text)
         self.analysis_text.setToolTip(text)
-        if tone == "alert":
-            self.analysis_text.setStyleSheet("color: #ffd9d9; font-weight: 700;")
-        elif tone == "warn":
-            self.analysis_text.setStyleSheet("color: #ffe6ae; font-weight: 700;")
-        else:
-            self.analysis_text.setStyleSheet("color: #f0f4ff; font-weight: 600;")
+        _set_style_sheet(self.analysis_text, _ANALYSIS_SHARE_STYLES.get(tone, _ANALYSIS_SHARE_STYLE_DEFAULT))
 
     def set_gains(self, *, back=None, rov=None, arm=None) -> None:
         if back is not None:
@@ -495,60 +687,86 @@ class InstrumentPanel(QWidget):
         grid.addWidget(self.depth_card, 0, 0)
         grid.addWidget(self.env_card, 0, 1)
 
+        # Message type -> handler; types without an entry (e.g. power) are ignored.
+        self._handlers = {
+            "external_depth": self._on_external_depth,
+            "env": self._on_env,
+            "leak": self._on_leak,
+        }
+        # Latest raw (temperature C, pressure kPa) sample; the temp bar is only
+        # formatted/updated from it on the flush timer, at most ~30 Hz.
+        self._env_state: Optional[tuple[float, Optional[float]]] = None
+        self._env_flush_timer = QTimer(self)
+        self._env_flush_timer.setSingleShot(True)
+        self._env_flush_timer.setInterval(_REPAINT_INTERVAL_MS)
+        self._env_flush_timer.timeout.connect(self._flush_env)
+
     def update_from_sensor(self, msg: dict) -> None:
-        typ = (msg or {}).get("type")
-        if typ == "external_depth":
-            try:
-                if (msg or {}).get("error"):
-                    self.depth_gauge.set_value(None, state_text="ERR")
-                    self.depth_meta.setText(str((msg or {}).get("error")))
-                else:
-                    depth = (msg or {}).get("depth_m")
-                    temp = (msg or {}).get("temperature_c")
-                    pressure = (msg or {}).get("pressure_mbar")
-                    self.depth_gauge.set_value(
-                        None if depth is None else float(depth),
-                        secondary=(f"{float(temp):.1f} C" if temp is not None else ""),
-                    )
-                    meta = []
-                    if pressure is not None:
-                        meta.append(f"{float(pressure):.0f} mbar")
-                    if temp is not None:
-                        meta.append(f"{float(temp):.1f} C")
-                    self.depth_meta.setText(" | ".join(meta) if meta else "-")
-            except Exception:
-                pass
+        if not msg:
             return
+        handler = self._handlers.get(msg.get("type"))
+        if handler is not None:
+            handler(msg)
 
-        if typ == "env":
-            try:
-                temp = (msg or {}).get("temperature_c")
-                p_kpa = (msg or {}).get("pressure_kpa")
-                if temp is not None:
-                    t_f = float(temp)
-                    frac = max(0.0, min(1.0, (t_f + 10.0) / 100.0))
-                    self.temp_bar.setValue(int(round(frac * 1000)))
-                    if p_kpa is None:
-                        self.temp_bar.setFormat(f"Temp: {t_f:.1f} C")
-                    else:
-                        self.temp_bar.setFormat(f"Temp: {t_f:.1f} C  |  {float(p_kpa):.1f} kPa")
-            except Exception:
-                pass
-            return
+    def _on_external_depth(self, msg: dict) -> None:
+        get = msg.get
+        try:
+            error = get("error")
+            if error:
+                self.depth_gauge.set_value(None, state_text="ERR")
+                self.depth_meta.setText(str(error))
+                return
+            depth = get("depth_m")
+            temp = get("temperature_c")
+            pressure = get("pressure_mbar")
+            self.depth_gauge.set_value(
+                None if depth is None else float(depth),
+                secondary=(f"{float(temp):.1f} C" if temp is not None else ""),
+            )
+            meta = []
+            if pressure is not None:
+                meta.append(f"{float(pressure):.0f} mbar")
+            if temp is not None:
+                meta.append(f"{float(temp):.1f} C")
+            self.depth_meta.setText(" | ".join(meta) if meta else "-")
+        except Exception:
+            pass
+
+    def _on_env(self, msg: dict) -> None:
+        get = msg.get
+        try:
+            temp = get("temperature_c")
+            p_kpa = get("pressure_kpa")
+            if temp is not None:
+                self._env_state = (float(temp), None if p_kpa is None else float(p_kpa))
+                if not self._env_flush_timer.isActive():
+                    self._env_flush_timer.start()
+        except Exception:
+            pass
 
-        if typ == "power":
+    def _flush_env(self) -> None:
+        state = self._env_state
+        if state is None:
             return
+        t_f, p_kpa = state
+        frac = max(0.0, min(1.0, (t_f + 10.0) / 100.0))
+        value = int(round(frac * 1000))
+        if value != self.temp_bar.value():
+            self.temp_bar.setValue(value)
+        if p_kpa is None:
+            text = f"Temp: {t_f:.1f} C"
+        else:
+            text = f"Temp: {t_f:.1f} C  |  {p_kpa:.1f} kPa"
+        if text != self.temp_bar.format():
+            self.temp_bar.setFormat(text)
 
-        if typ == "leak":
-            try:
-                leak = bool((msg or {}).get("leak", False))
-                self.leak_lbl.setText("Leak: DETECTED" if leak else "Leak: OK")
-                if leak:
-                    self.leak_lbl.setStyleSheet("color: #ff8d8d; font-weight: bold;")
-                else:
-                    self.leak_lbl.setStyleSheet("color: #9be89b;")
-            except Exception:
-                pass
+    def _on_leak(self, msg: dict) -> None:
+        try:
+            leak = bool(msg.get("leak", False))
+            self.leak_lbl.setText("Leak: DETECTED" if leak else "Leak: OK")
+            _set_style_sheet(self.leak_lbl, _LEAK_STYLE_DETECTED if leak else _LEAK_STYLE_OK)
+        except Exception:
+            pass
 
 
 class HoldTestPanel(QWidget):
@@ -1198,20 +1416,21 @@ class HoldTestPanel(QWidget):
         return " | ".join(parts) if parts else "-"
 
     def update_from_sensor(self, msg: dict) -> None:
-        if (msg or {}).get("type") != "external_depth":
+        msg = msg or _EMPTY
+        if msg.get("type") != "external_depth":
             return
 
         try:
-            sensor = str((msg or {}).get("sensor", "depth"))
-            if (msg or {}).get("error"):
+            sensor = str(msg.get("sensor", "depth"))
+            if msg.get("error"):
                 self.depth_gauge.set_value(None, state_text="ERR")
                 self.depth_readout.setText(f"Depth: {sensor} (ERR)")
-                self.depth_meta.setText(str((msg or {}).get("error")))
+                self.depth_meta.setText(str(msg.get("error")))
                 return
 
-            depth = (msg or {}).get("depth_m")
-            temp = (msg or {}).get("temperature_c")
-            pressure = (msg or {}).get("pressure_mbar")
+            depth = msg.get("depth_m")
+            temp = msg.get("temperature_c")
+            pressure = msg.get("pressure_mbar")
 
             self.depth_gauge.set_value(
                 None if depth is None else float(depth),
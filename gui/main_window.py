@@ -9,15 +9,19 @@ thread.
 from __future__ import annotations
 
 import os
+import functools
 import ipaddress
 import json
 import logging
 import math
 import socket
+import struct
+import subprocess
+import sys
 import threading
 import time
-from collections import deque
-from dataclasses import replace
+from dataclasses import dataclass, replace
+from itertools import islice
 from pathlib import Path
 from threading import Thread as BackgroundThread
 
@@ -75,6 +79,10 @@ from config import (
     TRANSECT_TARGET_BLUE_WIDTH_PERCENT_DEFAULT,
     TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MIN,
     TRANSECT_TARGET_BLUE_WIDTH_PERCENT_MAX,
+    CURRENT_BUDGET_DEFAULT,
+    CURRENT_BUDGET_MAX_A_DEFAULT,
+    CURRENT_BUDGET_MAX_A_MIN,
+    CURRENT_BUDGET_MAX_A_MAX,
 )
 
 from input.pilot_service import PilotPublisherService
@@ -84,7 +92,7 @@ from recording.capture_trace import trace_event
 from recording.stream_recorder import StreamRecorder
 from recording.save_location import DEFAULT_RECORDINGS_DIR, SaveLocation, is_available_directory, resolve_recordings_dir
 from stereo.capture import StereoCaptureSession, default_stereo_session_name, safe_filename_component
-from stereo.pairs import load_stereo_pairs
+from stereo.pairs import stereo_pairs_from_config
 from recording.video_recorder import (
     RECORD_FANOUT_HOST,
     VideoRecorder,
@@ -121,6 +129,246 @@ from tools.analysis_transfer_server import DEFAULT_STABLE_SECONDS, build_index,
 
 logger = logging.getLogger(__name__)
 
+# Hold-status staleness windows, coerced once rather than per pilot frame.
+_DEPTH_STALE_S = float(DEPTH_HOLD_SENSOR_STALE_S)
+_YAW_STALE_S = float(YAW_HOLD_ATTITUDE_STALE_S)
+
+# Route re-query backstop while the RTNETLINK monitor is running.
+_ROUTE_BACKSTOP_S = 30.0
+
+_LINK_STATUS_STYLES = {
+    "OK": "color: #9be89b;",
+    "WARN": "color: #ffd38a;",
+    "LOST": "color: #ff8d8d; font-weight: bold;",
+}
+
+# (threshold, template, decimals shown) for bit rates, largest unit first.
+_BPS_BUCKETS = ((1e9, "%.2fGb/s", 2), (1e6, "%.2fMb/s", 2), (1e3, "%.1fKb/s", 1))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_rate(value: float, template: str) -> str:
+    return template % value
+
+
+def _bps_text(bps: float | None) -> str:
+    # The ROV sends JSON numbers; anything else (missing, string) shows "-".
+    if not isinstance(bps, (int, float)) or bps < 0:
+        return "-"
+    b = bps * 8.0
+    # Raw byte rates almost never repeat, but their displayed value does:
+    # round to the shown precision first so the cache actually hits.
+    for scale, template, decimals in _BPS_BUCKETS:
+        if b >= scale:
+            return _format_rate(round(b / scale, decimals), template)
+    return _format_rate(round(b, 0), "%.0fb/s")
+
+
+# Depth readout templates keyed by which of (pressure, temperature) are present.
+_DEPTH_FMTS = {
+    (False, False): "Depth: {s} {d:.2f}m",
+    (True, False): "Depth: {s} {d:.2f}m {p:.0f}mbar",
+    (False, True): "Depth: {s} {d:.2f}m {t:.1f}C",
+    (True, True): "Depth: {s} {d:.2f}m {p:.0f}mbar {t:.1f}C",
+}
+_POWER_FMT = "Power: {v:.2f}V {a:.2f}A {w:.0f}W{flag}"
+
+
+# The formatters below are pure so the sensor thread can run them and
+# hand the UI a ready-made string (see _queue_sensor_msg_from_thread).
+def _depth_status_text(msg: dict) -> str:
+    """Compact status-bar depth readout for one external_depth message."""
+    sensor = msg.get("sensor", "depth")
+    if msg.get("error"):
+        return f"Depth: {sensor} (ERR)"
+    try:
+        d = msg.get("depth_m", None)
+        if d is None:
+            return f"Depth: {sensor} -"
+        p = msg.get("pressure_mbar", None)
+        t = msg.get("temperature_c", None)
+        return _DEPTH_FMTS[(p is not None, t is not None)].format(
+            s=sensor,
+            d=float(d),
+            p=0.0 if p is None else float(p),
+            t=0.0 if t is None else float(t),
+        )
+    except Exception:
+        return f"Depth: {sensor} -"
+
+
+def _power_status_text(msg: dict) -> str:
+    """Compact status-bar power readout for one power message."""
+    if msg.get("error"):
+        return "Power: (ERR)"
+    try:
+        v = float(msg.get("voltage_v") or 0.0)
+        a = float(msg.get("current_a") or 0.0)
+        pw = msg.get("power_w")
+        w = float(pw) if pw else v * a
+        if msg.get("held", False):
+            flag = " (hold)"
+        else:
+            flag = "" if msg.get("ok", True) else " (check)"
+        return _POWER_FMT.format(v=v, a=a, w=w, flag=flag)
+    except Exception:
+        return "Power: -"
+
+
+def _remote_net_text(remote: dict) -> str:
+    """The ``rov=...`` part of the Net: line for one ROV net message."""
+    rif = remote.get("selected_iface") or remote.get("iface") or "-"
+    rlink = remote.get("link") or _EMPTY
+    rkind = rlink.get("kind") or "-"
+    rstate = rlink.get("state") or "-"
+    rsp = rlink.get("speed_mbps")
+    rsp_s = f"{int(rsp)}Mbps" if isinstance(rsp, (int, float)) and rsp and rsp > 0 else "-"
+    parts = [f"rov={rif}", rkind, rstate, rsp_s]
+    rip = remote.get("ip")
+    if rip:
+        parts.append(f"ip={rip}")
+    rdef_if = remote.get("default_iface")
+    if rdef_if and rdef_if != rif:
+        wifi_s = "/wifi" if remote.get("default_is_wifi") is True else ""
+        rsel_reason = remote.get("selection_reason")
+        reason_s = f", {rsel_reason}" if rsel_reason else ""
+        parts.append(f"(def={rdef_if}{wifi_s}{reason_s})")
+    parts.append("|")
+    parts.append(f"rx={_bps_text(remote.get('rx_bps'))}")
+    parts.append(f"tx={_bps_text(remote.get('tx_bps'))}")
+    return " ".join(parts)
+
+
+_NO_REMOTE_NET_TEXT = "rov=- - - -"
+
+
+def _parse_ip_route_get(out: str) -> tuple:
+    """(dev, src) from one ``ip route get`` line, in a single token pass."""
+    # Example: "192.168.1.4 dev eth0 src 192.168.1.2 uid 1000"
+    iface = src_ip = None
+    tokens = iter(out.split())
+    for tok in tokens:
+        if tok == "dev":
+            iface = next(tokens, None)
+        elif tok == "src":
+            src_ip = next(tokens, None)
+    return iface, src_ip
+
+
+# Sensor-thread pre-formatting by message type; the result rides along in
+# the message copy under "_display" and is popped by the UI-side handler.
+_SENSOR_DISPLAY_TEXT = {
+    "external_depth": _depth_status_text,
+    "net": _remote_net_text,
+    "power": _power_status_text,
+}
+
+
+# Senders identified by sensor name rather than "type", and the message kinds
+# that feed link freshness instead of _last_sensor_ts.
+_SENSOR_NAME_KINDS = {"heartbeat": "heartbeat", "network": "net"}
+_LINK_KINDS = frozenset(("heartbeat", "net"))
+
+# Shared stand-in for absent telemetry sub-dicts. Read-only by convention:
+# never mutate it or store it where it could be mutated.
+_EMPTY: dict = {}
+
+
+@dataclass(frozen=True, slots=True)
+class _NetDiagSnap:
+    """Latest netdiag probe result; replaced whole, never mutated."""
+
+    ts: float = 0.0
+    ok: bool = False
+    last_rtt_ms: float | None = None
+    avg_rtt_ms: float | None = None
+    jitter_ms: float | None = None
+    loss_pct: float | None = None
+    err: str | None = None
+
+
+def _netdiag_probe_text(nd: _NetDiagSnap) -> str | None:
+    """The ``probe:...`` segment of the Net: line, or None with no numbers."""
+    segs = []
+    if isinstance(nd.last_rtt_ms, (int, float)):
+        segs.append(f"rtt={float(nd.last_rtt_ms):.1f}ms")
+    if isinstance(nd.avg_rtt_ms, (int, float)):
+        segs.append(f"avg={float(nd.avg_rtt_ms):.1f}ms")
+    if isinstance(nd.jitter_ms, (int, float)):
+        segs.append(f"jit={float(nd.jitter_ms):.1f}ms")
+    if isinstance(nd.loss_pct, (int, float)):
+        segs.append(f"loss={float(nd.loss_pct):.0f}%")
+    return "probe:" + " ".join(segs) if segs else None
+
+
+class _RttStats:
+    """O(1) netdiag RTT estimator: EMA average/jitter plus a loss bit window."""
+
+    ALPHA = 0.1
+
+    def __init__(self, window: int = 24):
+        self._window = int(window)
+        self._mask = (1 << self._window) - 1
+        self._lost = 0  # bit i set: the i-th most recent probe was lost
+        self._filled = 0
+        self._avg: float | None = None
+        self._jitter: float | None = None
+        self._prev: float | None = None
+
+    def push(self, rtt_ms: float | None) -> None:
+        self._lost = ((self._lost << 1) | (rtt_ms is None)) & self._mask
+        self._filled = min(self._filled + 1, self._window)
+        if rtt_ms is None:
+            return
+        a = self.ALPHA
+        self._avg = rtt_ms if self._avg is None else self._avg + a * (rtt_ms - self._avg)
+        if self._prev is not None:
+            delta = abs(rtt_ms - self._prev)
+            self._jitter = delta if self._jitter is None else self._jitter + a * (delta - self._jitter)
+        self._prev = rtt_ms
+
+    def stats(self) -> tuple:
+        """(avg_ms, jitter_ms, loss_pct); None where undefined."""
+        if not self._filled:
+            return None, None, None
+        loss_pct = 100.0 * self._lost.bit_count() / self._filled
+        return self._avg, self._jitter, loss_pct
+
+
+# Netdiag echo probe cadence, and the slower one used after this many
+# consecutive misses. The idle interval stays under the 2.5 s freshness cut
+# in _update_network_status so the Net: line keeps showing the loss.
+_NETDIAG_INTERVAL_S = 0.5
+_NETDIAG_TIMEOUT_S = 0.20
+_NETDIAG_IDLE_INTERVAL_S = 2.0
+_NETDIAG_IDLE_AFTER = 6
+
+# Kernel receive timestamps keep pilot-side scheduling and GIL delays out of
+# the netdiag RTT. Python does not export SO_TIMESTAMPNS; 35 is the Linux
+# asm-generic value (x86, arm). Other platforms time the echo in user space.
+_SO_TIMESTAMPNS = getattr(socket, "SO_TIMESTAMPNS", 35 if sys.platform.startswith("linux") else None)
+_TIMESPEC = struct.Struct("@ll")  # struct timespec (time_t, long) on Linux
+
+
+def _enable_rx_timestamps(sock: socket.socket) -> int:
+    """Ancillary buffer size for kernel RX timestamps on ``sock``; 0 if unsupported."""
+    if _SO_TIMESTAMPNS is None or not hasattr(sock, "recvmsg_into"):
+        return 0
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMPNS, 1)
+    except OSError:
+        return 0
+    return socket.CMSG_SPACE(_TIMESPEC.size)
+
+
+def _kernel_rx_time(ancdata) -> float | None:
+    """Wall-clock receive time from a SO_TIMESTAMPNS control message, if present."""
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == _SO_TIMESTAMPNS and len(data) >= _TIMESPEC.size:
+            sec, nsec = _TIMESPEC.unpack_from(data)
+            return sec + nsec * 1e-9
+    return None
+
 
 class MainWindow(QMainWindow):
     """Topside control window for live piloting and data logging."""
@@ -129,9 +377,9 @@ class MainWindow(QMainWindow):
 
     # Background services emit through these signals so widgets update on the
     # Qt UI thread.
-    sensor_msg_sig = pyqtSignal(dict)
-    pilot_status_sig = pyqtSignal(dict)
-    pilot_msg_sig = pyqtSignal(dict)
+    sensor_batch_sig = pyqtSignal()  # first message of a new thread-side batch
+    pilot_status_sig = pyqtSignal()  # a newer controller status is pending
+    pilot_msg_sig = pyqtSignal()  # first pilot message of a new batch
     snapshot_result_sig = pyqtSignal(str, str, bool, str)
     stereo_capture_result_sig = pyqtSignal(str, str, bool, str)
     stereo_recording_state_sig = pyqtSignal(bool, str)  # recording, session_dir
@@ -186,14 +434,34 @@ class MainWindow(QMainWindow):
 
     def _set_status(self, lbl: QLabel, text: str) -> None:
         """Set status text + tooltip (so truncated UI still preserves full info)."""
-        try:
-            text = str(text)
-            if lbl.text() == text and lbl.toolTip() == text:
-                return
+        if lbl is None:
+            return
+        text = str(text)
+        key = id(lbl)
+        if self._label_text_cache.get(key) == text:
+            return
+        self._label_text_cache[key] = text
+        lbl.setText(text)
+        lbl.setToolTip(text)
+
+    def _queue_status(self, lbl: QLabel, text: str) -> None:
+        """Stage a high-rate status label update for the next ``_flush_status`` tick."""
+        self._pending_status[id(lbl)] = (lbl, text)
+
+    def _flush_status(self) -> None:
+        """Apply staged status label updates, newest text per label."""
+        if not self._pending_status:
+            return
+        pending = self._pending_status
+        self._pending_status = {}
+        # _set_status inlined: staged entries share its id(lbl) cache key.
+        cache = self._label_text_cache
+        for key, (lbl, text) in pending.items():
+            if lbl is None or cache.get(key) == text:
+                continue
+            cache[key] = text
             lbl.setText(text)
             lbl.setToolTip(text)
-        except Exception:
-            pass
 
     def _set_status_tone(self, lbl: QLabel, tone: str | None = None) -> None:
         try:
@@ -373,14 +641,7 @@ class MainWindow(QMainWindow):
         self._set_status(self._mode_lbl, " | ".join(parts))
         self._set_status_tone(self._mode_lbl, "alert" if self._reverse_enabled else None)
 
-    def _refresh_video_status(self, *, force: bool = True) -> None:
-        if not force:
-            now_mono = time.monotonic()
-            min_interval = max(0.1, float(getattr(self, "_video_status_min_interval_s", 0.5)))
-            last = float(getattr(self, "_video_status_last_refresh_s", 0.0))
-            if now_mono - last < min_interval:
-                return
-            self._video_status_last_refresh_s = now_mono
+    def _refresh_video_status(self) -> None:
         if self.video_panel is None:
             self._set_status(self._video_lbl, "Camera: -")
             self._set_status_tone(self._video_lbl, None)
@@ -1307,6 +1568,8 @@ class MainWindow(QMainWindow):
     def __init__(self, streams_path: str, parent=None):
         super().__init__(parent)
         self.setWindowTitle("TritonPilot")
+        # Last text written by _set_status, per label id.
+        self._label_text_cache: dict[int, str] = {}
         self._settings = QSettings("TritonPilot", "ROVTopside")
         self._preferred_save_dir: str = str(self._settings.value(self.SAVE_DIR_SETTINGS_KEY, "") or "").strip()
         self._save_dir_act: QAction | None = None
@@ -1472,7 +1735,22 @@ class MainWindow(QMainWindow):
         self._net_lbl = QLabel("Net: -")
         self._last_net_ts = 0.0
         self._last_net: dict = {}
+        self._last_net_text = _NO_REMOTE_NET_TEXT
         self._route_cache = {"ts": 0.0, "iface": None, "src_ip": None, "is_wifi": None, "err": None}
+        self._wifi_cache: dict[str, bool] = {}
+        # pyroute2 IPRoute handle for route lookups; False once known unavailable.
+        self._netlink_ipr = None
+        # RTNETLINK monitor socket; while it runs, routes are re-queried only
+        # after a link/address/route event (or every _ROUTE_BACKSTOP_S).
+        self._route_watch = None
+        self._route_dirty = True
+        # Interface index -> name, trusted only while the monitor runs; any
+        # netlink event drops it (an index can be reused by a new link).
+        self._ifname_cache: dict[int, str] = {}
+        # Inputs of the last rendered Net: line (see _update_network_status).
+        self._net_last_key: tuple | None = None
+        # (netdiag snapshot, its rendered probe: segment)
+        self._rtt_part_cache: tuple[_NetDiagSnap, str | None] | None = None
         self._rov_host = str(ROV_HOST)
         self._tether_host = str(TETHER_ROV_HOST or "192.168.1.4")
         self._tether_windows_host = str(TETHER_WINDOWS_HOST or "192.168.1.1")
@@ -1496,9 +1774,9 @@ class MainWindow(QMainWindow):
         self._tether_probe_stop = threading.Event()
         self._netdiag_port = int(os.environ.get("TRITON_NETDIAG_PORT", "7700"))
         self._netdiag_stop = threading.Event()
-        self._netdiag_lock = threading.Lock()
-        self._netdiag = {"ts": 0.0, "ok": False, "last_rtt_ms": None, "avg_rtt_ms": None, "jitter_ms": None, "loss_pct": None, "err": None}
-        self._netdiag_thread = threading.Thread(target=self._netdiag_probe_loop, daemon=True)
+        # Swapped as one reference by the probe thread; readers take it as is.
+        self._netdiag = _NetDiagSnap()
+        self._netdiag_thread = threading.Thread(target=self._netdiag_probe_loop, name="netdiag-probe", daemon=True)
         self._netdiag_thread.start()
         self._tether_probe_thread = threading.Thread(target=self._tether_probe_loop, daemon=True)
         self._tether_probe_thread.start()
@@ -1518,34 +1796,61 @@ class MainWindow(QMainWindow):
         self._set_status_tone(self._tether_banner, "warn")
 
         # Keep the piloting status bar compact and focused on the essentials.
-        for _lbl, _w in [
+        # Tooltips are filled in by the first _set_status write.
+        for _lbl, _w in (
             (self._link_lbl, 230),
             (self._ctrl_lbl, 220),
             (self._gain_lbl, 125),
             (self._mode_lbl, 430),
-        ]:
+        ):
             try:
                 _lbl.setMinimumWidth(int(_w))
-                _lbl.setToolTip(_lbl.text())
                 _lbl.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
             except Exception:
                 pass
 
-        self._video_status_last_refresh_s = 0.0
         self._video_status_min_interval_s = self._env_float(
             "TRITON_VIDEO_STATUS_REFRESH_INTERVAL_S",
-            0.5,
+            1.0,
             min_value=0.1,
             max_value=5.0,
         )
         self._ui_lag_timer: QTimer | None = None
         self._start_ui_lag_probe_if_requested()
 
+        # Telemetry-driven status labels are staged here and written at most
+        # every 100 ms, so bursts of sensor/link updates cost one relayout.
+        self._pending_status: dict[int, tuple[QLabel, str]] = {}
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+        self._status_flush_timer.start(100)
+
+        # The link/net labels are only rebuilt when telemetry arrived since the
+        # last draw, or at least once a second so ages and timeouts still tick.
+        self._link_dirty = True
+        self._last_link_draw = 0.0
         self._link_timer = QTimer(self)
         self._link_timer.timeout.connect(self._update_link_status)
         self._link_timer.start(200)
 
+        # Camera state transitions are pushed (_on_video_stream_state_changed);
+        # this poll only keeps the live frame age current. The timer is the
+        # rate limit, so every tick redraws.
+        self._video_status_timer = QTimer(self)
+        self._video_status_timer.timeout.connect(self._poll_video_status)
+        self._video_status_timer.start(int(self._video_status_min_interval_s * 1000))
+
+        # Net line: remote stats arrive ~1 Hz and the route refresh is 2 s, so
+        # there is nothing for the 5 Hz link tick to add here.
+        self._net_timer = QTimer(self)
+        # Whole-second cadences tolerate Qt's 1 s-granular timer, which lets
+        # the OS batch these wake-ups with others.
+        self._net_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._net_timer.timeout.connect(self._poll_network_status)
+        self._net_timer.start(1000)
+
         self._analysis_transfer_timer = QTimer(self)
+        self._analysis_transfer_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
         self._analysis_transfer_timer.timeout.connect(self._refresh_analysis_transfer_status)
         self._analysis_transfer_timer.start(2000)
 
@@ -1553,10 +1858,19 @@ class MainWindow(QMainWindow):
         self._tether_ui_timer.timeout.connect(self._refresh_tether_status_ui)
         self._tether_ui_timer.start(300)
 
+        # Controller status is latest-wins: the pilot thread parks the newest
+        # one here and only wakes the UI if nothing was pending yet.
+        self._pilot_status_lock = threading.Lock()
+        self._pilot_status_pending: dict | None = None
+        # Pilot messages carry one-shot button edges, so none may be dropped:
+        # they queue in order and one wake signal covers the whole batch.
+        self._pilot_msg_lock = threading.Lock()
+        self._pilot_msg_pending: list[dict] = []
+
         # connect signals to slots
-        self.sensor_msg_sig.connect(self._handle_sensor_msg_on_ui)
-        self.pilot_status_sig.connect(self._handle_pilot_status_on_ui)
-        self.pilot_msg_sig.connect(self._handle_pilot_msg_on_ui)
+        self.sensor_batch_sig.connect(self._wake_sensor_ui)
+        self.pilot_status_sig.connect(self._drain_pilot_status)
+        self.pilot_msg_sig.connect(self._drain_pilot_msgs)
         self.snapshot_result_sig.connect(self._handle_snapshot_result_on_ui)
         self.stereo_capture_result_sig.connect(self._handle_stereo_capture_result_on_ui)
         self.stereo_recording_state_sig.connect(self._handle_stereo_recording_state_on_ui)
@@ -1673,16 +1987,33 @@ class MainWindow(QMainWindow):
             recording_session_provider=lambda: self._make_recording_session_dir()[0]
         )
         self.hold_test_panel.setMinimumWidth(320)
+        # Status-bar side of sensor messages, keyed by "type" (or by the
+        # sensor name for senders listed in _SENSOR_NAME_KINDS).
+        self._sensor_handlers = {
+            "heartbeat": self._on_heartbeat_msg,
+            "net": self._on_net_msg,
+            "autopilot_status": self._on_autopilot_status_msg,
+            "external_depth": self._on_external_depth_msg,
+            "attitude": self._on_attitude_msg,
+            "power": self._on_power_msg,
+        }
         self._sensor_thread_lock = threading.Lock()
+        # Both stages rely on dict insertion order for FIFO handling; a key
+        # that is re-queued keeps its slot and just carries the newer sample.
         self._sensor_thread_pending: dict[tuple[str, str], dict] = {}
-        self._sensor_thread_pending_order: list[tuple[str, str]] = []
         self._sensor_ui_pending: dict[tuple[str, str], dict] = {}
-        self._sensor_ui_pending_order: list[tuple[str, str]] = []
         self._sensor_ui_max_batch = 32
         self._sensor_ui_timer = QTimer(self)
         self._sensor_ui_timer.setInterval(33)  # ~30 Hz UI refresh cap for sensor table/widgets
         self._sensor_ui_timer.timeout.connect(self._flush_sensor_ui)
-        self._sensor_ui_timer.start()
+        # The raw sensor table is read, not watched: keep only the newest sample
+        # per (sensor, type) and refresh it at ~10 Hz. Both timers are armed by
+        # incoming samples, so a quiet sensor link costs no wakeups.
+        self._sensor_panel_pending: dict[tuple[str, str], dict] = {}
+        self._sensor_panel_timer = QTimer(self)
+        self._sensor_panel_timer.setSingleShot(True)
+        self._sensor_panel_timer.setInterval(100)
+        self._sensor_panel_timer.timeout.connect(self._flush_sensor_panel)
         self.sensor_svc = SensorSubscriberService(
             endpoint=SENSOR_SUB_ENDPOINT,
             on_message=self._on_sensor_msg_from_thread,
@@ -1705,7 +2036,7 @@ class MainWindow(QMainWindow):
                 # recording survives a display reconnect.
                 self.cam_mgr.recording_mirror_ports = {}
                 try:
-                    self._stereo_pairs = load_stereo_pairs(streams_path)
+                    self._stereo_pairs = stereo_pairs_from_config(self.cam_mgr.config)
                     self._active_stereo_pair = self._stereo_pairs[0] if self._stereo_pairs else None
                 except Exception as exc:
                     logger.warning("Could not load stereo pairs from %s: %s", streams_path, exc)
@@ -1716,6 +2047,11 @@ class MainWindow(QMainWindow):
                     self.video_panel = VideoTabs(self.cam_mgr, stream_names=stream_names)
                     self._reverse_camera_name = self._select_reverse_stream_name(stream_names)
                     self.video_panel.selectionChanged.connect(self._on_video_tab_changed)
+                    state_sig = getattr(self.video_panel, "streamStateChanged", None)
+                    if state_sig is not None:
+                        state_sig.connect(
+                            self._on_video_stream_state_changed, Qt.ConnectionType.DirectConnection
+                        )
                     self._update_capture_status_label()
                     QTimer.singleShot(1000, self._prewarm_snapshot_capture_feeds)
                 else:
@@ -1777,6 +2113,8 @@ class MainWindow(QMainWindow):
         top_bar_lay.addWidget(self._current_budget_panel, 0)
         top_bar_lay.addWidget(self._tether_top_lbl, 0)
         self._arm_disarm_btn = QPushButton()
+        # (action text, armed, known, shortcut) last applied to the button.
+        self._arm_btn_state: tuple | None = None
         self._arm_disarm_btn.setObjectName("armDisarmButton")
         self._arm_disarm_btn.setMinimumWidth(132)
         self._arm_disarm_btn.clicked.connect(self._toggle_arm_disarm_from_ui)
@@ -2148,6 +2486,12 @@ class MainWindow(QMainWindow):
             return
         action_text, armed, armed_known = self._arm_disarm_button_state()
         shortcut_text = str(self._arm_disarm_shortcut_text or "O").upper()
+        # Called on every heartbeat and link-status redraw; re-polishing the
+        # button restyles it, so only touch it when what it shows changed.
+        state = (action_text, armed, armed_known, shortcut_text)
+        if state == self._arm_btn_state:
+            return
+        self._arm_btn_state = state
         btn.setText(f"{action_text} ({shortcut_text})")
         btn.setToolTip(
             f"Send the ROV arm/disarm toggle. Keyboard shortcut: {shortcut_text}."
@@ -2273,6 +2617,11 @@ class MainWindow(QMainWindow):
     def eventFilter(self, obj, event):
         try:
             et = event.type()
+            if et == QEvent.Type.Show and obj is self.sensor_panel:
+                # Samples held while the table was off screen land on show.
+                if self._sensor_panel_pending and not self._sensor_panel_timer.isActive():
+                    self._sensor_panel_timer.start()
+                return False
             if et in (QEvent.Type.KeyPress, QEvent.Type.KeyRelease):
                 if hasattr(event, "isAutoRepeat") and event.isAutoRepeat():
                     return False
@@ -2374,7 +2723,7 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def _pilot_axis_value(msg: dict, axis_name: str) -> float:
-        axes = (msg or {}).get("axes", {}) or {}
+        axes = (msg or _EMPTY).get("axes") or _EMPTY
         axis_key = str(axis_name or "").strip().lower()
         try:
             return float(axes.get(axis_key, 0.0) or 0.0)
@@ -2382,7 +2731,7 @@ class MainWindow(QMainWindow):
             return 0.0
 
     def _latest_depth_m(self) -> tuple[float | None, bool]:
-        stale = (time.time() - float(self._last_depth_ts)) > float(DEPTH_HOLD_SENSOR_STALE_S)
+        stale = (time.monotonic() - float(self._last_depth_ts)) > _DEPTH_STALE_S
         if (self._last_depth or {}).get("error"):
             return None, True
         depth_m = self._finite_float((self._last_depth or {}).get("depth_m"))
@@ -2399,9 +2748,9 @@ class MainWindow(QMainWindow):
             return "Depth Hold: OFF"
 
         depth_m, stale = self._latest_depth_m()
-        modes = (msg or {}).get("modes", {}) or {}
-        ap = modes.get("autopilot") if isinstance(modes.get("autopilot"), dict) else {}
-        targets = ap.get("targets") if isinstance(ap.get("targets"), dict) else {}
+        modes = (msg or _EMPTY).get("modes") or _EMPTY
+        ap = modes.get("autopilot") if isinstance(modes.get("autopilot"), dict) else _EMPTY
+        targets = ap.get("targets") if isinstance(ap.get("targets"), dict) else _EMPTY
         runtime = self._runtime_depth_hold_status()
         target = self._finite_float(targets.get("depth_m"))
         if target is None:
@@ -2421,7 +2770,7 @@ class MainWindow(QMainWindow):
         return text
 
     def _latest_attitude_yaw_deg(self) -> tuple[float | None, bool]:
-        stale = (time.time() - float(self._last_attitude_ts)) > float(YAW_HOLD_ATTITUDE_STALE_S)
+        stale = (time.monotonic() - float(self._last_attitude_ts)) > _YAW_STALE_S
         if stale:
             return None, True
         yaw = self._finite_float((self._last_attitude or {}).get("yaw_deg"))
@@ -2443,9 +2792,9 @@ class MainWindow(QMainWindow):
         if not yaw_hold:
             return "Yaw Hold: OFF"
         yaw_deg, stale = self._latest_attitude_yaw_deg()
-        modes = (msg or {}).get("modes", {}) or {}
-        ap = modes.get("autopilot") if isinstance(modes.get("autopilot"), dict) else {}
-        targets = ap.get("targets") if isinstance(ap.get("targets"), dict) else {}
+        modes = (msg or _EMPTY).get("modes") or _EMPTY
+        ap = modes.get("autopilot") if isinstance(modes.get("autopilot"), dict) else _EMPTY
+        targets = ap.get("targets") if isinstance(ap.get("targets"), dict) else _EMPTY
         runtime = self._runtime_axis_status("yaw")
         target = self._finite_float(targets.get("yaw_deg"))
         if target is None:
@@ -2507,23 +2856,47 @@ class MainWindow(QMainWindow):
 
 
     def _on_pilot_status_from_thread(self, status: dict):
-        # Called from the pilot publisher thread; marshal to UI thread.
-        self.pilot_status_sig.emit(status)
+        # Called from the pilot publisher thread; a burst of mode toggles
+        # collapses into one UI-side update with the newest status.
+        with self._pilot_status_lock:
+            wake = self._pilot_status_pending is None
+            self._pilot_status_pending = status
+        if wake:
+            self.pilot_status_sig.emit()
+
+    def _drain_pilot_status(self) -> None:
+        with self._pilot_status_lock:
+            status = self._pilot_status_pending
+            self._pilot_status_pending = None
+        if status is not None:
+            self._handle_pilot_status_on_ui(status)
 
     def _on_pilot_msg_from_thread(self, msg: dict):
         # Called from the pilot publisher thread; marshal to UI thread.
         if self._stream_recorder is not None:
             self._stream_recorder.record("pilot", msg)
-        self.pilot_msg_sig.emit(msg)
+        with self._pilot_msg_lock:
+            wake = not self._pilot_msg_pending
+            self._pilot_msg_pending.append(msg)
+        if wake:
+            self.pilot_msg_sig.emit()
+
+    def _drain_pilot_msgs(self) -> None:
+        with self._pilot_msg_lock:
+            pending = self._pilot_msg_pending
+            self._pilot_msg_pending = []
+        for msg in pending:
+            self._handle_pilot_msg_on_ui(msg)
 
     def _handle_pilot_msg_on_ui(self, msg: dict):
+        msg = msg or _EMPTY
         try:
-            self._last_pilot_msg_ts = time.time()
-            self._last_pilot_msg = dict(msg or {})
+            self._last_pilot_msg_ts = time.monotonic()
+            self._last_pilot_msg = dict(msg)
         except Exception:
             pass
         try:
-            edges = (msg or {}).get("edges", {}) or {}
+            edges = msg.get("edges") or _EMPTY
             if str(edges.get("x", "")).strip().lower() == "down":
                 self._capture_from_current_mode()
             if str(edges.get("b", "")).strip().lower() == "down":
@@ -2531,37 +2904,48 @@ class MainWindow(QMainWindow):
         except Exception as exc:
             logger.exception("Snapshot trigger failed: %s", exc)
 
-        # Update mode indicator from locally-transmitted modes.
-        try:
-            modes = (msg or {}).get("modes", {}) or {}
-            dh = bool(modes.get("depth_hold", False))
-            rp_level = bool(modes.get("roll_pitch_level", False))
-            yaw_hold = bool(modes.get("yaw_hold", False))
-            reverse = bool(modes.get("reverse", False))
-            if reverse != self._reverse_enabled:
+        # Update mode indicator from locally-transmitted modes. The hold texts
+        # are built in locals and stored once per frame.
+        try:
+            modes = msg.get("modes") or _EMPTY
+            get = modes.get
+            dh = bool(get("depth_hold", False))
+            rp_level = bool(get("roll_pitch_level", False))
+            yaw_hold = bool(get("yaw_hold", False))
+            reverse = bool(get("reverse", False))
+            reverse_changed = reverse != self._reverse_enabled
+            if reverse_changed:
                 self._reverse_enabled = reverse
                 self._sync_reverse_action()
 
             # Pilot max gain display (Y/A adjusts this topside).
             try:
-                mg = modes.get("max_gain", None)
+                mg = get("max_gain", None)
                 if mg is not None:
-                    cap = modes.get("max_gain_cap", mg)
+                    cap = get("max_gain_cap", mg)
                     self._sync_rov_gain_ui(float(cap))
             except Exception:
                 pass
             self._refresh_gain_indicators_from_modes(modes)
 
-            self._depth_hold_status_text = self._format_depth_hold_status(msg or {}, dh)
-            self._attitude_hold_status_text = "RP Level: ON" if rp_level else "RP Level: OFF"
-            self._yaw_hold_status_text = self._format_yaw_hold_status(msg or {}, yaw_hold)
-
+            # Holds are off for most frames; only engaged holds need the
+            # target/depth/yaw lookups behind the formatters.
+            depth_text = self._format_depth_hold_status(msg, dh) if dh else "Depth Hold: OFF"
+            attitude_text = "RP Level: ON" if rp_level else "RP Level: OFF"
+            yaw_text = self._format_yaw_hold_status(msg, yaw_hold) if yaw_hold else "Yaw Hold: OFF"
         except Exception:
-            self._depth_hold_status_text = "Depth Hold: -"
-            self._attitude_hold_status_text = "RP Level: -"
-            self._yaw_hold_status_text = "Yaw Hold: -"
+            reverse_changed = True
+            depth_text = "Depth Hold: -"
+            attitude_text = "RP Level: -"
+            yaw_text = "Yaw Hold: -"
+        self._depth_hold_status_text = depth_text
+        self._attitude_hold_status_text = attitude_text
+        self._yaw_hold_status_text = yaw_text
         self._refresh_drive_status()
-        self._refresh_video_status()
+        # Reverse is the only pilot-frame input to the camera line; otherwise
+        # the video status timer keeps it current.
+        if reverse_changed:
+            self._refresh_video_status()
 
     def _handle_pilot_status_on_ui(self, status: dict):
         self._last_ctrl_status = status or {'controller': 'unknown'}
@@ -2600,11 +2984,7 @@ class MainWindow(QMainWindow):
                 return bool(svc.is_current_budget_enabled())
             except Exception:
                 pass
-        try:
-            from config import CURRENT_BUDGET_DEFAULT
-            return bool(CURRENT_BUDGET_DEFAULT)
-        except Exception:
-            return True
+        return bool(CURRENT_BUDGET_DEFAULT)
 
     def _on_current_budget_toggled(self, enabled: bool) -> None:
         """Pilot toggled the intelligent current limiter from the top bar."""
@@ -2633,16 +3013,8 @@ class MainWindow(QMainWindow):
             except Exception:
                 value = None
         if value is None:
-            try:
-                from config import (
-                    CURRENT_BUDGET_MAX_A_DEFAULT,
-                    CURRENT_BUDGET_MAX_A_MIN,
-                    CURRENT_BUDGET_MAX_A_MAX,
-                )
-                value = float(CURRENT_BUDGET_MAX_A_DEFAULT)
-                lo, hi = float(CURRENT_BUDGET_MAX_A_MIN), float(CURRENT_BUDGET_MAX_A_MAX)
-            except Exception:
-                value = 22.0
+            value = float(CURRENT_BUDGET_MAX_A_DEFAULT)
+            lo, hi = float(CURRENT_BUDGET_MAX_A_MIN), float(CURRENT_BUDGET_MAX_A_MAX)
         return float(value), float(lo), float(hi)
 
     def _on_current_budget_cap_changed(self, amps: float) -> None:
@@ -2664,8 +3036,8 @@ class MainWindow(QMainWindow):
         if panel is None:
             return
         try:
-            status = ((msg or {}).get("control") or {}).get("status") or {}
-            cb = status.get("current_budget") or {}
+            status = ((msg or _EMPTY).get("control") or _EMPTY).get("status") or _EMPTY
+            cb = status.get("current_budget") or _EMPTY
             if not cb or not cb.get("enabled"):
                 # ROV not running the limiter (disarmed, or config master off).
                 panel.clear_estimate()
@@ -2681,157 +3053,154 @@ class MainWindow(QMainWindow):
             pass
 
     def _handle_sensor_msg_on_ui(self, msg: dict):
-        import time
+        """Apply one sensor message to window state; UI thread only.
+
+        Reached from the _flush_sensor_ui timer, so everything below calls
+        same-thread widgets directly; do not route it through another signal.
+        """
+        msg = msg or _EMPTY
+        self._link_dirty = True
+        # One monotonic stamp per message for every freshness timestamp.
+        now_ts = time.monotonic()
         typ = msg.get("type")
-        if msg.get("sensor") == "heartbeat" or typ == "heartbeat":
-            now_ts = time.time()
-            if self._prev_hb_rx_ts is not None:
-                dt = now_ts - float(self._prev_hb_rx_ts)
-                if 0.05 < dt < 10.0:
-                    if self._hb_period_ema_s is None:
-                        self._hb_period_ema_s = float(dt)
-                    else:
-                        self._hb_period_ema_s = (0.8 * float(self._hb_period_ema_s)) + (0.2 * float(dt))
-            self._prev_hb_rx_ts = now_ts
-            self._last_hb_ts = now_ts
-            self._last_hb = msg
-            if "armed" in msg:
-                try:
-                    armed = bool(msg.get("armed", False))
-                    self.pilot_svc.set_arm_inputs_enabled(armed)
-                    if not armed:
-                        self._snap_arm_control_to_park()
-                except Exception:
-                    pass
-            self._refresh_arm_disarm_button()
-        elif typ == "net" or msg.get("sensor") == "network":
-            self._last_net_ts = time.time()
-            self._last_net = msg
-        else:
-            self._last_sensor_ts = time.time()
-
-            if typ == "autopilot_status":
-                self._last_autopilot_status_ts = time.time()
-                self._last_autopilot_status = dict(msg or {})
-                self._update_current_budget_readout(msg)
-                runtime_depth = self._runtime_depth_hold_status()
-                target = self._finite_float(runtime_depth.get("target_m"))
-                if target is not None:
-                    self._dh_target_m = float(target)
-                runtime_yaw = self._runtime_axis_status("yaw")
-                yaw_target = self._finite_float(runtime_yaw.get("target_deg"))
-                if yaw_target is not None:
-                    self._yh_target_deg = self._wrap_degrees(yaw_target)
-                # Reflect live optical-hold state (NO LOCK / ACTIVE / ...).
-                try:
-                    if self.pilot_svc.is_station_keep_enabled():
-                        self._refresh_drive_status()
-                except Exception:
-                    pass
+        kind = typ if typ == "heartbeat" else _SENSOR_NAME_KINDS.get(msg.get("sensor"), typ)
+        if kind not in _LINK_KINDS:
+            self._last_sensor_ts = now_ts
+        handler = self._sensor_handlers.get(kind)
+        if handler is not None:
+            handler(msg, now_ts)
+        self._queue_sensor_ui_msg(msg)
 
-            # Update a compact depth readout in the status bar.
-            if typ == "external_depth":
-                self._last_depth_ts = time.time()
-                self._last_depth = msg or {}
-                sensor = (msg or {}).get("sensor", "depth")
-                if (msg or {}).get("error"):
-                    self._set_status(self._depth_lbl, f"Depth: {sensor} (ERR)")
-                else:
-                    try:
-                        d = (msg or {}).get("depth_m", None)
-                        p = (msg or {}).get("pressure_mbar", None)
-                        t = (msg or {}).get("temperature_c", None)
-                        if d is None:
-                            self._set_status(self._depth_lbl, f"Depth: {sensor} -")
-                        else:
-                            s = f"Depth: {sensor} {float(d):.2f}m"
-                            if p is not None:
-                                s += f" {float(p):.0f}mbar"
-                            if t is not None:
-                                s += f" {float(t):.1f}C"
-                            self._set_status(self._depth_lbl, s)
-                    except Exception:
-                        self._set_status(self._depth_lbl, f"Depth: {sensor} -")
-
-            if typ == "attitude":
-                yaw = self._finite_float((msg or {}).get("yaw_deg"))
-                if yaw is not None:
-                    self._last_attitude_ts = time.time()
-                    self._last_attitude = dict(msg or {})
-
-            # Update a compact power readout in the status bar.
-            if typ == "power":
-                self._last_power_ts = time.time()
-                self._last_power = msg or {}
-                if (msg or {}).get("error"):
-                    self._set_status(self._power_lbl, "Power: (ERR)")
+    def _on_heartbeat_msg(self, msg: dict, now_ts: float) -> None:
+        if self._prev_hb_rx_ts is not None:
+            dt = now_ts - float(self._prev_hb_rx_ts)
+            if 0.05 < dt < 10.0:
+                if self._hb_period_ema_s is None:
+                    self._hb_period_ema_s = float(dt)
                 else:
-                    try:
-                        v = float((msg or {}).get("voltage_v", 0.0) or 0.0)
-                        a = float((msg or {}).get("current_a", 0.0) or 0.0)
-                        w = float((msg or {}).get("power_w", v * a) or (v * a))
-                        ok = bool((msg or {}).get("ok", True))
-                        held = bool((msg or {}).get("held", False))
-                        s = f"Power: {v:.2f}V {a:.2f}A {w:.0f}W"
-                        if held:
-                            s += " (hold)"
-                        elif not ok:
-                            s += " (check)"
-                        self._set_status(self._power_lbl, s)
-                    except Exception:
-                        self._set_status(self._power_lbl, "Power: -")
+                    self._hb_period_ema_s = (0.8 * float(self._hb_period_ema_s)) + (0.2 * float(dt))
+        self._prev_hb_rx_ts = now_ts
+        self._last_hb_ts = now_ts
+        self._last_hb = msg
+        if "armed" in msg:
+            try:
+                armed = bool(msg.get("armed", False))
+                self.pilot_svc.set_arm_inputs_enabled(armed)
+                if not armed:
+                    self._snap_arm_control_to_park()
+            except Exception:
+                pass
+        self._refresh_arm_disarm_button()
 
-        self._queue_sensor_ui_msg(msg)
+    def _on_net_msg(self, msg: dict, now_ts: float) -> None:
+        self._last_net_ts = now_ts
+        self._last_net_text = msg.pop("_display", None) or _remote_net_text(msg)
+        self._last_net = msg
+
+    def _on_autopilot_status_msg(self, msg: dict, now_ts: float) -> None:
+        self._last_autopilot_status_ts = now_ts
+        self._last_autopilot_status = dict(msg)
+        self._update_current_budget_readout(msg)
+        runtime_depth = self._runtime_depth_hold_status()
+        target = self._finite_float(runtime_depth.get("target_m"))
+        if target is not None:
+            self._dh_target_m = float(target)
+        runtime_yaw = self._runtime_axis_status("yaw")
+        yaw_target = self._finite_float(runtime_yaw.get("target_deg"))
+        if yaw_target is not None:
+            self._yh_target_deg = self._wrap_degrees(yaw_target)
+        # Reflect live optical-hold state (NO LOCK / ACTIVE / ...).
+        try:
+            if self.pilot_svc.is_station_keep_enabled():
+                self._refresh_drive_status()
+        except Exception:
+            pass
+
+    def _on_external_depth_msg(self, msg: dict, now_ts: float) -> None:
+        # Update a compact depth readout in the status bar.
+        text = msg.pop("_display", None) or _depth_status_text(msg)
+        self._last_depth_ts = now_ts
+        self._last_depth = msg
+        self._queue_status(self._depth_lbl, text)
+
+    def _on_attitude_msg(self, msg: dict, now_ts: float) -> None:
+        yaw = self._finite_float(msg.get("yaw_deg"))
+        if yaw is not None:
+            self._last_attitude_ts = now_ts
+            self._last_attitude = dict(msg)
+
+    def _on_power_msg(self, msg: dict, now_ts: float) -> None:
+        # Update a compact power readout in the status bar.
+        text = msg.pop("_display", None) or _power_status_text(msg)
+        self._last_power_ts = now_ts
+        self._last_power = msg
+        self._queue_status(self._power_lbl, text)
 
     def _queue_sensor_ui_msg(self, msg: dict) -> None:
         try:
-            sensor = str((msg or {}).get("sensor", "unknown"))
-            typ = str((msg or {}).get("type", "-"))
-            key = (sensor, typ)
-            if key not in self._sensor_ui_pending:
-                self._sensor_ui_pending_order.append(key)
-            self._sensor_ui_pending[key] = dict(msg or {})
+            # Stored by reference: dispatched sensor messages are read-only
+            # from here on (see SensorSubscriberService).
+            if not isinstance(msg, dict):
+                msg = {}
+            key = (str(msg.get("sensor", "unknown")), str(msg.get("type", "-")))
+            self._sensor_ui_pending[key] = msg
+            self._wake_sensor_ui()
         except Exception:
             pass
 
     def _queue_sensor_msg_from_thread(self, msg: dict) -> None:
         """Coalesce telemetry before it becomes Qt UI work."""
         try:
-            sensor = str((msg or {}).get("sensor", "unknown"))
-            typ = str((msg or {}).get("type", "-"))
+            payload = dict(msg or _EMPTY)
+            sensor = str(payload.get("sensor", "unknown"))
+            typ = str(payload.get("type", "-"))
             key = (sensor, typ)
-            payload = dict(msg or {})
+            # Same routing as _handle_sensor_msg_on_ui, so the text always
+            # matches the handler that pops it.
+            kind = typ if typ == "heartbeat" else _SENSOR_NAME_KINDS.get(sensor, typ)
+            fmt = _SENSOR_DISPLAY_TEXT.get(kind)
+            if fmt is not None:
+                payload["_display"] = fmt(payload)
             with self._sensor_thread_lock:
-                if key not in self._sensor_thread_pending:
-                    self._sensor_thread_pending_order.append(key)
+                wake = not self._sensor_thread_pending
                 self._sensor_thread_pending[key] = payload
+            # One queued event per batch rather than per message; the UI
+            # timer picks up everything that lands before it fires.
+            if wake:
+                self.sensor_batch_sig.emit()
         except Exception:
             pass
 
+    def _wake_sensor_ui(self) -> None:
+        if not self._sensor_ui_timer.isActive():
+            self._sensor_ui_timer.start()
+
     def _drain_sensor_thread_msgs(self) -> None:
         try:
+            # Swap the pending dict out under the lock; the sensor thread
+            # starts filling a fresh one while this batch is handled.
             with self._sensor_thread_lock:
-                order = list(self._sensor_thread_pending_order)
-                pending = dict(self._sensor_thread_pending)
-                self._sensor_thread_pending_order.clear()
-                self._sensor_thread_pending.clear()
+                pending = self._sensor_thread_pending
+                if not pending:
+                    return
+                self._sensor_thread_pending = {}
         except Exception:
             return
-        for key in order:
-            msg = pending.get(key)
-            if isinstance(msg, dict):
-                self._handle_sensor_msg_on_ui(msg)
+        for msg in pending.values():
+            self._handle_sensor_msg_on_ui(msg)
 
     def _flush_sensor_ui(self) -> None:
         """Apply coalesced sensor updates to UI widgets at a bounded rate."""
         try:
             self._drain_sensor_thread_msgs()
-            n = 0
-            while self._sensor_ui_pending_order and n < int(self._sensor_ui_max_batch):
-                key = self._sensor_ui_pending_order.pop(0)
-                msg = self._sensor_ui_pending.pop(key, None)
-                if not isinstance(msg, dict):
-                    continue
+            pending = self._sensor_ui_pending
+            cap = int(self._sensor_ui_max_batch)
+            if len(pending) <= cap:
+                batch = pending
+                self._sensor_ui_pending = {}
+            else:
+                batch = {key: pending.pop(key) for key in list(islice(pending, cap))}
+            for key, msg in batch.items():
                 try:
                     self.pilot_telemetry_column.update_from_sensor(msg)
                 except Exception:
@@ -2848,17 +3217,36 @@ class MainWindow(QMainWindow):
                     self.raw_sensor_page.update_from_sensor(msg)
                 except Exception:
                     pass
-                try:
-                    self.sensor_panel.upsert_sensor(msg)
-                except Exception:
-                    pass
-                n += 1
+                self._sensor_panel_pending[key] = msg
+            if self._sensor_panel_pending and not self._sensor_panel_timer.isActive():
+                self._sensor_panel_timer.start()
+            # Idle until the sensor thread signals the next batch.
+            if not self._sensor_ui_pending and not self._sensor_thread_pending:
+                self._sensor_ui_timer.stop()
+        except Exception:
+            pass
+
+    def _flush_sensor_panel(self) -> None:
+        if not self._sensor_panel_pending:
+            return
+        # The table is only laid out when video is unavailable; while it is
+        # not on screen keep the newest sample per key. eventFilter re-arms the
+        # timer when it is shown again.
+        if not self.sensor_panel.isVisible():
+            return
+        pending = self._sensor_panel_pending
+        self._sensor_panel_pending = {}
+        try:
+            self.sensor_panel.upsert_sensor_batch(pending.values())
         except Exception:
             pass
 
     def _update_link_status(self):
-        import time
-        now = time.time()
+        now = time.monotonic()
+        if not self._link_dirty and (now - self._last_link_draw) < 1.0:
+            return
+        self._link_dirty = False
+        self._last_link_draw = now
 
         # Prefer heartbeat if present, fall back to any sensor traffic.
         hb_age = None
@@ -2873,10 +3261,11 @@ class MainWindow(QMainWindow):
         # OK/WARN even when the link is healthy. Use a cadence-aware threshold +
         # light hysteresis to avoid false UI flicker.
         age = hb_age if hb_age is not None else sensor_age
-        if self._hb_period_ema_s is None:
+        hb_ema = self._hb_period_ema_s
+        if hb_ema is None:
             hb_period = 1.0
         else:
-            hb_period = max(0.2, min(5.0, float(self._hb_period_ema_s)))
+            hb_period = max(0.2, min(5.0, float(hb_ema)))
 
         ok_th = max(0.9, 1.35 * hb_period)
         warn_th = max(2.5, 3.25 * hb_period)
@@ -2915,15 +3304,16 @@ class MainWindow(QMainWindow):
 
         parts = [f"Heartbeat: {status}"]
         if hb_age is not None:
-            armed = bool(self._last_hb.get("armed", False))
-            pilot_age = self._last_hb.get("pilot_age", None)
+            hb = self._last_hb
+            armed = bool(hb.get("armed", False))
+            pilot_age = hb.get("pilot_age", None)
             if pilot_age is not None:
                 try:
                     parts.append(f"pilot_age={float(pilot_age):.2f}s")
                 except Exception:
                     parts.append(f"pilot_age={pilot_age}")
-            if self._hb_period_ema_s is not None:
-                parts.append(f"hb~{(1.0/max(1e-3,float(self._hb_period_ema_s))):.1f}Hz")
+            if hb_ema is not None:
+                parts.append(f"hb~{(1.0/max(1e-3,float(hb_ema))):.1f}Hz")
             parts.append("ARMED" if armed else "disarmed")
             try:
                 arm_pitch, arm_wrist = self.pilot_svc.arm_position()
@@ -2937,19 +3327,17 @@ class MainWindow(QMainWindow):
         else:
             parts.append(f"host={self._rov_host}")
 
-        self._set_status(self._link_lbl, " | ".join(parts))
+        self._queue_status(self._link_lbl, " | ".join(parts))
         self._refresh_arm_disarm_button()
-        try:
-            if status == "OK":
-                self._link_lbl.setStyleSheet("color: #9be89b;")
-            elif status == "WARN":
-                self._link_lbl.setStyleSheet("color: #ffd38a;")
-            elif status == "LOST":
-                self._link_lbl.setStyleSheet("color: #ff8d8d; font-weight: bold;")
-            else:
-                self._link_lbl.setStyleSheet("")
-        except Exception:
-            pass
+        # setStyleSheet re-polishes the label even for the same sheet; only
+        # restyle on an OK/WARN/LOST transition.
+        if status != prev:
+            try:
+                self._link_lbl.setStyleSheet(_LINK_STATUS_STYLES.get(status, ""))
+            except Exception:
+                pass
+            # The camera line reports ROV link loss too.
+            self._refresh_video_status()
 
         # Controller freshness indicator: the controller can appear "connected"
         # but the publisher thread may be wedged or no pilot frames may be making
@@ -2969,81 +3357,120 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _poll_network_status(self) -> None:
+        # Slot boundary only: an exception escaping a PyQt slot aborts the app.
+        # Expected route-probe failures are handled in _refresh_route_cache.
         try:
-            self._refresh_video_status(force=False)
+            self._update_network_status()
         except Exception:
-            self._set_status(self._video_lbl, "Camera: -")
+            logger.debug("network status update failed", exc_info=True)
+
+    def _on_video_stream_state_changed(self, name: str, _state: str) -> None:
+        # Connect/play/stall transitions are pushed; the poll only ticks ages.
+        panel = self.video_panel
+        if panel is not None and name == panel.current_stream_name():
+            self._refresh_video_status()
 
-        # Network indicator (lightweight; throttled internally)
+    def _poll_video_status(self) -> None:
         try:
-            self._update_network_status()
+            self._refresh_video_status()
         except Exception:
-            pass
+            self._set_status(self._video_lbl, "Camera: -")
 
     def _update_netdiag_snapshot(self, **kwargs) -> None:
-        try:
-            with self._netdiag_lock:
-                cur = dict(self._netdiag)
-                cur.update(kwargs)
-                self._netdiag = cur
-        except Exception:
-            pass
+        # Only the probe thread writes, so building from the current snapshot
+        # and rebinding needs no lock.
+        self._netdiag = replace(self._netdiag, **kwargs)
 
     def _netdiag_probe_loop(self) -> None:
         """Low-overhead UDP echo probe to estimate RTT/jitter/loss to the ROV."""
-        hist = deque(maxlen=24)  # RTTs in ms, or None on timeout/loss
+        hist = _RttStats(24)
+        # Echoes are a few dozen bytes; receive them into one reused buffer.
+        rx = bytearray(256)
+        rx_bufs = [rx]
+        ts_space = 0
         seq = 0
+        misses = 0
         sock = None
         while not self._netdiag_stop.is_set():
-            t_cycle = time.time()
+            t_cycle = time.monotonic()
             try:
                 if sock is None:
                     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                    sock.settimeout(0.20)
+                    sock.settimeout(_NETDIAG_TIMEOUT_S)
                     try:
                         sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0xB8)
                     except Exception:
                         pass
-                t0 = time.time()
-                payload = f"{t0:.6f}|{seq}".encode("ascii")
+                    ts_space = _enable_rx_timestamps(sock)
+                    # Connected: the route is resolved once, send/recv skip
+                    # the address, and only the ROV's replies are delivered.
+                    sock.connect((self._rov_host, int(self._netdiag_port)))
+                t0 = time.monotonic()
+                t0_wall = time.time()
+                # Same "<ts>|<seq>" ASCII payload as tools/netdiag_client.py,
+                # built straight into bytes.
+                payload = b"%.6f|%d" % (t0_wall, seq)
+                tail = b"|%d" % seq
                 seq += 1
-                sock.sendto(payload, (self._rov_host, int(self._netdiag_port)))
-                data, _ = sock.recvfrom(4096)
-                t1 = time.time()
-                if not data:
-                    raise RuntimeError("empty")
-                rtt_ms = (t1 - t0) * 1000.0
-                hist.append(rtt_ms)
-                vals = [v for v in hist if isinstance(v, (int, float))]
-                loss_pct = (100.0 * (len(hist) - len(vals)) / len(hist)) if hist else 0.0
-                avg = (sum(vals) / len(vals)) if vals else None
-                if len(vals) >= 2:
-                    diffs = [abs(vals[i] - vals[i - 1]) for i in range(1, len(vals))]
-                    jitter = (sum(diffs) / len(diffs)) if diffs else 0.0
-                else:
-                    jitter = None
+                sock.send(payload)
+                # The socket outlives timeouts, so a late echo of an earlier
+                # probe can still be queued; skip anything not ending in this
+                # probe's seq until the timeout runs out.
+                deadline = t0 + _NETDIAG_TIMEOUT_S
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("timed out")
+                    sock.settimeout(remaining)
+                    if ts_space:
+                        n, ancdata, _flags, _addr = sock.recvmsg_into(rx_bufs, ts_space)
+                    else:
+                        n, ancdata = sock.recv_into(rx), ()
+                    if not n:
+                        raise RuntimeError("empty")
+                    if rx.endswith(tail, 0, n):
+                        break
+                t1 = time.monotonic()
+                rtt_s = t1 - t0
+                # The kernel stamp is wall clock; trust it only inside the
+                # user-space window so a clock step cannot skew the sample.
+                rx_wall = _kernel_rx_time(ancdata)
+                if rx_wall is not None and 0.0 <= rx_wall - t0_wall <= rtt_s:
+                    rtt_s = rx_wall - t0_wall
+                rtt_ms = rtt_s * 1000.0
+                misses = 0
+                hist.push(rtt_ms)
+                avg, jitter, loss_pct = hist.stats()
                 self._update_netdiag_snapshot(
                     ts=t1,
                     ok=True,
                     err=None,
                     last_rtt_ms=float(rtt_ms),
-                    avg_rtt_ms=(None if avg is None else float(avg)),
-                    jitter_ms=(None if jitter is None else float(jitter)),
-                    loss_pct=float(loss_pct),
+                    avg_rtt_ms=avg,
+                    jitter_ms=jitter,
+                    loss_pct=loss_pct,
                 )
             except Exception as e:
-                hist.append(None)
-                vals = [v for v in hist if isinstance(v, (int, float))]
-                loss_pct = (100.0 * (len(hist) - len(vals)) / len(hist)) if hist else None
-                self._update_netdiag_snapshot(ts=time.time(), ok=False, err=str(e), loss_pct=loss_pct)
-                try:
-                    if sock is not None:
-                        sock.close()
-                except Exception:
-                    pass
-                sock = None
+                misses += 1
+                hist.push(None)
+                loss_pct = hist.stats()[2]
+                self._update_netdiag_snapshot(ts=time.monotonic(), ok=False, err=str(e), loss_pct=loss_pct)
+                # A timeout, an empty echo, or ICMP port-unreachable surfacing
+                # as a refused/reset connection leaves the socket usable; any
+                # other error reopens it on the next cycle.
+                if not isinstance(e, (TimeoutError, ConnectionError, RuntimeError)):
+                    try:
+                        if sock is not None:
+                            sock.close()
+                    except Exception:
+                        pass
+                    sock = None
 
-            sleep_s = 0.5 - (time.time() - t_cycle)
+            # Nobody answering (ROV off, or no netdiag server): stop waking
+            # every 500 ms until an echo comes back.
+            interval = _NETDIAG_IDLE_INTERVAL_S if misses >= _NETDIAG_IDLE_AFTER else _NETDIAG_INTERVAL_S
+            sleep_s = interval - (time.monotonic() - t_cycle)
             if sleep_s > 0:
                 self._netdiag_stop.wait(sleep_s)
 
@@ -3053,13 +3480,6 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _get_netdiag_snapshot(self) -> dict:
-        try:
-            with self._netdiag_lock:
-                return dict(self._netdiag)
-        except Exception:
-            return {}
-
     def _tether_prefix(self) -> str:
         parts = str(self._tether_host or "").split(".")
         if len(parts) >= 3:
@@ -3112,7 +3532,7 @@ class MainWindow(QMainWindow):
                 pass
 
     def _probe_tether_once(self) -> dict:
-        now = time.time()
+        now = time.monotonic()
         snapshot = {
             "ts": now,
             "ready": False,
@@ -3189,7 +3609,7 @@ class MainWindow(QMainWindow):
             except Exception as exc:
                 self._set_tether_status_snapshot(
                     {
-                        "ts": time.time(),
+                        "ts": time.monotonic(),
                         "ready": False,
                         "host": self._tether_host,
                         "local_ip": None,
@@ -3276,156 +3696,187 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("TETHER NETWORK UNREACHABLE - video waits for the tether", 7000)
 
     def _iface_is_wifi_linux(self, iface: str) -> bool:
-        try:
-            import os
-
-            return os.path.isdir(f"/sys/class/net/{iface}/wireless")
+        iface = str(iface)
+        cached = self._wifi_cache.get(iface)
+        if cached is not None:
+            return cached
+        # A miss means the route moved to another interface: drop the old
+        # answers so a re-plugged adapter is stat'ed afresh when it returns.
+        self._wifi_cache.clear()
+        try:
+            cached = os.path.isdir(f"/sys/class/net/{iface}/wireless")
         except Exception:
             # name heuristic fallback
-            return iface.startswith("wl") or iface.startswith("wlan")
+            cached = iface.startswith("wl") or iface.startswith("wlan")
+        self._wifi_cache[iface] = cached
+        return cached
 
     def _refresh_route_cache(self):
         """Determine which local interface is used to reach the ROV host."""
-        import time
-        now = time.time()
+        now = time.monotonic()
+        self._route_dirty = False
         self._route_cache = {"ts": now, "iface": None, "src_ip": None, "is_wifi": None, "err": None}
 
-        # Prefer Linux 'ip route get' for accurate dev+src.
-        try:
-            import subprocess
+        # Prefer an in-process RTNETLINK query (pyroute2, Linux only) so the
+        # periodic refresh does not fork `ip` every couple of seconds.
+        if self._route_cache_from_netlink():
+            return
 
+        # Then Linux 'ip route get' for accurate dev+src.
+        try:
             out = subprocess.check_output(
                 ["ip", "route", "get", self._rov_host],
                 timeout=0.75,
                 stderr=subprocess.DEVNULL,
                 text=True,
             ).strip()
-            # Example: "192.168.1.4 dev eth0 src 192.168.1.2 uid 1000"
-            parts = out.split()
-            if "dev" in parts:
-                i = parts.index("dev")
-                if i + 1 < len(parts):
-                    self._route_cache["iface"] = parts[i + 1]
-            if "src" in parts:
-                i = parts.index("src")
-                if i + 1 < len(parts):
-                    self._route_cache["src_ip"] = parts[i + 1]
-            iface = self._route_cache.get("iface")
+        except (OSError, subprocess.SubprocessError) as e:
+            # No `ip` binary (Windows), timeout, or no route to the host.
+            logger.debug("ip route get %s failed: %s", self._rov_host, e)
+            self._route_cache["err"] = str(e)
+        else:
+            iface, self._route_cache["src_ip"] = _parse_ip_route_get(out)
+            self._route_cache["iface"] = iface
             if iface:
                 self._route_cache["is_wifi"] = bool(self._iface_is_wifi_linux(str(iface)))
             return
-        except Exception as e:
-            self._route_cache["err"] = str(e)
 
         # Fallback: UDP connect trick to get the chosen source IP (iface unknown).
         try:
-            import socket
-
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect((self._rov_host, 9))
-            self._route_cache["src_ip"] = s.getsockname()[0]
-            s.close()
-        except Exception as e:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect((self._rov_host, 9))
+                self._route_cache["src_ip"] = s.getsockname()[0]
+        except OSError as e:
+            logger.debug("route source lookup for %s failed: %s", self._rov_host, e)
             self._route_cache["err"] = str(e)
 
-    def _fmt_bps(self, bps: float | None) -> str:
-        if bps is None:
-            return "-"
+    def _route_cache_from_netlink(self) -> bool:
+        """Fill ``_route_cache`` via pyroute2's RTM_GETROUTE; False if unavailable."""
+        ipr = self._netlink_ipr
+        if ipr is False:
+            return False
         try:
-            b = float(bps) * 8.0
+            if ipr is None:
+                from pyroute2 import IPRoute
+
+                ipr = IPRoute()
+                self._netlink_ipr = ipr
+                threading.Thread(target=self._route_watch_loop, name="route-watch", daemon=True).start()
+            routes = ipr.route("get", dst=self._rov_host)
+            if not routes:
+                return False
+            route = routes[0]
+            oif = route.get_attr("RTA_OIF")
+            if oif is not None:
+                name = self._ifname_cache.get(oif) if self._route_watch is not None else None
+                if name is None:
+                    links = ipr.get_links(oif)
+                    if links:
+                        name = links[0].get_attr("IFLA_IFNAME")
+                        if name:
+                            self._ifname_cache[oif] = name
+                self._route_cache["iface"] = name
+            self._route_cache["src_ip"] = route.get_attr("RTA_PREFSRC")
+        except ImportError:
+            # Not installed (or not Linux): don't retry the import every refresh.
+            self._netlink_ipr = False
+            return False
         except Exception:
-            return "-"
-        if b < 0:
-            return "-"
-        if b >= 1e9:
-            return f"{b/1e9:.2f}Gb/s"
-        if b >= 1e6:
-            return f"{b/1e6:.2f}Mb/s"
-        if b >= 1e3:
-            return f"{b/1e3:.1f}Kb/s"
-        return f"{b:.0f}b/s"
+            return False
+        iface = self._route_cache.get("iface")
+        if iface:
+            self._route_cache["is_wifi"] = bool(self._iface_is_wifi_linux(str(iface)))
+        return True
 
-    def _update_network_status(self):
-        import time
+    def _route_watch_loop(self) -> None:
+        """Mark the route cache dirty on RTNETLINK link/address/route changes."""
+        try:
+            from pyroute2 import IPRoute
+            from pyroute2.netlink.rtnl import RTMGRP_IPV4_IFADDR, RTMGRP_IPV4_ROUTE, RTMGRP_LINK
 
-        now = time.time()
-        # Refresh local route info at most every 2 seconds to avoid frequent subprocess calls.
-        if now - float(self._route_cache.get("ts", 0.0)) > 2.0:
+            mon = IPRoute()
+            mon.bind(groups=RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV4_ROUTE)
+        except Exception:
+            return  # keep polling every 2 s
+        self._route_watch = mon
+        self._ifname_cache = {}
+        self._wifi_cache = {}
+        self._route_dirty = True
+        try:
+            while self._route_watch is mon:
+                if mon.get():
+                    # A link event may be an adapter swapped under the same
+                    # name, so the per-interface answers are re-derived too.
+                    self._ifname_cache = {}
+                    self._wifi_cache = {}
+                    self._route_dirty = True
+        except Exception:
+            pass  # socket closed on shutdown
+        finally:
+            try:
+                mon.close()
+            except Exception:
+                pass
+
+    def _route_cache_stale(self, now: float) -> bool:
+        age = now - float(self._route_cache.get("ts", 0.0))
+        if age <= 2.0:
+            return False
+        if self._route_watch is None:
+            return True
+        return self._route_dirty or age > _ROUTE_BACKSTOP_S
+
+    def _update_network_status(self):
+        now = time.monotonic()
+        # Refresh local route info at most every 2 seconds, and with a netlink
+        # monitor running only once something actually changed.
+        if self._route_cache_stale(now):
             self._refresh_route_cache()
 
+        # Optional RTT/jitter/loss probe (ROV netdiag UDP echo).
+        nd = self._netdiag
+        nd_age = now - nd.ts if nd.ts else None
+
+        # Everything below derives from these inputs; skip the rebuild if none
+        # moved (including the freshness cut-offs) since the last draw.
+        remote_fresh = (now - self._last_net_ts) < 3.0
+        nd_fresh = nd_age is not None and nd_age < 2.5
+        key = (self._last_net_ts, self._route_cache.get("ts"), nd.ts, remote_fresh, nd_fresh)
+        if key == self._net_last_key:
+            return
+        self._net_last_key = key
+
         local_iface = self._route_cache.get("iface")
         local_ip = self._route_cache.get("src_ip")
         local_wifi = self._route_cache.get("is_wifi")
 
-        # Remote (ROV) network telemetry
-        remote = self._last_net if (now - self._last_net_ts) < 3.0 else None
-        if remote and isinstance(remote, dict):
-            rif = remote.get("selected_iface") or remote.get("iface") or "-"
-            rdef_if = remote.get("default_iface") or None
-            rsel_reason = remote.get("selection_reason") or None
-            rlink = remote.get("link") or {}
-            rkind = rlink.get("kind") or "-"
-            rstate = rlink.get("state") or "-"
-            rsp = rlink.get("speed_mbps")
-            rsp_s = f"{int(rsp)}Mbps" if isinstance(rsp, (int, float)) and rsp and rsp > 0 else "-"
+        # Remote (ROV) network telemetry, formatted when the message arrived.
+        remote = self._last_net if remote_fresh else None
+        if remote:
+            rov_s = self._last_net_text
             rtether = bool(remote.get("is_tether"))
-            rdef_wifi = remote.get("default_is_wifi")
-            rx_s = self._fmt_bps(remote.get("rx_bps"))
-            tx_s = self._fmt_bps(remote.get("tx_bps"))
         else:
-            rif = rkind = rstate = rsp_s = rx_s = tx_s = "-"
-            rdef_if = None
-            rsel_reason = None
-            rdef_wifi = None
+            rov_s = _NO_REMOTE_NET_TEXT
             rtether = False
 
         # Compose status
-        local_part = "local="
         if local_iface:
-            local_part += str(local_iface)
-            if local_wifi is True:
-                local_part += "(wifi)"
+            local_s = f"{local_iface}(wifi)" if local_wifi is True else str(local_iface)
         elif local_ip:
-            local_part += str(local_ip)
+            local_s = str(local_ip)
         else:
-            local_part += "-"
-
-        remote_part = f"rov={rif} {rkind} {rstate} {rsp_s}"
-        if remote and (remote.get("ip") or None):
-            remote_part += f" ip={remote.get('ip')}"
-        if rdef_if and rdef_if != rif:
-            remote_part += f" (def={rdef_if}"
-            if rdef_wifi is True:
-                remote_part += "/wifi"
-            if rsel_reason:
-                remote_part += f", {rsel_reason}"
-            remote_part += ")"
+            local_s = "-"
 
-        # Optional RTT/jitter/loss probe (ROV netdiag UDP echo).
-        nd = self._get_netdiag_snapshot()
-        nd_age = None
-        try:
-            if nd.get("ts"):
-                nd_age = now - float(nd.get("ts", 0.0))
-        except Exception:
-            nd_age = None
         rtt_part = None
-        if nd and (nd_age is not None) and nd_age < 2.5:
-            last_rtt = nd.get("last_rtt_ms")
-            avg_rtt = nd.get("avg_rtt_ms")
-            jitter = nd.get("jitter_ms")
-            loss_pct = nd.get("loss_pct")
-            segs = []
-            if isinstance(last_rtt, (int, float)):
-                segs.append(f"rtt={float(last_rtt):.1f}ms")
-            if isinstance(avg_rtt, (int, float)):
-                segs.append(f"avg={float(avg_rtt):.1f}ms")
-            if isinstance(jitter, (int, float)):
-                segs.append(f"jit={float(jitter):.1f}ms")
-            if isinstance(loss_pct, (int, float)):
-                segs.append(f"loss={float(loss_pct):.0f}%")
-            if segs:
-                rtt_part = "probe:" + " ".join(segs)
+        if nd_fresh:
+            # Remote/route changes redraw the line too; the probe segment only
+            # needs formatting when the probe thread published a new snapshot.
+            cached = self._rtt_part_cache
+            if cached is not None and cached[0] is nd:
+                rtt_part = cached[1]
+            else:
+                rtt_part = _netdiag_probe_text(nd)
+                self._rtt_part_cache = (nd, rtt_part)
 
         # Warnings
         warns = []
@@ -3435,15 +3886,12 @@ class MainWindow(QMainWindow):
             # Informational: route for control/RPC may differ from the ROV stats interface.
             warns.append("local route via Wi-Fi")
 
-        parts = ["Net:", local_part, "|", remote_part]
-        if remote:
-            parts += ["|", f"rx={rx_s}", f"tx={tx_s}"]
+        parts = [f"Net: local={local_s}", rov_s]
         if rtt_part:
-            parts += ["|", rtt_part]
+            parts.append(rtt_part)
         if warns:
-            parts += ["|", "WARN " + "; ".join(warns)]
-
-        self._set_status(self._net_lbl, " ".join(parts))
+            parts.append("WARN " + "; ".join(warns))
+        self._queue_status(self._net_lbl, " | ".join(parts))
 
     def _toggle_water_correction(self, checked: bool) -> None:
         if self.video_panel is not None:
@@ -4577,6 +5025,8 @@ class MainWindow(QMainWindow):
         active_file_paths = list(snapshot.get("active_file_paths") or [])
         last_file_path = str(snapshot.get("last_file_path") or "")
         last_file_completed_ts = float(snapshot.get("last_file_completed_ts") or 0.0)
+        # The server stamps requests with wall time, so ages use it too.
+        wall_now = time.time()
         if active_file_transfers > 0:
             active_path = active_file_paths[-1] if active_file_paths else last_file_path
             short_path = self._short_analysis_transfer_path(active_path)
@@ -4584,8 +5034,8 @@ class MainWindow(QMainWindow):
             if short_path:
                 pull_text = f"{pull_text}: {short_path}"
             tone = "ok"
-        elif last_file_completed_ts > 0 and time.time() - last_file_completed_ts < 30.0:
-            age = max(0.0, time.time() - last_file_completed_ts)
+        elif last_file_completed_ts > 0 and wall_now - last_file_completed_ts < 30.0:
+            age = max(0.0, wall_now - last_file_completed_ts)
             short_path = self._short_analysis_transfer_path(last_file_path)
             sent_bytes = int(snapshot.get("last_file_bytes_sent") or 0)
             if sent_bytes >= 1024 * 1024:
@@ -4599,7 +5049,7 @@ class MainWindow(QMainWindow):
                 pull_text = f"{pull_text}: {short_path}"
             tone = "ok"
         elif last_request_ts > 0:
-            age = max(0.0, time.time() - last_request_ts)
+            age = max(0.0, wall_now - last_request_ts)
             if last_request_path in {"/events", "/api/events"}:
                 if age < 65.0:
                     pull_text = f"Analysis listening {age:.0f}s"
@@ -4805,29 +5255,31 @@ class MainWindow(QMainWindow):
         self.addAction(self._fullscreen_act)
         view_menu.addSeparator()
 
-        self._save_dir_act = QAction("Set Save Directory...", self)
-        self._save_dir_act.triggered.connect(self._choose_save_directory)
+        self._save_dir_act = QAction("Set Save Directory...", self, triggered=self._choose_save_directory)
         rec_menu.addAction(self._save_dir_act)
 
-        self._reset_save_dir_act = QAction("Use Default Recordings Folder", self)
-        self._reset_save_dir_act.triggered.connect(self._reset_save_directory)
+        self._reset_save_dir_act = QAction(
+            "Use Default Recordings Folder", self, triggered=self._reset_save_directory
+        )
         rec_menu.addAction(self._reset_save_dir_act)
         rec_menu.addSeparator()
 
-        self._analysis_transfer_start_act = QAction("Start Analysis Transfer Server", self)
-        self._analysis_transfer_start_act.triggered.connect(self._start_analysis_transfer_server)
+        self._analysis_transfer_start_act = QAction(
+            "Start Analysis Transfer Server", self, triggered=self._start_analysis_transfer_server
+        )
         transfer_menu.addAction(self._analysis_transfer_start_act)
 
-        self._analysis_transfer_stop_act = QAction("Stop Analysis Transfer Server", self)
-        self._analysis_transfer_stop_act.triggered.connect(self._stop_analysis_transfer_server)
+        self._analysis_transfer_stop_act = QAction(
+            "Stop Analysis Transfer Server", self, triggered=self._stop_analysis_transfer_server
+        )
         transfer_menu.addAction(self._analysis_transfer_stop_act)
 
-        self._analysis_transfer_restart_act = QAction("Restart Analysis Transfer Server", self)
-        self._analysis_transfer_restart_act.triggered.connect(self._restart_analysis_transfer_server)
+        self._analysis_transfer_restart_act = QAction(
+            "Restart Analysis Transfer Server", self, triggered=self._restart_analysis_transfer_server
+        )
         transfer_menu.addAction(self._analysis_transfer_restart_act)
 
-        copy_transfer_url_act = QAction("Copy Transfer URL", self)
-        copy_transfer_url_act.triggered.connect(self._copy_analysis_transfer_url)
+        copy_transfer_url_act = QAction("Copy Transfer URL", self, triggered=self._copy_analysis_transfer_url)
         transfer_menu.addAction(copy_transfer_url_act)
 
         self._reverse_act = QAction("Reverse Drive", self)
@@ -4854,24 +5306,22 @@ class MainWindow(QMainWindow):
 
         layout_menu = view_menu.addMenu("Camera Layout")
         for label, pane_count in [("Single Camera", 1), ("Stacked Dual Camera", 2), ("Quad Camera", 4)]:
-            act = QAction(label, self)
-            act.triggered.connect(lambda _checked=False, panes=pane_count: self._set_video_layout(panes))
+            act = QAction(
+                label, self, triggered=lambda _checked=False, panes=pane_count: self._set_video_layout(panes)
+            )
             layout_menu.addAction(act)
 
         # Stream log (JSONL)
-        start_log = QAction("Start Stream Log", self)
-        start_log.triggered.connect(self._start_stream_log)
+        start_log = QAction("Start Stream Log", self, triggered=self._start_stream_log)
         rec_menu.addAction(start_log)
 
-        stop_log = QAction("Stop Stream Log", self)
-        stop_log.triggered.connect(self._stop_stream_log)
+        stop_log = QAction("Stop Stream Log", self, triggered=self._stop_stream_log)
         rec_menu.addAction(stop_log)
 
         self._refresh_save_directory_actions()
         self._refresh_analysis_transfer_actions()
 
-        quit_act = QAction("Quit", self)
-        quit_act.triggered.connect(self.close)
+        quit_act = QAction("Quit", self, triggered=self.close)
         file_menu.addAction(quit_act)
 
     def closeEvent(self, event):
@@ -4881,7 +5331,7 @@ class MainWindow(QMainWindow):
                 app.removeEventFilter(self)
         except Exception:
             pass
-        for timer_name in ("_link_timer", "_analysis_transfer_timer", "_sensor_ui_timer", "_tether_ui_timer", "_ui_lag_timer", "_transect_status_timer"):
+        for timer_name in ("_link_timer", "_status_flush_timer", "_video_status_timer", "_net_timer", "_analysis_transfer_timer", "_sensor_ui_timer", "_sensor_panel_timer", "_tether_ui_timer", "_ui_lag_timer", "_transect_status_timer"):
             try:
                 timer = getattr(self, timer_name, None)
                 if timer is not None:
@@ -4979,6 +5429,19 @@ class MainWindow(QMainWindow):
             self._ssh_page.shutdown()
         except Exception:
             pass
+        if self._netlink_ipr:
+            try:
+                self._netlink_ipr.close()
+            except Exception:
+                pass
+            self._netlink_ipr = None
+        watch = self._route_watch
+        self._route_watch = None
+        if watch is not None:
+            try:
+                watch.close()  # unblocks the monitor thread's get()
+            except Exception:
+                pass
         if video_panel is not None:
             try:
                 video_panel.setParent(None)
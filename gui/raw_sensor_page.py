@@ -847,24 +847,25 @@ class RawSensorPage(QWidget):
 
     def record_message(self, msg: dict) -> list[dict]:
         derived: list[dict] = []
+        msg = msg or {}
         with self._logger_lock:
             logger = self._logger
         if logger is not None:
-            logger.record(dict(msg or {}))
-        typ = str((msg or {}).get("type", ""))
+            logger.record(dict(msg))
+        typ = str(msg.get("type", ""))
         if typ == "attitude":
-            source = str((msg or {}).get("source", ""))
+            source = str(msg.get("source", ""))
             if not source.startswith("topside_"):
                 self._last_onboard_attitude_recv_s = time.time()
             return derived
         if typ == "mag":
             try:
-                self._attitude_estimator.update_mag(dict(msg or {}))
+                self._attitude_estimator.update_mag(dict(msg))
             except Exception:
                 pass
         if typ == "imu":
             try:
-                estimate = self._attitude_estimator.update(dict(msg or {}), recv_time_s=time.time())
+                estimate = self._attitude_estimator.update(dict(msg), recv_time_s=time.time())
             except Exception:
                 estimate = None
             if isinstance(estimate, dict):
@@ -11,7 +11,188 @@ from PyQt6.QtWidgets import (
     QHeaderView,
 )
 from PyQt6.QtCore import Qt
-import time
+
+# Value-column templates, parsed once here instead of per message.
+_IMU_ACC_FMT = "acc=(%.2f,%.2f,%.2f)"
+_IMU_GYRO_FMT = "gyro=(%.2f,%.2f,%.2f)"
+_MAG_FMT = "(%.1f,%.1f,%.1f) |B|=%.1f"
+_MAG_SOURCES_FMT = "ak=%s\nmmc=%s"
+_ATTITUDE_FMT = "roll=%.2f deg pitch=%.2f deg tilt=%.2f deg"
+_ENV_FMT = "%.1f C, %.1f kPa"
+_ADC_FMT = "%.2f"
+_DEPTH_FMT = "%.2f m, %.1f C"
+_DEPTH_PRESSURE_FMT = "%.2f m, %.1f C, %.1f mbar"
+_HEARTBEAT_FMT = "armed=%s pilot_age=%s seq=%s"
+_NET_FMT = "%s %s %s %s ip=%s rx=%s tx=%s drop=%s/%s err=%s/%s%s (%s)"
+_GBPS_FMT = "%.2fGb/s"
+_MBPS_FMT = "%.2fMb/s"
+_KBPS_FMT = "%.1fKb/s"
+_BPS_FMT = "%.0fb/s"
+# Unknown or unparseable messages are shown raw, up to this many characters.
+_RAW_MAX_CHARS = 256
+
+# Shared stand-in for absent sub-dicts; only ever read.
+_EMPTY: dict = {}
+
+_COLUMN_ALIGN = (
+    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignCenter,
+    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+)
+
+
+def _vec(d: dict | None) -> tuple[float, float, float]:
+    d = d or _EMPTY
+    try:
+        x = float(d.get("x", 0.0))
+        y = float(d.get("y", 0.0))
+        z = float(d.get("z", 0.0))
+    except Exception:
+        x = y = z = 0.0
+    return x, y, z
+
+
+def _vec_norm(d: dict | None) -> str:
+    d = d or _EMPTY
+    try:
+        x = float(d.get("x", 0.0))
+        y = float(d.get("y", 0.0))
+        z = float(d.get("z", 0.0))
+    except Exception:
+        return "-"
+    return _MAG_FMT % (x, y, z, (x * x + y * y + z * z) ** 0.5)
+
+
+def _bps_to_str(bps) -> str:
+    try:
+        bps = float(bps)
+    except Exception:
+        return "-"
+    if bps < 0:
+        return "-"
+    # show in bits/s
+    b = bps * 8.0
+    if b >= 1e9:
+        return _GBPS_FMT % (b / 1e9)
+    if b >= 1e6:
+        return _MBPS_FMT % (b / 1e6)
+    if b >= 1e3:
+        return _KBPS_FMT % (b / 1e3)
+    return _BPS_FMT % b
+
+
+def _fmt_raw(msg: dict) -> str:
+    """Whole message as text, capped so an oversized one cannot bloat the row."""
+    text = str(msg)
+    if len(text) > _RAW_MAX_CHARS:
+        return text[: _RAW_MAX_CHARS - 3] + "..."
+    return text
+
+
+def _fmt_imu(msg: dict) -> str:
+    # Display accel + gyro. Magnetometers publish separately so IMU
+    # cadence is not held back by slower mag reads.
+    lines: list[str] = []
+    if "accel" in msg:
+        lines.append(_IMU_ACC_FMT % _vec(msg.get("accel")))
+    if "gyro" in msg:
+        lines.append(_IMU_GYRO_FMT % _vec(msg.get("gyro")))
+
+    return "\n".join(lines) if lines else _fmt_raw(msg)
+
+
+def _fmt_mag(msg: dict) -> str:
+    mags = msg.get("mag_sources") or _EMPTY
+    if isinstance(mags, dict):
+        return _MAG_SOURCES_FMT % (_vec_norm(mags.get("ak09915")), _vec_norm(mags.get("mmc5983")))
+    return _vec_norm(msg.get("mag") or msg.get("magnetometer"))
+
+
+def _fmt_attitude(msg: dict) -> str:
+    try:
+        return _ATTITUDE_FMT % (
+            float(msg.get("roll_deg", 0.0)),
+            float(msg.get("pitch_deg", 0.0)),
+            float(msg.get("tilt_deg", 0.0)),
+        )
+    except Exception:
+        return _fmt_raw(msg)
+
+
+def _fmt_env(msg: dict) -> str:
+    return _ENV_FMT % (msg.get("temperature_c", 0), msg.get("pressure_kpa", 0))
+
+
+def _fmt_leak(msg: dict) -> str:
+    return "LEAK!" if msg.get("leak") else "ok"
+
+
+def _fmt_adc(msg: dict) -> str:
+    chans = msg.get("channels", [])
+    return ", ".join([_ADC_FMT % c for c in chans])
+
+
+def _fmt_external_depth(msg: dict) -> str:
+    p = msg.get("pressure_mbar")
+    if p is None:
+        return _DEPTH_FMT % (msg.get("depth_m", 0), msg.get("temperature_c", 0))
+    return _DEPTH_PRESSURE_FMT % (msg.get("depth_m", 0), msg.get("temperature_c", 0), float(p))
+
+
+def _fmt_heartbeat(msg: dict) -> str:
+    armed = msg.get("armed")
+    pa = msg.get("pilot_age")
+    seq = msg.get("pilot_seq")
+    try:
+        pa_s = "%.2fs" % float(pa) if pa is not None else "-"
+    except Exception:
+        pa_s = str(pa)
+    return _HEARTBEAT_FMT % (armed, pa_s, seq)
+
+
+def _fmt_net(msg: dict) -> str:
+    iface = msg.get("iface") or "-"
+    ip = msg.get("ip") or "-"
+    link = msg.get("link") or _EMPTY
+    kind = link.get("kind") or "-"
+    state = link.get("state") or "-"
+    sp = link.get("speed_mbps")
+    sp_s = "%dMbps" % sp if isinstance(sp, (int, float)) and sp and sp > 0 else "-"
+    rx_s = _bps_to_str(msg.get("rx_bps"))
+    tx_s = _bps_to_str(msg.get("tx_bps"))
+    c = msg.get("counters") or _EMPTY
+    tether = msg.get("is_tether")
+    tether_s = "tether" if tether else "wifi/other"
+    default_iface = msg.get("default_iface")
+    sel_reason = msg.get("selection_reason")
+    path_s = ""
+    if default_iface and default_iface != iface:
+        path_s = f" sel={iface} def={default_iface}"
+        if sel_reason:
+            path_s += f"({sel_reason})"
+    elif sel_reason:
+        path_s = f" sel={iface}({sel_reason})"
+    return _NET_FMT % (
+        iface, kind, state, sp_s, ip, rx_s, tx_s,
+        c.get("rx_drop", "-"), c.get("tx_drop", "-"),
+        c.get("rx_errs", "-"), c.get("tx_errs", "-"),
+        path_s, tether_s,
+    )
+
+
+# Value-column formatter per message ``type``; unknown types are shown raw.
+_FORMATTERS = {
+    "imu": _fmt_imu,
+    "mag": _fmt_mag,
+    "attitude": _fmt_attitude,
+    "env": _fmt_env,
+    "leak": _fmt_leak,
+    "adc": _fmt_adc,
+    "external_depth": _fmt_external_depth,
+    "heartbeat": _fmt_heartbeat,
+    "net": _fmt_net,
+}
+
 
 class SensorPanel(QWidget):
     """Simple ``sensor | type | value`` table with tooltip-preserved values."""
@@ -27,6 +208,7 @@ class SensorPanel(QWidget):
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.table.horizontalHeader().sectionResized.connect(self._on_section_resized)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
@@ -44,181 +226,112 @@ class SensorPanel(QWidget):
         lay.addWidget(self.table)
 
         self._rows: dict[str, int] = {}
-        self._last_row_resize_ts: dict[int, float] = {}
-        self._last_value_text: dict[tuple[str, str], str] = {}
+        # Cells of each row, created once; updates only change their text.
+        self._items: dict[str, tuple[QTableWidgetItem, QTableWidgetItem, QTableWidgetItem]] = {}
+        # Sensors given a row index in the current batch but not yet in the table.
+        self._new_rows: list[str] = []
+        # (line count, length) of each row's Value text when it was last laid out.
+        self._row_shape: dict[str, tuple[int, int]] = {}
+        # (type, value) each row currently shows, keyed like _rows.
+        self._shown: dict[str, tuple[str, str]] = {}
         try:
             self.table.setStyleSheet("QTableWidget { font-family: Menlo, Consolas, monospace; }")
         except Exception:
             pass
 
+    def upsert_sensor_batch(self, msgs) -> None:
+        """Apply several sensor updates with a single table repaint."""
+        relayout: set[str] = set()
+        self.table.setUpdatesEnabled(False)
+        try:
+            for msg in msgs:
+                try:
+                    sensor = self._apply_sensor(msg)
+                except Exception:
+                    continue
+                if sensor is not None:
+                    relayout.add(sensor)
+            self._commit_new_rows()
+            # Row heights follow the wrapped Value text; settle them once per
+            # batch, and only for rows whose text changed shape.
+            for sensor in relayout:
+                row = self._rows.get(sensor)
+                if row is not None:
+                    self.table.resizeRowToContents(row)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
     def upsert_sensor(self, msg: dict):
+        self.upsert_sensor_batch((msg,))
+
+    def _commit_new_rows(self) -> None:
+        """Grow the table once for every sensor first seen in this batch."""
+        if not self._new_rows:
+            return
+        new_rows, self._new_rows = self._new_rows, []
+        self.table.setRowCount(self.table.rowCount() + len(new_rows))
+        for sensor in new_rows:
+            row = self._rows[sensor]
+            for col, item in enumerate(self._items[sensor]):
+                self.table.setItem(row, col, item)
+
+    def _apply_sensor(self, msg: dict) -> str | None:
+        """Write one message into its row; returns the sensor if it needs relayout."""
         sensor = msg.get("sensor", "unknown")
         typ = msg.get("type", "-")
 
-        if typ == "imu":
-            # Display accel + gyro. Magnetometers publish separately so IMU
-            # cadence is not held back by slower mag reads.
-            def _vec(d: dict | None):
-                d = d or {}
-                try:
-                    x = float(d.get("x", 0.0))
-                    y = float(d.get("y", 0.0))
-                    z = float(d.get("z", 0.0))
-                except Exception:
-                    x = y = z = 0.0
-                return x, y, z
-
-            lines: list[str] = []
-            if "accel" in msg:
-                ax, ay, az = _vec(msg.get("accel"))
-                lines.append(f"acc=({ax:.2f},{ay:.2f},{az:.2f})")
-            if "gyro" in msg:
-                gx, gy, gz = _vec(msg.get("gyro"))
-                lines.append(f"gyro=({gx:.2f},{gy:.2f},{gz:.2f})")
-
-            val = "\n".join(lines) if lines else str(msg)
-        elif typ == "mag":
-            def _vec_norm(d: dict | None) -> str:
-                d = d or {}
-                try:
-                    x = float(d.get("x", 0.0))
-                    y = float(d.get("y", 0.0))
-                    z = float(d.get("z", 0.0))
-                except Exception:
-                    return "-"
-                return f"({x:.1f},{y:.1f},{z:.1f}) |B|={(x*x+y*y+z*z) ** 0.5:.1f}"
-
-            mags = msg.get("mag_sources") or {}
-            if isinstance(mags, dict):
-                val = f"ak={_vec_norm(mags.get('ak09915'))}\nmmc={_vec_norm(mags.get('mmc5983'))}"
-            else:
-                val = _vec_norm(msg.get("mag") or msg.get("magnetometer"))
-        elif typ == "attitude":
-            try:
-                val = (
-                    f"roll={float(msg.get('roll_deg', 0.0)):.2f} deg "
-                    f"pitch={float(msg.get('pitch_deg', 0.0)):.2f} deg "
-                    f"tilt={float(msg.get('tilt_deg', 0.0)):.2f} deg"
-                )
-            except Exception:
-                val = str(msg)
-        elif typ == "env":
-            val = f"{msg.get('temperature_c', 0):.1f} C, {msg.get('pressure_kpa', 0):.1f} kPa"
-        elif typ == "leak":
-            val = "LEAK!" if msg.get("leak") else "ok"
-        elif typ == "adc":
-            chans = msg.get("channels", [])
-            val = ", ".join(f"{c:.2f}" for c in chans)
-        elif typ == "external_depth":
-            p = msg.get("pressure_mbar")
-            p_s = f", {float(p):.1f} mbar" if p is not None else ""
-            val = f"{msg.get('depth_m', 0):.2f} m, {msg.get('temperature_c', 0):.1f} C{p_s}"
-        elif typ == "power":
+        if typ == "power":
+            # Power has its own instrument; drop any row it used to occupy.
             if sensor in self._rows:
                 row = self._rows.pop(sensor)
-                self.table.removeRow(row)
+                self._items.pop(sensor, None)
+                self._shown.pop(sensor, None)
+                self._row_shape.pop(sensor, None)
+                if sensor in self._new_rows:
+                    self._new_rows.remove(sensor)
+                else:
+                    self.table.removeRow(row)
                 self._rows = {
                     key: (idx - 1 if idx > row else idx)
                     for key, idx in self._rows.items()
                 }
-            return
-        elif typ == "heartbeat":
-            armed = msg.get("armed")
-            pa = msg.get("pilot_age")
-            seq = msg.get("pilot_seq")
-            try:
-                pa_s = f"{float(pa):.2f}s" if pa is not None else "-"
-            except Exception:
-                pa_s = str(pa)
-            val = f"armed={armed} pilot_age={pa_s} seq={seq}"
-        elif typ == "net":
-            iface = msg.get("iface") or "-"
-            ip = msg.get("ip") or "-"
-            link = msg.get("link") or {}
-            kind = link.get("kind") or "-"
-            state = link.get("state") or "-"
-            sp = link.get("speed_mbps")
-            sp_s = f"{int(sp)}Mbps" if isinstance(sp, (int, float)) and sp and sp > 0 else "-"
-
-            def _bps_to_str(bps):
-                try:
-                    bps = float(bps)
-                except Exception:
-                    return "-"
-                if bps < 0:
-                    return "-"
-                # show in bits/s
-                b = bps * 8.0
-                if b >= 1e9:
-                    return f"{b/1e9:.2f}Gb/s"
-                if b >= 1e6:
-                    return f"{b/1e6:.2f}Mb/s"
-                if b >= 1e3:
-                    return f"{b/1e3:.1f}Kb/s"
-                return f"{b:.0f}b/s"
-
-            rx_s = _bps_to_str(msg.get("rx_bps"))
-            tx_s = _bps_to_str(msg.get("tx_bps"))
-            c = msg.get("counters") or {}
-            drop = f"{c.get('rx_drop','-')}/{c.get('tx_drop','-')}"
-            errs = f"{c.get('rx_errs','-')}/{c.get('tx_errs','-')}"
-            tether = msg.get("is_tether")
-            tether_s = "tether" if tether else "wifi/other"
-            default_iface = msg.get("default_iface")
-            sel_reason = msg.get("selection_reason")
-            path_s = ""
-            if default_iface and default_iface != iface:
-                path_s = f" sel={iface} def={default_iface}"
-                if sel_reason:
-                    path_s += f"({sel_reason})"
-            elif sel_reason:
-                path_s = f" sel={iface}({sel_reason})"
-            val = f"{iface} {kind} {state} {sp_s} ip={ip} rx={rx_s} tx={tx_s} drop={drop} err={errs}{path_s} ({tether_s})"
-        else:
-            val = str(msg)
-
-        # Avoid unnecessary table churn when the rendered value has not changed.
-        cache_key = (str(sensor), str(typ))
-        last_val = self._last_value_text.get(cache_key)
-        if last_val == val:
-            return
-        self._last_value_text[cache_key] = val
+            return None
+        val = _FORMATTERS.get(typ, _fmt_raw)(msg)
 
-        if sensor in self._rows:
-            row = self._rows[sensor]
-        else:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self._rows[sensor] = row
-
-        self.table.setItem(row, 0, QTableWidgetItem(sensor))
-        self.table.setItem(row, 1, QTableWidgetItem(typ))
-        self.table.setItem(row, 2, QTableWidgetItem(val))
-
-        for col in range(3):
-            item = self.table.item(row, col)
-            if not item:
-                continue
-            align = Qt.AlignmentFlag.AlignVCenter
-            if col == 0:
-                align |= Qt.AlignmentFlag.AlignLeft
-            elif col == 1:
-                align |= Qt.AlignmentFlag.AlignCenter
-            else:
-                align |= Qt.AlignmentFlag.AlignLeft
-            item.setTextAlignment(align)
-            try:
-                item.setToolTip(item.text())
-            except Exception:
-                pass
-
-        # Keep rows tall enough for wrapped text in the Value column, but
-        # rate-limit this expensive call to avoid UI stutter during high-rate telemetry.
-        try:
-            now = time.time()
-            prev = float(self._last_row_resize_ts.get(row, 0.0))
-            if (now - prev) > 0.25:
-                self.table.resizeRowToContents(row)
-                self._last_row_resize_ts[row] = now
-        except Exception:
-            pass
+        # Avoid unnecessary table churn when the row already shows this value.
+        shown = self._shown.get(sensor)
+        if shown == (typ, val):
+            return None
+        self._shown[sensor] = (typ, val)
+        # Same line count and length: the wrapped height cannot have moved.
+        shape = (val.count("\n"), len(val))
+        reshaped = self._row_shape.get(sensor) != shape
+        self._row_shape[sensor] = shape
+
+        items = self._items.get(sensor)
+        if items is None:
+            # The row itself is added by _commit_new_rows at the end of the batch.
+            self._rows[sensor] = len(self._rows)
+            items = (QTableWidgetItem(), QTableWidgetItem(), QTableWidgetItem())
+            for col, (item, text) in enumerate(zip(items, (sensor, typ, val))):
+                item.setTextAlignment(_COLUMN_ALIGN[col])
+                item.setText(text)
+                item.setToolTip(text)
+            self._items[sensor] = items
+            self._new_rows.append(sensor)
+            return sensor
+
+        # Existing row: the items stay put and only changed text (and its
+        # tooltip) is written.
+        if shown is None or shown[0] != typ:
+            items[1].setText(typ)
+            items[1].setToolTip(typ)
+        if shown is None or shown[1] != val:
+            items[2].setText(val)
+            items[2].setToolTip(val)
+        return sensor if reshaped else None
+
+    def _on_section_resized(self, index: int, old_size: int, new_size: int) -> None:
+        # A wider or narrower Value column re-wraps every row.
+        if index == 2 and old_size != new_size:
+            self.table.resizeRowsToContents()
@@ -3,7 +3,7 @@
 A dumb image surface: the CV worker bakes the overlay onto a BGR frame with
 ``tracking.transect_overlay.draw_transect_overlay`` (off the GUI thread) and
 calls :meth:`submit_frame` from that worker thread; the widget marshals onto the
-GUI thread via a queued signal, converts to a QImage, and paints it aspect-fit.
+GUI thread via a queued signal, wraps it in a QImage, and paints it aspect-fit.
 
 This is the live counterpart of the offline ``tools/transect_overlay_demo.py``
 output, so what the pilot sees on the Transect tab is exactly what the model
@@ -16,7 +16,7 @@ from __future__ import annotations
 from typing import Optional
 
 import numpy as np
-from PyQt6.QtCore import QPointF, QRectF, Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QPointF, QRectF, QSize, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
 from PyQt6.QtWidgets import QApplication, QSizePolicy, QWidget
 
@@ -198,6 +198,8 @@ class TransectOverlayView(QWidget):
         self.setObjectName("transectOverlayView")
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self._qimage: Optional[QImage] = None
+        # Backing buffer for _qimage (the QImage is a view over it, not a copy).
+        self._frame: Optional[np.ndarray] = None
         self._placeholder = "Transect autopilot — waiting for video…"
         # Queued (default cross-thread) so worker-thread submits repaint safely.
         self._frame_sig.connect(self._on_frame)
@@ -208,9 +210,23 @@ class TransectOverlayView(QWidget):
         self._stale_timer = QTimer(self)
         self._stale_timer.setSingleShot(True)
         self._stale_timer.timeout.connect(self._on_stale)
+        # Aspect-fit copy of _qimage for the current widget size. While the user
+        # drags a resize we scale with FastTransformation and only redo the
+        # smooth pass once resizing has settled for _resize_settle_ms.
+        self._scaled: Optional[QImage] = None
+        # Backing buffer for _scaled when it was downscaled with OpenCV.
+        self._scaled_frame: Optional[np.ndarray] = None
+        self._scaled_key: Optional[tuple[int, int, int, bool]] = None
+        self._resize_settle_ms = 120
+        self._resize_settle_timer = QTimer(self)
+        self._resize_settle_timer.setSingleShot(True)
+        self._resize_settle_timer.timeout.connect(self.update)
 
     def submit_frame(self, frame_bgr: np.ndarray) -> None:
-        """Hand an annotated BGR frame to the view (callable from any thread)."""
+        """Hand an annotated BGR frame to the view (callable from any thread).
+
+        The view displays the array in place; don't write into it afterwards.
+        """
         self._frame_sig.emit(frame_bgr)
 
     def set_placeholder_text(self, text: str) -> None:
@@ -222,6 +238,10 @@ class TransectOverlayView(QWidget):
         """Drop the current frame and hide the view (revealing the video below)."""
         self._stale_timer.stop()
         self._qimage = None
+        self._frame = None
+        self._scaled = None
+        self._scaled_frame = None
+        self._scaled_key = None
         self.hide()
         self.update()
 
@@ -230,10 +250,10 @@ class TransectOverlayView(QWidget):
         self.hide()
 
     def _on_frame(self, frame_bgr) -> None:
-        img = self._qimage_from_bgr(frame_bgr)
-        if img is None:
+        converted = self._qimage_from_bgr(frame_bgr)
+        if converted is None:
             return
-        self._qimage = img
+        self._frame, self._qimage = converted
         # Reveal the overlay only once a real frame exists, so a slow/absent CV
         # feed never hides the working video underneath with a placeholder.
         if not self.isVisible():
@@ -244,15 +264,55 @@ class TransectOverlayView(QWidget):
         self._stale_timer.start(self._stale_ms)
 
     @staticmethod
-    def _qimage_from_bgr(frame_bgr) -> Optional[QImage]:
+    def _qimage_from_bgr(frame_bgr) -> Optional[tuple[np.ndarray, QImage]]:
+        """Wrap a BGR frame in a BGR888 QImage without copying or swapping channels.
+
+        The QImage borrows the returned array's buffer, so the caller must keep
+        the array alive for as long as it keeps the image.
+        """
         if frame_bgr is None or not hasattr(frame_bgr, "shape") or frame_bgr.ndim != 3:
             return None
         h, w = frame_bgr.shape[:2]
-        if h <= 0 or w <= 0:
+        if h <= 0 or w <= 0 or frame_bgr.shape[2] != 3:
+            return None
+        frame = np.ascontiguousarray(frame_bgr, dtype=np.uint8)
+        return frame, QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
+
+    def resizeEvent(self, event) -> None:  # noqa: N802
+        super().resizeEvent(event)
+        self._resize_settle_timer.start(self._resize_settle_ms)
+
+    def _scaled_image(self, size: QSize) -> QImage:
+        """Return ``_qimage`` aspect-fit to ``size``, reusing the last result."""
+        resizing = self._resize_settle_timer.isActive()
+        key = (self._qimage.cacheKey(), size.width(), size.height(), resizing)
+        if self._scaled is None or key != self._scaled_key:
+            self._scaled_frame = None
+            target = self._qimage.size().scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+            shrinking = target.width() < self._qimage.width() and target.height() < self._qimage.height()
+            if resizing:
+                self._scaled = self._qimage.scaled(target, transformMode=Qt.TransformationMode.FastTransformation)
+            else:
+                # Shrinking the ndarray in OpenCV (which releases the GIL) is much
+                # cheaper than Qt's smooth filter over the full-size frame.
+                small = None
+                if shrinking and self._frame is not None and not target.isEmpty():
+                    small = self._downscale_frame(target)
+                if small is not None:
+                    self._scaled_frame, self._scaled = small
+                else:
+                    self._scaled = self._qimage.scaled(target, transformMode=Qt.TransformationMode.SmoothTransformation)
+            self._scaled_key = key
+        return self._scaled
+
+    def _downscale_frame(self, target: QSize) -> Optional[tuple[np.ndarray, QImage]]:
+        """Area-average ``_frame`` down to ``target`` with OpenCV, if available."""
+        try:
+            import cv2
+        except Exception:
             return None
-        # BGR -> RGB, contiguous; .copy() detaches the QImage from the numpy buffer.
-        rgb = np.ascontiguousarray(frame_bgr[:, :, ::-1])
-        return QImage(rgb.data, w, h, 3 * w, QImage.Format.Format_RGB888).copy()
+        small = cv2.resize(self._frame, (target.width(), target.height()), interpolation=cv2.INTER_AREA)
+        return self._qimage_from_bgr(small)
 
     def paintEvent(self, _event) -> None:
         painter = QPainter(self)
@@ -262,11 +322,7 @@ class TransectOverlayView(QWidget):
             painter.setPen(QColor(200, 200, 200))
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self._placeholder)
             return
-        scaled = self._qimage.scaled(
-            rect.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        scaled = self._scaled_image(rect.size())
         x = rect.x() + (rect.width() - scaled.width()) // 2
         y = rect.y() + (rect.height() - scaled.height()) // 2
         painter.drawImage(x, y, scaled)
@@ -28,6 +28,8 @@ from gui.direct_gst_video_widget import DirectGstVideoWidget
 from gui.video_widget import VideoWidget
 from video.cam import RemoteCameraManager
 
+_CAPTURE_STATUS_RECORDING_STYLE = "QLabel#captureStatusLabel { color: #ff4d4d; font-weight: bold; }"
+
 
 class _VideoPane(QFrame):
     activated = pyqtSignal(int)
@@ -115,6 +117,7 @@ class VideoTabs(QWidget):
     """Owns camera widgets, pane assignment, and layout switching."""
 
     selectionChanged = pyqtSignal()
+    streamStateChanged = pyqtSignal(str, str)  # stream name, widget state
     LAYOUT_OPTIONS: tuple[tuple[str, int], ...] = (
         ("Single", 1),
         ("Stacked", 2),
@@ -140,7 +143,10 @@ class VideoTabs(QWidget):
         self._settings = QSettings("TritonPilot", "ROVTopside")
 
         self._containers: dict[str, QWidget] = {}
+        # One status label per container, hidden while a video widget runs.
+        self._placeholders: dict[str, QLabel] = {}
         self._widgets: dict[str, QWidget | None] = {}
+        self._starting: set[str] = set()
         self._pane_streams: list[str | None] = [None, None, None, None]
         self._pane_count: int = 4
         self._active_pane_index: int = 0
@@ -237,6 +243,7 @@ class VideoTabs(QWidget):
             placeholder.setWordWrap(True)
             lay.addWidget(placeholder)
             self._containers[name] = cont
+            self._placeholders[name] = placeholder
             self._widgets[name] = None
 
         self._load_preferences()
@@ -538,27 +545,13 @@ class VideoTabs(QWidget):
         self.update()
         self._refresh_visible_widget_geometry()
 
-    def _clear_container(self, cont: QWidget) -> None:
-        lay = cont.layout()
-        if lay is None:
+    def _show_placeholder(self, name: str, text: str) -> None:
+        placeholder = self._placeholders.get(name)
+        if placeholder is None:
             return
-        while lay.count():
-            item = lay.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-                if not isinstance(w, (VideoWidget, DirectGstVideoWidget)):
-                    w.deleteLater()
-
-    def _add_placeholder(self, cont: QWidget, text: str) -> None:
-        lay = cont.layout()
-        if lay is None:
-            return
-        placeholder = QLabel(text)
-        placeholder.setObjectName("videoPanePlaceholder")
-        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder.setWordWrap(True)
-        lay.addWidget(placeholder)
+        if placeholder.text() != text:
+            placeholder.setText(text)
+        placeholder.show()
 
     def _stop_stream_widget(self, name: str, *, placeholder: str | None = None) -> bool:
         widget = self._widgets.get(name)
@@ -575,9 +568,11 @@ class VideoTabs(QWidget):
         self._widgets[name] = None
 
         cont = self._containers.get(name)
-        if cont is not None:
-            self._clear_container(cont)
-            self._add_placeholder(cont, placeholder or f"{name}\n(starting when needed)")
+        lay = cont.layout() if cont is not None else None
+        if lay is not None:
+            lay.removeWidget(widget)
+            widget.setParent(None)
+        self._show_placeholder(name, placeholder or f"{name}\n(starting when needed)")
         return True
 
     def _stop_hidden_streams(self) -> None:
@@ -608,10 +603,12 @@ class VideoTabs(QWidget):
         if cont is None:
             return
         existing = self._widgets.get(name)
-        if existing is not None:
+        if existing is not None or name in self._starting:
             return
 
-        self._clear_container(cont)
+        # Building a widget sets up its decode pipeline and can re-enter here
+        # (layout/selection refreshes) before _widgets records it.
+        self._starting.add(name)
         try:
             widget_class = self._widget_class_for_stream(name)
             vw = widget_class(
@@ -620,20 +617,26 @@ class VideoTabs(QWidget):
                 autostart=self._stream_autostart_enabled(),
             )
         except Exception as e:
-            lay = cont.layout()
-            if lay is not None:
-                lbl = QLabel(f"Failed to start stream '{name}':\n{e}")
-                lbl.setObjectName("videoPanePlaceholder")
-                lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                lbl.setWordWrap(True)
-                lay.addWidget(lbl)
+            self._show_placeholder(name, f"Failed to start stream '{name}':\n{e}")
             self._widgets[name] = None
             return
+        finally:
+            self._starting.discard(name)
 
+        placeholder = self._placeholders.get(name)
+        if placeholder is not None:
+            placeholder.hide()
         lay = cont.layout()
         if lay is not None:
             lay.addWidget(vw)
         self._widgets[name] = vw
+        state_sig = getattr(vw, "stateChanged", None)
+        if state_sig is not None:
+            # Widget and tabs share the UI thread: relay without a queue hop.
+            state_sig.connect(
+                lambda state, stream=name: self.streamStateChanged.emit(stream, state),
+                Qt.ConnectionType.DirectConnection,
+            )
         if self._rov_link_status != "OK":
             self._apply_link_status_to_widget(vw)
         elif not self._tether_video_ready:
@@ -961,23 +964,31 @@ class VideoTabs(QWidget):
         if label is None:
             return
         label.setText(str(text))
-        if recording:
-            label.setStyleSheet("QLabel#captureStatusLabel { color: #ff4d4d; font-weight: bold; }")
-        else:
-            label.setStyleSheet("")
+        # Ticks every second while recording; restyle only on start/stop.
+        sheet = _CAPTURE_STATUS_RECORDING_STYLE if recording else ""
+        if label.styleSheet() != sheet:
+            label.setStyleSheet(sheet)
 
     def set_rov_link_status(self, status: str) -> None:
         status_key = str(status or "").strip().upper()
         if not status_key:
             status_key = "NO DATA"
+        # The main window reports the link on every status tick; widgets pick
+        # up the current status when created, so only transitions need a sync.
+        if status_key == self._rov_link_status:
+            return
         prev_effective = self._effective_link_status()
         self._rov_link_status = status_key
         self._sync_effective_link_status(previous_effective=prev_effective)
 
     def set_tether_status(self, ready: bool, message: str = "") -> None:
+        ready = bool(ready)
+        message = str(message or "")
+        if ready == self._tether_video_ready and message == self._tether_status_message:
+            return
         prev_effective = self._effective_link_status()
-        self._tether_video_ready = bool(ready)
-        self._tether_status_message = str(message or "")
+        self._tether_video_ready = ready
+        self._tether_status_message = message
         self._sync_effective_link_status(previous_effective=prev_effective)
 
     def stop_all(self) -> None:
@@ -152,6 +152,8 @@ class VideoWidget(QWidget):
       - Auto-retry connect and auto-recover from stalls
     """
 
+    stateChanged = pyqtSignal(str)  # waiting|connecting|playing|stalled
+
     def __init__(self, manager: RemoteCameraManager, stream_name: str, parent=None, *, autostart: bool = True):
         super().__init__(parent)
         self.manager = manager
@@ -250,6 +252,11 @@ class VideoWidget(QWidget):
             self.worker.correction = self._correction if enabled else None
 
     # --- public helpers for MainWindow / status bar ---
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            self._state = state
+            self.stateChanged.emit(state)
+
     def status(self) -> dict:
         age = None
         if self.last_frame_ts > 0:
@@ -303,7 +310,7 @@ class VideoWidget(QWidget):
         if self._connect_worker is not None and self._connect_worker.isRunning():
             return
 
-        self._state = "connecting"
+        self._set_state("connecting")
         self._show_message(f"{self.stream_name}\nConnecting...")
         self._connect_worker = _ConnectWorker(self.manager, self.stream_name, parent=self)
         self._connect_worker.connected.connect(self._on_connected)
@@ -317,7 +324,7 @@ class VideoWidget(QWidget):
         self.camera = cam_obj
         self._last_error = None
         self._retry_backoff_s = 0.5
-        self._state = "playing"
+        self._set_state("playing")
         self._connected_ts = time.time()
         self._rov_link_lost = False
 
@@ -349,7 +356,7 @@ class VideoWidget(QWidget):
 
     def _on_connect_failed(self, err: str):
         self._last_error = err
-        self._state = "waiting"
+        self._set_state("waiting")
 
         # Exponential backoff, capped
         self._retry_backoff_s = min(self._retry_backoff_s * 1.5, 5.0)
@@ -368,7 +375,7 @@ class VideoWidget(QWidget):
             self.worker = None
 
     def _restart_stream(self, message: str | None = None, *, retry_delay_s: float = 0.2):
-        self._state = "stalled"
+        self._set_state("stalled")
         # Clear timestamps so we don't immediately re-trigger stall before the
         # new pipeline produces its first frame.
         self.last_frame = None
@@ -29,12 +29,20 @@ class StreamRecorder:
     Writes newline-delimited JSON (jsonl) with an envelope: {t, stream, msg}.
     """
 
+    # Max queued events serialized into a single write.
+    WRITE_BATCH = 64
+    # Backlog bound; past it the oldest event is dropped so producers never block.
+    MAX_QUEUED = 10_000
+
     def __init__(self, out_path: Path):
         self.out_path = Path(out_path)
-        self._q: "queue.Queue[Optional[RecordEvent]]" = queue.Queue(maxsize=10_000)
+        # SimpleQueue puts are a C call with no Python-level Condition, which
+        # keeps record() cheap on the 30 Hz pilot send path.
+        self._q: "queue.SimpleQueue[Optional[RecordEvent]]" = queue.SimpleQueue()
         self._stop = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._fh = None
+        self.dropped = 0
 
     @staticmethod
     def make_session_dir(base_dir: str | os.PathLike = DEFAULT_RECORDINGS_DIR) -> Path:
@@ -52,15 +60,12 @@ class StreamRecorder:
 
     def start(self) -> None:
         self.out_path.parent.mkdir(parents=True, exist_ok=True)
-        self._fh = open(self.out_path, "a", buffering=1)  # line-buffered
+        self._fh = open(self.out_path, "a")  # flushed once per written batch
         self._thread.start()
 
     def stop(self, timeout_s: float = 2.0) -> None:
-        try:
-            self._q.put_nowait(None)
-        except Exception:
-            pass
         self._stop.set()
+        self._q.put(None)
         self._thread.join(timeout=timeout_s)
         if self._fh:
             try:
@@ -73,20 +78,40 @@ class StreamRecorder:
         if self._stop.is_set():
             return
         ev = RecordEvent(t=time.time(), stream=str(stream), msg=msg)
-        try:
-            self._q.put_nowait(ev)
-        except queue.Full:
-            # drop if overwhelmed (keeps UI/control responsive)
-            pass
+        if self._q.qsize() >= self.MAX_QUEUED:
+            # drop the oldest if overwhelmed (keeps UI/control responsive)
+            try:
+                self._q.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+        self._q.put(ev)
 
     def _run(self) -> None:
         assert self._fh is not None
-        while True:
-            ev = self._q.get()
-            if ev is None:
-                break
+        done = False
+        while not done:
+            batch = [self._q.get()]
+            while len(batch) < self.WRITE_BATCH:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for ev in batch:
+                if ev is None:
+                    done = True
+                    break
+                try:
+                    lines.append(json.dumps({"t": ev.t, "stream": ev.stream, "msg": ev.msg}) + "\n")
+                except Exception:
+                    # skip unserializable messages rather than losing the batch
+                    pass
+            if not lines:
+                continue
             try:
-                self._fh.write(json.dumps({"t": ev.t, "stream": ev.stream, "msg": ev.msg}) + "\n")
+                self._fh.write("".join(lines))
+                self._fh.flush()
             except Exception:
                 # ignore write errors to avoid crashing the app mid-mission
                 pass
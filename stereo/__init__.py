@@ -2,7 +2,7 @@
 
 from stereo.calibration import StereoCalibration, load_stereo_calibration, resolve_stereo_calibration_path
 from stereo.capture import StereoCaptureError, StereoCaptureSession, default_stereo_session_name
-from stereo.pairs import StereoPairConfig, load_stereo_pairs
+from stereo.pairs import StereoPairConfig, load_stereo_pairs, stereo_pairs_from_config
 
 __all__ = [
     "StereoCalibration",
@@ -13,4 +13,5 @@ __all__ = [
     "load_stereo_calibration",
     "load_stereo_pairs",
     "resolve_stereo_calibration_path",
+    "stereo_pairs_from_config",
 ]
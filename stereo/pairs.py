@@ -71,6 +71,11 @@ def load_stereo_pairs(config_path: str | Path, *, include_disabled: bool = False
     path = Path(config_path)
     with path.open("r", encoding="utf-8") as f:
         cfg = json.load(f)
+    return stereo_pairs_from_config(cfg, include_disabled=include_disabled)
+
+
+def stereo_pairs_from_config(cfg: dict[str, Any], *, include_disabled: bool = False) -> list[StereoPairConfig]:
+    """Build stereo pair definitions from an already-parsed streams config."""
 
     stream_names = {_clean_name(stream.get("name")) for stream in cfg.get("streams", [])}
     pairs = [_pair_from_dict(raw, stream_names) for raw in cfg.get("stereo_pairs", [])]
@@ -8,6 +8,7 @@ so the pilot UI can survive ROV restarts and tether interruptions.
 from __future__ import annotations
 
 import json
+import sys
 import threading
 import time
 from typing import Callable, Optional
@@ -17,6 +18,21 @@ import zmq
 from network.zmq_hotplug import apply_hotplug_opts
 
 
+def _intern_routing_keys(msg) -> None:
+    """Intern ``sensor``/``type`` so downstream dict lookups match by identity.
+
+    Both come from a small fixed set and key the display formatters and the
+    latest-per-(sensor, type) queues; freshly decoded strings would otherwise
+    be compared character by character on every lookup.
+    """
+    if not isinstance(msg, dict):
+        return
+    for key in ("sensor", "type"):
+        value = msg.get(key)
+        if type(value) is str:
+            msg[key] = sys.intern(value)
+
+
 class SensorSubscriberService:
     """Background ZMQ SUB that calls a callback for every sensor message.
 
@@ -28,6 +44,10 @@ class SensorSubscriberService:
 
     Note: ZMQ sockets are *thread-affine*. We create/use/close the socket in
     the background receiver thread.
+
+    Each parsed message is handed to ``on_message`` once and may be shared by
+    reference between consumers downstream: treat it as read-only, and build
+    a fresh dict at the call site if a consumer needs to change it.
     """
 
     def __init__(
@@ -126,7 +146,9 @@ class SensorSubscriberService:
         poller = zmq.Poller()
         poller.register(self._sock, zmq.POLLIN)
 
-        start_ts = time.time()
+        # Staleness is measured on the monotonic clock so an NTP step on the
+        # topside can't force (or mask) a reconnect.
+        start_ts = time.monotonic()
         last_rx = 0.0
         saw_any = False
 
@@ -135,7 +157,7 @@ class SensorSubscriberService:
                 events = dict(poller.poll(self.poll_ms))
                 if self._sock not in events:
                     # No message this tick; detect staleness and force a reconnect.
-                    now = time.time()
+                    now = time.monotonic()
                     if saw_any:
                         if (now - last_rx) > self.stale_reconnect_s:
                             old = self._sock
@@ -160,6 +182,7 @@ class SensorSubscriberService:
 
                 # Drain backlog. UI widgets coalesce later, while recorders can
                 # still see each received raw telemetry frame.
+                received = False
                 while True:
                     try:
                         raw = self._sock.recv(flags=zmq.NOBLOCK)
@@ -184,8 +207,8 @@ class SensorSubscriberService:
                             print("[sensor] bad json:", raw)
                         continue
 
-                    saw_any = True
-                    last_rx = time.time()
+                    received = True
+                    _intern_routing_keys(msg)
 
                     if self.on_message:
                         try:
@@ -198,6 +221,11 @@ class SensorSubscriberService:
                         msg_type = msg.get("type")
                         print(f"[sensor] {sensor}/{msg_type}: {msg}")
 
+                # One freshness stamp per drained batch, not per message.
+                if received:
+                    saw_any = True
+                    last_rx = time.monotonic()
+
             except zmq.ZMQError as e:
                 # Anything unexpected: recreate the socket.
                 if self.debug:
@@ -87,3 +87,37 @@ def test_pilot_max_gain_defaults_to_40_percent(monkeypatch):
     cfg = _reload_config(monkeypatch)
 
     assert cfg.PILOT_MAX_GAIN_DEFAULT == 0.4
+
+
+def test_config_reads_env_from_snapshot(monkeypatch):
+    monkeypatch.setenv("TRITON_CONTROLLER_INDEX", "2")
+    cfg = _reload_config(monkeypatch)
+    assert cfg.CONTROLLER_INDEX == 2
+
+    monkeypatch.setenv("TRITON_CONTROLLER_INDEX", "3")
+    assert cfg._ENV["TRITON_CONTROLLER_INDEX"] == "2"
+    cfg.refresh_env_cache()
+    assert cfg._ENV["TRITON_CONTROLLER_INDEX"] == "3"
+
+
+def test_controller_settings_are_parsed_lazily(monkeypatch):
+    monkeypatch.setenv("TRITON_CONTROLLER_AXIS_MAP", "0,1,3,4,2,5")
+    monkeypatch.setenv("TRITON_BACK_GRIPPER_GAIN_MAX", "0.9")
+    cfg = _reload_config(monkeypatch)
+
+    assert "CONTROLLER_AXIS_MAP" not in vars(cfg)
+    assert cfg.CONTROLLER_AXIS_MAP == [0, 1, 3, 4, 2, 5]
+    assert cfg.T200_WRIST_GAIN_MAX == 0.9
+    assert "CONTROLLER_AXIS_MAP" in dir(cfg)
+
+    monkeypatch.setenv("TRITON_CONTROLLER_AXIS_MAP", "auto")
+    cfg.refresh_env_cache()
+    assert cfg.CONTROLLER_AXIS_MAP is None
+
+
+def test_mode_default_flags_treat_empty_value_as_off(monkeypatch):
+    monkeypatch.setenv("TRITON_CURRENT_BUDGET_DEFAULT", "")
+    monkeypatch.setenv("TRITON_DEPTH_HOLD_DEFAULT", "on")
+    cfg = _reload_config(monkeypatch)
+    assert cfg.CURRENT_BUDGET_DEFAULT is False
+    assert cfg.DEPTH_HOLD_DEFAULT is False
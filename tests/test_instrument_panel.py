@@ -0,0 +1,124 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtWidgets import QApplication
+
+from gui.instruments import InstrumentPanel
+
+
+def _app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_instrument_panel_dispatches_sensor_messages_by_type():
+    app = _app()
+    panel = InstrumentPanel()
+    try:
+        panel.update_from_sensor(
+            {"type": "external_depth", "depth_m": 2.5, "temperature_c": 11.0, "pressure_mbar": 1250.0}
+        )
+        assert panel.depth_gauge.value == pytest.approx(2.5)
+        assert panel.depth_meta.text() == "1250 mbar | 11.0 C"
+
+        panel.update_from_sensor({"type": "leak", "leak": True})
+        assert panel.leak_lbl.text() == "Leak: DETECTED"
+        sheets = []
+        panel.leak_lbl.setStyleSheet = sheets.append
+        panel.update_from_sensor({"type": "leak", "leak": True})
+        assert sheets == []  # unchanged state keeps the applied sheet
+
+        panel.update_from_sensor({"type": "external_depth", "error": "i2c timeout"})
+        assert panel.depth_gauge.value is None
+        assert panel.depth_meta.text() == "i2c timeout"
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_instrument_panel_ignores_empty_and_unknown_messages():
+    app = _app()
+    panel = InstrumentPanel()
+    try:
+        panel.update_from_sensor({})
+        panel.update_from_sensor(None)
+        panel.update_from_sensor({"type": "power", "voltage_v": 12.0})
+        panel.update_from_sensor({"type": "mystery"})
+        assert panel.depth_meta.text() == "-"
+        assert panel.leak_lbl.text() == "Leak: unknown"
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_instrument_panel_coalesces_env_updates_onto_flush_timer():
+    app = _app()
+    panel = InstrumentPanel()
+    try:
+        panel.update_from_sensor({"type": "env", "temperature_c": 20.0, "pressure_kpa": 101.3})
+        panel.update_from_sensor({"type": "env", "temperature_c": 21.5, "pressure_kpa": 101.4})
+        assert panel.temp_bar.format() == "Temp: -"
+        assert panel._env_flush_timer.isActive()
+
+        panel._env_flush_timer.stop()
+        panel._flush_env()
+        assert panel.temp_bar.format() == "Temp: 21.5 C  |  101.4 kPa"
+        assert panel.temp_bar.value() == 315
+
+        panel.update_from_sensor({"type": "env", "temperature_c": 21.5})
+        panel._env_flush_timer.stop()
+        panel._flush_env()
+        assert panel.temp_bar.format() == "Temp: 21.5 C"
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_depth_gauge_reuses_chrome_pixmap_until_resized():
+    app = _app()
+    panel = InstrumentPanel()
+    try:
+        gauge = panel.depth_gauge
+        gauge.resize(100, 150)
+        gauge.set_value(2.0)
+        gauge.grab()
+        chrome = gauge._chrome_pix
+        assert chrome is not None
+
+        gauge.set_value(5.0)
+        gauge.grab()
+        assert gauge._chrome_pix is chrome
+
+        gauge.resize(120, 150)
+        gauge.grab()
+        assert gauge._chrome_pix is not chrome
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_depth_gauge_skips_repaint_for_sub_display_changes():
+    app = _app()
+    panel = InstrumentPanel()
+    try:
+        gauge = panel.depth_gauge
+        requests = []
+        gauge._repaint.request = lambda: requests.append(gauge.value)
+        gauge.set_value(2.501, secondary="11.0 C")
+        gauge.set_value(2.503, secondary="11.0 C")
+        gauge.set_value(2.5049, secondary="11.0 C")
+        assert requests == [pytest.approx(2.5)]
+        gauge.set_value(2.512, secondary="11.0 C")
+        gauge.set_value(2.512, secondary="11.1 C")
+        gauge.set_value(None, state_text="ERR")
+        assert requests == [pytest.approx(2.5), pytest.approx(2.51), pytest.approx(2.51), None]
+    finally:
+        panel.deleteLater()
+        app.processEvents()
@@ -1,5 +1,8 @@
 ﻿import os
 import json
+import socket
+import threading
+import sys
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -213,6 +216,7 @@ class _FakeRemoteCameraManager:
     ]
 
     def __init__(self, _path):
+        self.config = json.loads(Path(_path).read_text(encoding="utf-8"))
         self.stream_defs = {
             "Primary Camera": {"name": "Primary Camera", "width": 1920, "height": 1080, "fps": 30, "video_format": "h264", "port": 5000},
             "Aux Camera": {"name": "Aux Camera", "width": 1920, "height": 1080, "fps": 30, "video_format": "h264", "port": 5002},
@@ -1266,7 +1270,7 @@ def test_heartbeat_loss_and_recovery_notify_video_panel(monkeypatch, tmp_path):
     streams_path.write_text("{}", encoding="utf-8")
 
     now = {"value": 1_000.0}
-    monkeypatch.setattr(main_window.time, "time", lambda: now["value"])
+    monkeypatch.setattr(main_window.time, "monotonic", lambda: now["value"])
     monkeypatch.setattr(main_window, "QSettings", lambda *args, **kwargs: _FakeSettings())
     monkeypatch.setattr(main_window, "PilotPublisherService", _FakePilotService)
     monkeypatch.setattr(main_window, "SensorSubscriberService", _FakeSensorService)
@@ -1285,16 +1289,61 @@ def test_heartbeat_loss_and_recovery_notify_video_panel(monkeypatch, tmp_path):
         win._handle_sensor_msg_on_ui({"type": "heartbeat", "sensor": "heartbeat", "armed": False})
         win._update_link_status()
         assert panel.rov_link_statuses[-1] == "OK"
+        drawn = len(panel.rov_link_statuses)
+        now["value"] += 0.2
+        win._update_link_status()  # no new telemetry and < 1 s since the last draw
+        assert len(panel.rov_link_statuses) == drawn
 
         now["value"] += 6.0
         win._update_link_status()
         assert panel.rov_link_statuses[-1] == "LOST"
+        win._flush_status()
         assert "Heartbeat: LOST" in win._link_lbl.text()
+        assert "font-weight: bold" in win._link_lbl.styleSheet()
 
         now["value"] += 0.1
         win._handle_sensor_msg_on_ui({"type": "heartbeat", "sensor": "heartbeat", "armed": False})
         win._update_link_status()
         assert panel.rov_link_statuses[-1] == "OK"
+        assert win._link_lbl.styleSheet() == main_window._LINK_STATUS_STYLES["OK"]
+    finally:
+        win.close()
+        app.processEvents()
+
+
+def test_video_status_poll_redraws_on_every_tick(monkeypatch, tmp_path):
+    app = _app()
+    streams_path = tmp_path / "streams.json"
+    streams_path.write_text("{}", encoding="utf-8")
+
+    now = {"value": 1_000.0}
+    monkeypatch.setattr(main_window.time, "monotonic", lambda: now["value"])
+    monkeypatch.setattr(main_window, "QSettings", lambda *args, **kwargs: _FakeSettings())
+    monkeypatch.setattr(main_window, "PilotPublisherService", _FakePilotService)
+    monkeypatch.setattr(main_window, "SensorSubscriberService", _FakeSensorService)
+    monkeypatch.setattr(main_window, "RemoteCameraManager", _FakeRemoteCameraManager)
+    monkeypatch.setattr(main_window, "VideoTabs", _FakeVideoPanel)
+    monkeypatch.setattr(main_window, "HoldTestPanel", _SimplePage)
+    monkeypatch.setattr(main_window, "ManagementPage", _SimplePage)
+    monkeypatch.setattr(main_window.threading, "Thread", _NoopThread)
+
+    win = main_window.MainWindow(str(streams_path))
+    try:
+        app.processEvents()
+        vw = win.video_panel.current_video_widget()
+        assert vw is not None
+        age = {"value": 0.4}
+        vw.status = lambda: {"state": "playing", "age_s": age["value"]}
+        interval = win._video_status_min_interval_s
+        assert win._video_status_timer.interval() == int(interval * 1000)
+
+        # Coarse timers may fire a little early; each tick must still redraw.
+        for expected in ("age=1.4s", "age=2.4s"):
+            now["value"] += interval * 0.999
+            age["value"] += 1.0
+            win._poll_video_status()
+            win._flush_status()
+            assert expected in win._video_lbl.text()
     finally:
         win.close()
         app.processEvents()
@@ -1421,6 +1470,12 @@ def test_arm_disarm_backup_controls_queue_menu_edge(monkeypatch, tmp_path):
         assert win._arm_disarm_btn.text() == "Disarm (O)"
         assert win.pilot_svc.arm_inputs_enabled_calls[-1] is True
         assert len(win.pilot_svc.arm_snap_to_park_calls) == snap_count
+
+        polishes = []
+        monkeypatch.setattr(win._arm_disarm_btn, "setText", lambda text: polishes.append(text))
+        win._handle_sensor_msg_on_ui({"type": "heartbeat", "sensor": "heartbeat", "armed": True})
+        win._refresh_arm_disarm_button()
+        assert polishes == []  # same armed state: button left alone
     finally:
         win.close()
         app.processEvents()
@@ -1823,6 +1878,161 @@ def test_set_stream_mirror_skips_noop_updates():
     assert rov.updates[-1]["extra"]["udp_mirror_ports"] == [53112]
 
 
+def test_status_labels_are_staged_and_flushed_together(monkeypatch, tmp_path):
+    app = _app()
+    streams_path = tmp_path / "streams.json"
+    streams_path.write_text("{}", encoding="utf-8")
+
+    monkeypatch.setattr(main_window, "QSettings", lambda *args, **kwargs: _FakeSettings())
+    monkeypatch.setattr(main_window, "PilotPublisherService", _FakePilotService)
+    monkeypatch.setattr(main_window, "SensorSubscriberService", _FakeSensorService)
+    monkeypatch.setattr(main_window, "RemoteCameraManager", _FakeRemoteCameraManager)
+    monkeypatch.setattr(main_window, "VideoTabs", _FakeVideoPanel)
+    monkeypatch.setattr(main_window, "HoldTestPanel", _SimplePage)
+    monkeypatch.setattr(main_window, "ManagementPage", _SimplePage)
+    monkeypatch.setattr(main_window.threading, "Thread", _NoopThread)
+
+    win = main_window.MainWindow(str(streams_path))
+    try:
+        app.processEvents()
+        win._flush_status()
+        for volts in (12.0, 12.5, 13.0):
+            win._handle_sensor_msg_on_ui({"type": "power", "sensor": "power", "voltage_v": volts, "current_a": 1.0})
+        assert win._power_lbl.text() == "Power: -"
+        assert len(win._pending_status) == 1
+
+        win._flush_status()
+        assert win._power_lbl.text() == "Power: 13.00V 1.00A 13W"
+        assert win._power_lbl.toolTip() == win._power_lbl.text()
+        assert win._pending_status == {}
+    finally:
+        win.close()
+        app.processEvents()
+
+
+def test_sensor_thread_wakes_ui_timer_once_per_batch(monkeypatch, tmp_path):
+    app = _app()
+    streams_path = tmp_path / "streams.json"
+    streams_path.write_text("{}", encoding="utf-8")
+
+    monkeypatch.setattr(main_window, "QSettings", lambda *args, **kwargs: _FakeSettings())
+    monkeypatch.setattr(main_window, "PilotPublisherService", _FakePilotService)
+    monkeypatch.setattr(main_window, "SensorSubscriberService", _FakeSensorService)
+    monkeypatch.setattr(main_window, "RemoteCameraManager", _FakeRemoteCameraManager)
+    monkeypatch.setattr(main_window, "VideoTabs", _FakeVideoPanel)
+    monkeypatch.setattr(main_window, "HoldTestPanel", _SimplePage)
+    monkeypatch.setattr(main_window, "ManagementPage", _SimplePage)
+    monkeypatch.setattr(main_window.threading, "Thread", _NoopThread)
+
+    win = main_window.MainWindow(str(streams_path))
+    try:
+        app.processEvents()
+        win._flush_sensor_ui()
+        win._flush_sensor_ui()
+        assert not win._sensor_ui_timer.isActive()
+        assert not win._sensor_panel_timer.isActive()
+
+        wakes = []
+        win.sensor_batch_sig.connect(lambda: wakes.append(1))
+        for temp in (10.0, 11.0):
+            win._queue_sensor_msg_from_thread({"type": "env", "sensor": "bme280", "temperature_c": temp})
+        win._queue_sensor_msg_from_thread({"type": "leak", "sensor": "leak", "leak": False})
+        assert wakes == [1]
+        assert win._sensor_ui_timer.isActive()
+        win._flush_sensor_ui()
+        assert win._sensor_panel_timer.isActive()
+    finally:
+        win.close()
+        app.processEvents()
+
+
+def test_save_dir_action_fires_its_bound_slot(monkeypatch, tmp_path):
+    app = _app()
+    streams_path = tmp_path / "streams.json"
+    streams_path.write_text("{}", encoding="utf-8")
+
+    dialogs = []
+
+    def _get_existing_directory(_parent, caption, _start_dir):
+        dialogs.append(caption)
+        return ""
+
+    monkeypatch.setattr(main_window, "QSettings", lambda *args, **kwargs: _FakeSettings())
+    monkeypatch.setattr(main_window, "PilotPublisherService", _FakePilotService)
+    monkeypatch.setattr(main_window, "SensorSubscriberService", _FakeSensorService)
+    monkeypatch.setattr(main_window, "RemoteCameraManager", _FakeRemoteCameraManager)
+    monkeypatch.setattr(main_window, "VideoTabs", _FakeVideoPanel)
+    monkeypatch.setattr(main_window, "HoldTestPanel", _SimplePage)
+    monkeypatch.setattr(main_window, "ManagementPage", _SimplePage)
+    monkeypatch.setattr(main_window.threading, "Thread", _NoopThread)
+    monkeypatch.setattr(
+        main_window,
+        "QFileDialog",
+        SimpleNamespace(getExistingDirectory=_get_existing_directory),
+    )
+
+    win = main_window.MainWindow(str(streams_path))
+    try:
+        # Use the window's own reference; findChildren wrappers outliving
+        # close() destabilise later windows in this module.
+        win._save_dir_act.trigger()
+        assert dialogs == ["Choose recordings folder"]
+    finally:
+        win.close()
+        app.processEvents()
+
+
+def test_sensor_table_gets_newest_sample_per_key_in_one_batch(monkeypatch, tmp_path):
+    app = _app()
+    streams_path = tmp_path / "streams.json"
+    streams_path.write_text("{}", encoding="utf-8")
+
+    monkeypatch.setattr(main_window, "QSettings", lambda *args, **kwargs: _FakeSettings())
+    monkeypatch.setattr(main_window, "PilotPublisherService", _FakePilotService)
+    monkeypatch.setattr(main_window, "SensorSubscriberService", _FakeSensorService)
+    monkeypatch.setattr(main_window, "RemoteCameraManager", _FakeRemoteCameraManager)
+    monkeypatch.setattr(main_window, "VideoTabs", _FakeVideoPanel)
+    monkeypatch.setattr(main_window, "HoldTestPanel", _SimplePage)
+    monkeypatch.setattr(main_window, "ManagementPage", _SimplePage)
+    monkeypatch.setattr(main_window.threading, "Thread", _NoopThread)
+
+    win = main_window.MainWindow(str(streams_path))
+    try:
+        app.processEvents()
+        batches = []
+        monkeypatch.setattr(win.sensor_panel, "upsert_sensor_batch", lambda msgs: batches.append(list(msgs)))
+        visible = {"value": False}
+        monkeypatch.setattr(win.sensor_panel, "isVisible", lambda: visible["value"])
+        for temp in (10.0, 11.0, 12.0):
+            win._queue_sensor_msg_from_thread({"type": "env", "sensor": "bme280", "temperature_c": temp})
+        win._queue_sensor_msg_from_thread({"type": "leak", "sensor": "leak", "leak": False})
+
+        win._flush_sensor_ui()
+        assert batches == []
+        assert win._sensor_thread_pending == {}
+        win._queue_sensor_msg_from_thread({"type": "env", "sensor": "bme280", "temperature_c": 13.0})
+        win._flush_sensor_ui()
+
+        win._flush_sensor_panel()
+        assert batches == []  # table not on screen (video layout): hold the samples
+
+        # Telemetry has gone quiet, so only showing the table re-arms the flush.
+        win._sensor_panel_timer.stop()
+        visible["value"] = True
+        app.sendEvent(win.sensor_panel, QEvent(QEvent.Type.Show))
+        assert win._sensor_panel_timer.isActive()
+        win._flush_sensor_panel()
+        assert len(batches) == 1
+        assert [m["type"] for m in batches[0]] == ["env", "leak"]
+        assert batches[0][0]["temperature_c"] == 13.0
+
+        win._flush_sensor_panel()
+        assert len(batches) == 1
+    finally:
+        win.close()
+        app.processEvents()
+
+
 def test_depth_hold_status_uses_rov_runtime_target(monkeypatch, tmp_path):
     app = _app()
     streams_path = tmp_path / "streams.json"
@@ -1866,3 +2076,558 @@ def test_depth_hold_status_uses_rov_runtime_target(monkeypatch, tmp_path):
     finally:
         win.close()
         app.processEvents()
+
+
+def test_route_cache_uses_netlink_handle_when_available():
+    class _Msg:
+        def __init__(self, **attrs):
+            self._attrs = attrs
+
+        def get_attr(self, name):
+            return self._attrs.get(name)
+
+    link_lookups = []
+
+    class _FakeIPRoute:
+        def route(self, cmd, dst):
+            assert (cmd, dst) == ("get", "192.168.1.4")
+            return [_Msg(RTA_OIF=3, RTA_PREFSRC="192.168.1.2")]
+
+        def get_links(self, index):
+            assert index == 3
+            link_lookups.append(index)
+            return [_Msg(IFLA_IFNAME="eth0")]
+
+    stub = SimpleNamespace(
+        _netlink_ipr=_FakeIPRoute(),
+        _rov_host="192.168.1.4",
+        _route_cache={"ts": 0.0, "iface": None, "src_ip": None, "is_wifi": None, "err": None},
+        _route_watch=None,
+        _ifname_cache={},
+        _iface_is_wifi_linux=lambda iface: False,
+    )
+    assert main_window.MainWindow._route_cache_from_netlink(stub) is True
+    assert stub._route_cache["iface"] == "eth0"
+    assert stub._route_cache["src_ip"] == "192.168.1.2"
+    assert stub._route_cache["is_wifi"] is False
+
+    # Without a running monitor the interface name is looked up every time;
+    # with one, the cached name is reused until the next netlink event.
+    main_window.MainWindow._route_cache_from_netlink(stub)
+    assert len(link_lookups) == 2
+    stub._route_watch = object()
+    main_window.MainWindow._route_cache_from_netlink(stub)
+    main_window.MainWindow._route_cache_from_netlink(stub)
+    assert len(link_lookups) == 2
+    assert stub._route_cache["iface"] == "eth0"
+
+    stub._netlink_ipr = False
+    assert main_window.MainWindow._route_cache_from_netlink(stub) is False
+
+
+def test_network_status_skips_rebuild_until_inputs_change(monkeypatch):
+    now = {"value": 500.0}
+    monkeypatch.setattr(main_window.time, "monotonic", lambda: now["value"])
+    texts = []
+    stub = SimpleNamespace(
+        _route_cache={"ts": 500.0, "iface": "eth0", "src_ip": "192.168.1.2", "is_wifi": False},
+        _last_net={"iface": "eth0", "is_tether": True, "link": {"kind": "ethernet", "state": "up"}},
+        _last_net_text="rov=eth0 ethernet up - | rx=- tx=-",
+        _last_net_ts=499.5,
+        _net_last_key=None,
+        _net_lbl=None,
+        _netdiag=main_window._NetDiagSnap(),
+        _rtt_part_cache=None,
+        _refresh_route_cache=lambda: None,
+        _route_cache_stale=lambda now: False,
+        _queue_status=lambda _lbl, text: texts.append(text),
+    )
+    main_window.MainWindow._update_network_status(stub)
+    main_window.MainWindow._update_network_status(stub)
+    assert len(texts) == 1
+    assert texts[0].startswith("Net: local=eth0 | rov=eth0 ethernet up")
+
+    now["value"] += 3.0  # remote stats age out -> redraw without them
+    main_window.MainWindow._update_network_status(stub)
+    assert len(texts) == 2
+    assert "rov=- - - -" in texts[1]
+
+    before = stub._netdiag
+    main_window.MainWindow._update_netdiag_snapshot(stub, ts=now["value"], ok=True, last_rtt_ms=1.25, loss_pct=0.0)
+    assert before.ts == 0.0  # readers holding the old snapshot never see it change
+    main_window.MainWindow._update_network_status(stub)
+    assert len(texts) == 3
+    assert texts[2].endswith("| probe:rtt=1.2ms loss=0%")
+
+    # Same probe snapshot: the route change redraws without re-formatting it.
+    monkeypatch.setattr(main_window, "_netdiag_probe_text", lambda nd: pytest.fail("probe text re-formatted"))
+    stub._route_cache = {"ts": now["value"], "iface": "wlan0", "src_ip": None, "is_wifi": True}
+    stub._last_net_ts = now["value"]
+    main_window.MainWindow._update_network_status(stub)
+    assert texts[3] == (
+        "Net: local=wlan0(wifi) | rov=eth0 ethernet up - | rx=- tx=- "
+        "| probe:rtt=1.2ms loss=0% | WARN local route via Wi-Fi"
+    )
+    assert stub._rtt_part_cache == (stub._netdiag, "probe:rtt=1.2ms loss=0%")
+
+
+def test_remote_net_text_lists_ip_and_default_route():
+    remote = {
+        "iface": "eth0",
+        "ip": "192.168.1.4",
+        "link": {"kind": "ethernet", "state": "up", "speed_mbps": 100},
+        "default_iface": "wlan0",
+        "default_is_wifi": True,
+        "selection_reason": "tether",
+        "rx_bps": 1000,
+    }
+    assert main_window._remote_net_text(remote) == (
+        "rov=eth0 ethernet up 100Mbps ip=192.168.1.4 (def=wlan0/wifi, tether) | rx=8.0Kb/s tx=-"
+    )
+
+
+def test_route_cache_parses_ip_route_get_output(monkeypatch):
+    monkeypatch.setattr(
+        main_window.subprocess,
+        "check_output",
+        lambda *args, **kwargs: "192.168.1.4 dev eth0 src 192.168.1.2 uid 1000\n    cache\n",
+    )
+    stub = SimpleNamespace(
+        _netlink_ipr=False,
+        _rov_host="192.168.1.4",
+        _route_cache={},
+        _iface_is_wifi_linux=lambda iface: iface.startswith("wl"),
+    )
+    stub._route_cache_from_netlink = lambda: main_window.MainWindow._route_cache_from_netlink(stub)
+    main_window.MainWindow._refresh_route_cache(stub)
+    assert stub._route_cache["iface"] == "eth0"
+    assert stub._route_cache["src_ip"] == "192.168.1.2"
+    assert stub._route_cache["is_wifi"] is False
+
+
+def test_route_cache_falls_back_to_udp_source_when_ip_is_missing(monkeypatch):
+    def _no_ip(*args, **kwargs):
+        raise FileNotFoundError("ip")
+
+    class _FakeSocket:
+        def __init__(self, *args):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def connect(self, addr):
+            pass
+
+        def getsockname(self):
+            return ("192.168.1.2", 40000)
+
+    monkeypatch.setattr(main_window.subprocess, "check_output", _no_ip)
+    monkeypatch.setattr(main_window.socket, "socket", _FakeSocket)
+    stub = SimpleNamespace(_rov_host="192.168.1.4", _route_cache={}, _route_cache_from_netlink=lambda: False)
+    main_window.MainWindow._refresh_route_cache(stub)
+    assert stub._route_cache["iface"] is None
+    assert stub._route_cache["src_ip"] == "192.168.1.2"
+    assert stub._route_cache["err"] == "ip"
+
+
+def test_route_cache_with_netlink_monitor_refreshes_only_when_dirty():
+    stub = SimpleNamespace(
+        _route_cache={"ts": 100.0},
+        _route_watch=None,
+        _route_dirty=False,
+    )
+    stale = main_window.MainWindow._route_cache_stale
+    assert stale(stub, 101.0) is False
+    assert stale(stub, 103.0) is True  # no monitor: plain 2 s polling
+
+    stub._route_watch = object()
+    assert stale(stub, 103.0) is False
+    stub._route_dirty = True
+    assert stale(stub, 103.0) is True
+    stub._route_dirty = False
+    assert stale(stub, 100.0 + main_window._ROUTE_BACKSTOP_S + 1.0) is True
+
+
+def test_wifi_check_stats_sysfs_once_per_interface(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main_window.os.path, "isdir", lambda path: calls.append(path) or "wlan0" in path)
+    stub = SimpleNamespace(_wifi_cache={})
+    is_wifi = main_window.MainWindow._iface_is_wifi_linux
+    assert is_wifi(stub, "wlan0") is True
+    assert is_wifi(stub, "wlan0") is True
+    assert len(calls) == 1
+
+    assert is_wifi(stub, "eth0") is False
+    assert stub._wifi_cache == {"eth0": False}
+    assert len(calls) == 2
+
+
+def test_route_watch_drops_interface_caches_on_netlink_events(monkeypatch):
+    stub = SimpleNamespace(_route_watch=None, _route_dirty=False, _ifname_cache={}, _wifi_cache={})
+
+    class _FakeMonitor:
+        def __init__(self):
+            self.events = 2
+
+        def bind(self, groups):
+            pass
+
+        def get(self):
+            if self.events == 1:
+                assert stub._wifi_cache == {}
+                stub._wifi_cache["wlan0"] = True
+                stub._ifname_cache[3] = "wlan0"
+                stub._route_dirty = False
+            elif self.events == 0:
+                stub._route_watch = None
+                return []
+            self.events -= 1
+            return [{"event": "RTM_NEWLINK"}]
+
+        def close(self):
+            pass
+
+    rtnl = SimpleNamespace(RTMGRP_LINK=1, RTMGRP_IPV4_IFADDR=2, RTMGRP_IPV4_ROUTE=4)
+    monkeypatch.setitem(sys.modules, "pyroute2", SimpleNamespace(IPRoute=_FakeMonitor))
+    monkeypatch.setitem(sys.modules, "pyroute2.netlink", SimpleNamespace(rtnl=rtnl))
+    monkeypatch.setitem(sys.modules, "pyroute2.netlink.rtnl", rtnl)
+    stub._wifi_cache["eth0"] = False
+
+    main_window.MainWindow._route_watch_loop(stub)
+    assert stub._wifi_cache == {}
+    assert stub._ifname_cache == {}
+    assert stub._route_dirty is True
+
+
+def test_sensor_thread_preformats_depth_and_net_status_text(monkeypatch, tmp_path):
+    app = _app()
+    streams_path = tmp_path / "streams.json"
+    streams_path.write_text("{}", encoding="utf-8")
+
+    monkeypatch.setattr(main_window, "QSettings", lambda *args, **kwargs: _FakeSettings())
+    monkeypatch.setattr(main_window, "PilotPublisherService", _FakePilotService)
+    monkeypatch.setattr(main_window, "SensorSubscriberService", _FakeSensorService)
+    monkeypatch.setattr(main_window, "RemoteCameraManager", _FakeRemoteCameraManager)
+    monkeypatch.setattr(main_window, "VideoTabs", _FakeVideoPanel)
+    monkeypatch.setattr(main_window, "HoldTestPanel", _SimplePage)
+    monkeypatch.setattr(main_window, "ManagementPage", _SimplePage)
+    monkeypatch.setattr(main_window.threading, "Thread", _NoopThread)
+
+    win = main_window.MainWindow(str(streams_path))
+    try:
+        app.processEvents()
+        win._queue_sensor_msg_from_thread(
+            {"type": "external_depth", "sensor": "bar30", "depth_m": 1.5, "pressure_mbar": 1150.0}
+        )
+        win._queue_sensor_msg_from_thread(
+            {"type": "net", "sensor": "network", "iface": "eth0", "rx_bps": 1000, "link": {"kind": "ethernet"}}
+        )
+        pending = win._sensor_thread_pending
+        assert pending[("bar30", "external_depth")]["_display"] == "Depth: bar30 1.50m 1150mbar"
+        assert pending[("network", "net")]["_display"] == "rov=eth0 ethernet - - | rx=8.0Kb/s tx=-"
+
+        win._flush_sensor_ui()
+        win._flush_status()
+        assert win._depth_lbl.text() == "Depth: bar30 1.50m 1150mbar"
+        assert win._last_net_text == "rov=eth0 ethernet - - | rx=8.0Kb/s tx=-"
+        assert "_display" not in win._last_net
+        assert all("_display" not in msg for msg in win._sensor_panel_pending.values())
+    finally:
+        win.close()
+        app.processEvents()
+
+
+def test_pilot_status_burst_is_handled_once_with_newest_status():
+    handled = []
+    wakes = []
+    stub = SimpleNamespace(
+        _pilot_status_lock=threading.Lock(),
+        _pilot_status_pending=None,
+        pilot_status_sig=SimpleNamespace(emit=lambda: wakes.append(1)),
+        _handle_pilot_status_on_ui=handled.append,
+    )
+    for reverse in (True, False, True):
+        main_window.MainWindow._on_pilot_status_from_thread(stub, {"controller": "connected", "reverse": reverse})
+    assert wakes == [1]
+
+    main_window.MainWindow._drain_pilot_status(stub)
+    main_window.MainWindow._drain_pilot_status(stub)
+    assert handled == [{"controller": "connected", "reverse": True}]
+
+
+def test_pilot_messages_queue_in_order_behind_one_wake():
+    handled = []
+    wakes = []
+    stub = SimpleNamespace(
+        _stream_recorder=None,
+        _pilot_msg_lock=threading.Lock(),
+        _pilot_msg_pending=[],
+        pilot_msg_sig=SimpleNamespace(emit=lambda: wakes.append(1)),
+        _handle_pilot_msg_on_ui=handled.append,
+    )
+    msgs = [{"edges": {"x": "down"}}, {"edges": {}}, {"edges": {"b": "down"}}]
+    for msg in msgs:
+        main_window.MainWindow._on_pilot_msg_from_thread(stub, msg)
+    assert wakes == [1]
+
+    main_window.MainWindow._drain_pilot_msgs(stub)
+    main_window.MainWindow._drain_pilot_msgs(stub)
+    assert handled == msgs
+
+    main_window.MainWindow._on_pilot_msg_from_thread(stub, {"edges": {}})
+    assert wakes == [1, 1]
+
+
+def test_bit_rate_text_is_cached_on_displayed_precision():
+    main_window._format_rate.cache_clear()
+    assert main_window._bps_text(1_543_210.0) == "12.35Mb/s"
+    assert main_window._bps_text(1_543_190.0) == "12.35Mb/s"
+    assert main_window._format_rate.cache_info().hits == 1
+    assert main_window._bps_text(100.0) == "800b/s"
+    assert main_window._bps_text(1500) == "12.0Kb/s"
+    assert main_window._bps_text(250_000_000) == "2.00Gb/s"
+    assert main_window._bps_text(None) == "-"
+    assert main_window._bps_text(-1) == "-"
+    assert main_window._bps_text("1000") == "-"
+    assert main_window._bps_text(0) == "0b/s"
+
+
+def test_ip_route_get_output_is_parsed_in_one_pass():
+    parse = main_window._parse_ip_route_get
+    assert parse("192.168.1.4 dev eth0 src 192.168.1.2 uid 1000") == ("eth0", "192.168.1.2")
+    assert parse("192.168.1.4 via 10.0.0.1 dev wlan0 src 10.0.0.7 uid 0\n    cache") == ("wlan0", "10.0.0.7")
+    assert parse("local 127.0.0.1 dev lo table local src 127.0.0.1") == ("lo", "127.0.0.1")
+    assert parse("192.168.1.4 dev") == (None, None)
+    assert parse("") == (None, None)
+
+
+def test_sensor_ui_flush_drains_fifo_within_batch_cap():
+    seen = []
+    panel = SimpleNamespace(update_from_sensor=lambda msg: seen.append(msg["type"]))
+    stops = []
+    panel_starts = []
+    stub = SimpleNamespace(
+        _sensor_ui_pending={},
+        _sensor_ui_max_batch=2,
+        _sensor_thread_pending={},
+        _sensor_panel_pending={},
+        _sensor_ui_timer=SimpleNamespace(isActive=lambda: True, stop=lambda: stops.append(1)),
+        _sensor_panel_timer=SimpleNamespace(
+            isActive=lambda: bool(panel_starts), start=lambda: panel_starts.append(1)
+        ),
+        _drain_sensor_thread_msgs=lambda: None,
+        pilot_telemetry_column=panel,
+        instrument_panel=SimpleNamespace(update_from_sensor=lambda msg: None),
+        hold_test_panel=SimpleNamespace(update_from_sensor=lambda msg: None),
+        raw_sensor_page=SimpleNamespace(update_from_sensor=lambda msg: None),
+    )
+    stub._wake_sensor_ui = lambda: None
+    for typ in ("env", "leak", "power"):
+        main_window.MainWindow._queue_sensor_ui_msg(stub, {"sensor": "s", "type": typ})
+
+    main_window.MainWindow._flush_sensor_ui(stub)
+    assert seen == ["env", "leak"]
+    assert stops == []
+    main_window.MainWindow._flush_sensor_ui(stub)
+    assert seen == ["env", "leak", "power"]
+    assert stops == [1]
+    assert panel_starts == [1]
+    assert stub._sensor_ui_pending == {}
+
+
+def test_depth_and_power_readouts_use_precompiled_templates():
+    depth = main_window._depth_status_text
+    assert depth({"sensor": "bar30", "depth_m": 1.5}) == "Depth: bar30 1.50m"
+    assert depth({"sensor": "bar30", "depth_m": 1.5, "temperature_c": 9.04}) == "Depth: bar30 1.50m 9.0C"
+    assert (
+        depth({"sensor": "bar30", "depth_m": 1.5, "pressure_mbar": 1150.2, "temperature_c": 9.0})
+        == "Depth: bar30 1.50m 1150mbar 9.0C"
+    )
+    assert depth({"sensor": "bar30", "depth_m": "bad"}) == "Depth: bar30 -"
+
+    power = main_window._power_status_text
+    assert power({"voltage_v": 13.0, "current_a": 1.0}) == "Power: 13.00V 1.00A 13W"
+    assert power({"voltage_v": 13.0, "current_a": 1.0, "power_w": 12.4, "ok": False}) == "Power: 13.00V 1.00A 12W (check)"
+    assert power({"voltage_v": 13.0, "current_a": 1.0, "held": True, "ok": False}) == "Power: 13.00V 1.00A 13W (hold)"
+    assert power({"error": "i2c"}) == "Power: (ERR)"
+    assert power({"voltage_v": "bad"}) == "Power: -"
+
+
+def test_rtt_stats_track_ema_and_windowed_loss():
+    stats = main_window._RttStats(4)
+    assert stats.stats() == (None, None, None)
+    stats.push(10.0)
+    assert stats.stats() == (10.0, None, 0.0)
+    stats.push(None)
+    stats.push(20.0)
+    avg, jitter, loss = stats.stats()
+    assert avg == pytest.approx(11.0)
+    assert jitter == pytest.approx(10.0)
+    assert loss == pytest.approx(100.0 / 3.0)
+
+    stats.push(20.0)
+    avg, jitter, loss = stats.stats()
+    assert avg == pytest.approx(11.9)
+    assert jitter == pytest.approx(9.0)
+    assert loss == pytest.approx(25.0)
+
+    for _ in range(3):  # the lost probe slides out of the 4-probe window
+        stats.push(20.0)
+    assert stats.stats()[2] == 0.0
+
+
+def test_kernel_rx_time_reads_timestamp_control_message(monkeypatch):
+    monkeypatch.setattr(main_window, "_SO_TIMESTAMPNS", 35)
+    stamp = main_window._TIMESPEC.pack(1_700_000_000, 250_000_000)
+    assert main_window._kernel_rx_time([(socket.SOL_SOCKET, 35, stamp)]) == pytest.approx(1_700_000_000.25)
+    assert main_window._kernel_rx_time([(socket.SOL_SOCKET, 36, stamp)]) is None
+    assert main_window._kernel_rx_time([]) is None
+
+
+def test_netdiag_probe_backs_off_while_nothing_answers(monkeypatch):
+    opened = []
+
+    class _SilentSocket:
+        def __init__(self, *args):
+            self.blocking = True
+            opened.append(self)
+
+        def settimeout(self, value):
+            self.blocking = True
+
+        def setblocking(self, flag):
+            self.blocking = flag
+
+        def setsockopt(self, *args):
+            pass
+
+        def connect(self, addr):
+            pass
+
+        def send(self, payload):
+            pass
+
+        def recv_into(self, buf):
+            if not self.blocking:
+                raise BlockingIOError()
+            raise socket.timeout("timed out")
+
+        def close(self):
+            pass
+
+    class _Stop:
+        def __init__(self, cycles):
+            self.waits = []
+            self._cycles = cycles
+
+        def is_set(self):
+            return len(self.waits) >= self._cycles
+
+        def wait(self, timeout):
+            self.waits.append(timeout)
+
+    monkeypatch.setattr(main_window.socket, "socket", _SilentSocket)
+    stop = _Stop(main_window._NETDIAG_IDLE_AFTER + 2)
+    stub = SimpleNamespace(
+        _netdiag_stop=stop,
+        _rov_host="192.168.1.4",
+        _netdiag_port=7700,
+        _update_netdiag_snapshot=lambda **kwargs: None,
+    )
+    main_window.MainWindow._netdiag_probe_loop(stub)
+    fast = main_window._NETDIAG_IDLE_AFTER - 1
+    assert all(w <= main_window._NETDIAG_INTERVAL_S for w in stop.waits[:fast])
+    assert all(w > 1.0 for w in stop.waits[fast:])
+    assert len(opened) == 1  # timeouts keep the connected socket
+
+
+@pytest.mark.network
+def test_netdiag_probe_measures_rtt_against_udp_echo():
+    echo = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    echo.bind(("127.0.0.1", 0))
+    echo.settimeout(2.0)
+    received = []
+
+    def _serve_once():
+        data, addr = echo.recvfrom(4096)
+        received.append(data)
+        echo.sendto(data, addr)
+
+    server = threading.Thread(target=_serve_once, daemon=True)
+    server.start()
+    snapshots = []
+    stub = SimpleNamespace(
+        _netdiag_stop=threading.Event(),
+        _rov_host="127.0.0.1",
+        _netdiag_port=echo.getsockname()[1],
+    )
+
+    def _record(**kwargs):
+        snapshots.append(kwargs)
+        stub._netdiag_stop.set()
+
+    stub._update_netdiag_snapshot = _record
+    try:
+        main_window.MainWindow._netdiag_probe_loop(stub)
+    finally:
+        server.join(timeout=2.0)
+        echo.close()
+
+    assert received and received[0].endswith(b"|0")
+    assert snapshots[0]["ok"] is True
+    assert snapshots[0]["last_rtt_ms"] >= 0.0
+    assert snapshots[0]["loss_pct"] == 0.0
+
+
+@pytest.mark.network
+def test_netdiag_probe_ignores_late_echo_of_timed_out_probe():
+    echo = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    echo.bind(("127.0.0.1", 0))
+    echo.settimeout(0.2)
+    done = threading.Event()
+    timers = []
+
+    def _serve():
+        # seq 0 comes back after the probe has given up on it and sent seq 1;
+        # every later echo takes 100 ms.
+        while not done.is_set():
+            try:
+                data, addr = echo.recvfrom(4096)
+            except socket.timeout:
+                continue
+            delay = 0.55 if data.endswith(b"|0") else 0.10
+            timer = threading.Timer(delay, echo.sendto, (data, addr))
+            timer.start()
+            timers.append(timer)
+
+    server = threading.Thread(target=_serve, daemon=True)
+    server.start()
+    snapshots = []
+    stub = SimpleNamespace(
+        _netdiag_stop=threading.Event(),
+        _rov_host="127.0.0.1",
+        _netdiag_port=echo.getsockname()[1],
+    )
+
+    def _record(**kwargs):
+        snapshots.append(kwargs)
+        if len(snapshots) >= 4:
+            stub._netdiag_stop.set()
+
+    stub._update_netdiag_snapshot = _record
+    try:
+        main_window.MainWindow._netdiag_probe_loop(stub)
+    finally:
+        done.set()
+        server.join(timeout=2.0)
+        for timer in timers:
+            timer.join(timeout=1.0)
+        echo.close()
+
+    assert snapshots[0]["ok"] is False
+    assert all(snap["ok"] for snap in snapshots[1:])
+    assert all(snap["last_rtt_ms"] >= 90.0 for snap in snapshots[1:])
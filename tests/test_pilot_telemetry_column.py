@@ -49,3 +49,75 @@ def test_pilot_telemetry_column_updates_gain_indicators():
         column.close()
         column.deleteLater()
         app.processEvents()
+
+
+def test_attitude_indicator_reuses_chrome_layers_until_resized():
+    app = _app()
+    column = PilotTelemetryColumn()
+    column.show()
+    try:
+        app.processEvents()
+        indicator = column.attitude_indicator
+        column.update_from_sensor({"type": "attitude", "roll_deg": 12.0, "pitch_deg": -4.0, "yaw_deg": 270.0})
+        indicator.grab()
+        face = indicator._face_pix
+        assert face is not None and indicator._overlay_pix is not None
+
+        column.update_from_sensor({"type": "attitude", "roll_deg": -8.0, "pitch_deg": 3.0, "yaw_deg": 90.0})
+        indicator.grab()
+        assert indicator._face_pix is face
+
+        indicator.resize(indicator.width() + 20, indicator.height())
+        indicator.grab()
+        assert indicator._face_pix is not face
+    finally:
+        column.close()
+        column.deleteLater()
+        app.processEvents()
+
+
+def test_attitude_updates_are_coalesced_to_one_repaint_per_interval(monkeypatch):
+    app = _app()
+    column = PilotTelemetryColumn()
+    try:
+        indicator = column.attitude_indicator
+        calls = []
+        monkeypatch.setattr(indicator, "update", lambda: calls.append(1))
+        for i in range(10):
+            indicator.set_attitude({"roll_deg": float(i), "pitch_deg": 0.0, "yaw_deg": 0.0})
+        assert len(calls) == 1
+        assert indicator.roll_deg == 9.0
+
+        indicator._repaint._on_timeout()
+        assert len(calls) == 2
+        indicator._repaint._on_timeout()
+        assert len(calls) == 2
+    finally:
+        column.deleteLater()
+        app.processEvents()
+
+
+def test_attitude_indicator_skips_repaint_for_unchanged_sample(monkeypatch):
+    app = _app()
+    column = PilotTelemetryColumn()
+    try:
+        indicator = column.attitude_indicator
+        indicator.resize(200, 180)
+        sample = {"roll_deg": 5.0, "pitch_deg": -2.0, "yaw_deg": 90.0}
+        indicator.set_attitude(sample)
+        first = indicator.grab().toImage()
+        frame_pix = indicator._frame_pix
+
+        calls = []
+        monkeypatch.setattr(indicator._repaint, "request", lambda: calls.append(1))
+        indicator.set_attitude(dict(sample))
+        indicator.set_attitude({"roll_deg": 5.01, "pitch_deg": -2.0, "yaw_deg": 90.0})
+        assert calls == []
+        assert indicator.grab().toImage() == first
+        assert indicator._frame_pix is frame_pix
+
+        indicator.set_attitude({"roll_deg": 6.0})
+        assert calls == [1]
+    finally:
+        column.deleteLater()
+        app.processEvents()
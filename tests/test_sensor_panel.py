@@ -0,0 +1,196 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtWidgets import QApplication
+
+from gui.sensor_panel import SensorPanel, _bps_to_str, _fmt_net, _fmt_raw
+
+
+def _app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _values(panel: SensorPanel) -> dict[str, str]:
+    table = panel.table
+    return {table.item(row, 0).text(): table.item(row, 2).text() for row in range(table.rowCount())}
+
+
+def test_sensor_panel_formats_value_column_per_type():
+    app = _app()
+    panel = SensorPanel()
+    try:
+        panel.upsert_sensor_batch(
+            [
+                {"sensor": "imu", "type": "imu", "accel": {"x": 0.1, "y": -9.81, "z": 0.0}, "gyro": {"x": 1, "y": 2, "z": 3}},
+                {"sensor": "mag", "type": "mag", "mag_sources": {"ak09915": {"x": 3.0, "y": 4.0, "z": 0.0}, "mmc5983": None}},
+                {"sensor": "att", "type": "attitude", "roll_deg": 1.234, "pitch_deg": -0.5, "tilt_deg": 1.3},
+                {"sensor": "bme280", "type": "env", "temperature_c": 20.04, "pressure_kpa": 101.35},
+                {"sensor": "leak", "type": "leak", "leak": True},
+                {"sensor": "ads", "type": "adc", "channels": [1.0, 2.345]},
+                {"sensor": "bar30", "type": "external_depth", "depth_m": 1.5, "temperature_c": 9.0},
+                {"sensor": "bar02", "type": "external_depth", "depth_m": 1.5, "temperature_c": 9.0, "pressure_mbar": 1150.25},
+                {"sensor": "odd", "type": "mystery", "a": 1},
+                {"sensor": "hb", "type": "heartbeat", "armed": True, "pilot_age": 0.123, "pilot_seq": 7},
+                {
+                    "sensor": "network",
+                    "type": "net",
+                    "iface": "eth0",
+                    "ip": "192.168.1.4",
+                    "link": {"kind": "ethernet", "state": "up", "speed_mbps": 100.0},
+                    "rx_bps": 125000,
+                    "tx_bps": 12,
+                    "counters": {"rx_drop": 0, "tx_drop": 1, "rx_errs": 2},
+                    "is_tether": True,
+                    "default_iface": "wlan0",
+                    "selection_reason": "tether",
+                },
+            ]
+        )
+        assert _values(panel) == {
+            "imu": "acc=(0.10,-9.81,0.00)\ngyro=(1.00,2.00,3.00)",
+            "mag": "ak=(3.0,4.0,0.0) |B|=5.0\nmmc=(0.0,0.0,0.0) |B|=0.0",
+            "att": "roll=1.23 deg pitch=-0.50 deg tilt=1.30 deg",
+            "bme280": "20.0 C, 101.3 kPa",
+            "leak": "LEAK!",
+            "ads": "1.00, 2.35",
+            "bar30": "1.50 m, 9.0 C",
+            "bar02": "1.50 m, 9.0 C, 1150.2 mbar",
+            "odd": "{'sensor': 'odd', 'type': 'mystery', 'a': 1}",
+            "hb": "armed=True pilot_age=0.12s seq=7",
+            "network": (
+                "eth0 ethernet up 100Mbps ip=192.168.1.4 rx=1.00Mb/s tx=96b/s "
+                "drop=0/1 err=2/- sel=eth0 def=wlan0(tether) (tether)"
+            ),
+        }
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_sensor_panel_resizes_rows_only_when_value_shape_changes():
+    app = _app()
+    panel = SensorPanel()
+    try:
+        resized = []
+        panel.table.resizeRowToContents = resized.append
+        panel.upsert_sensor_batch(
+            [
+                {"sensor": "bme280", "type": "env", "temperature_c": 20.0, "pressure_kpa": 101.0},
+                {"sensor": "leak", "type": "leak", "leak": False},
+                {"sensor": "bme280", "type": "env", "temperature_c": 21.0, "pressure_kpa": 101.0},
+            ]
+        )
+        assert sorted(resized) == [0, 1]
+        assert _values(panel)["bme280"] == "21.0 C, 101.0 kPa"
+
+        panel.upsert_sensor({"sensor": "leak", "type": "leak", "leak": False})
+        assert sorted(resized) == [0, 1]  # unchanged value: nothing to lay out
+
+        panel.upsert_sensor({"sensor": "bme280", "type": "env", "temperature_c": 22.0, "pressure_kpa": 101.0})
+        assert sorted(resized) == [0, 1]  # same shape: height cannot change
+        panel.upsert_sensor({"sensor": "bme280", "type": "env", "temperature_c": -22.0, "pressure_kpa": 101.0})
+        panel.upsert_sensor({"sensor": "leak", "type": "leak", "leak": True})
+        assert sorted(resized) == [0, 0, 1, 1]
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_sensor_panel_updates_cached_items_in_place():
+    app = _app()
+    panel = SensorPanel()
+    try:
+        panel.upsert_sensor({"sensor": "bme280", "type": "env", "temperature_c": 20.0, "pressure_kpa": 101.0})
+        value_item = panel.table.item(0, 2)
+        panel.upsert_sensor({"sensor": "bme280", "type": "env", "temperature_c": 22.5, "pressure_kpa": 101.0})
+        assert panel.table.item(0, 2) is value_item
+        assert value_item.text() == "22.5 C, 101.0 kPa"
+        assert value_item.toolTip() == value_item.text()
+
+        panel.upsert_sensor({"sensor": "bme280", "type": "leak", "leak": True})
+        assert panel.table.item(0, 1).text() == "leak"
+        assert panel.table.item(0, 2) is value_item
+        assert value_item.text() == "LEAK!"
+
+        panel.upsert_sensor({"sensor": "ads", "type": "adc", "channels": [1.0]})
+        panel.upsert_sensor({"sensor": "bme280", "type": "power"})
+        assert panel.table.rowCount() == 1
+        assert _values(panel) == {"ads": "1.00"}
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_bps_to_str_scales_bytes_per_second_to_bits():
+    assert _bps_to_str(12) == "96b/s"
+    assert _bps_to_str(1500) == "12.0Kb/s"
+    assert _bps_to_str(125000) == "1.00Mb/s"
+    assert _bps_to_str(250_000_000) == "2.00Gb/s"
+    assert _bps_to_str(-1) == "-"
+    assert _bps_to_str(None) == "-"
+
+
+def test_sensor_panel_redraws_row_when_a_sensor_alternates_types():
+    app = _app()
+    panel = SensorPanel()
+    try:
+        env = {"sensor": "bme280", "type": "env", "temperature_c": 20.0, "pressure_kpa": 101.0}
+        panel.upsert_sensor(env)
+        panel.upsert_sensor({"sensor": "bme280", "type": "leak", "leak": False})
+        panel.upsert_sensor(env)
+        assert panel.table.item(0, 1).text() == "env"
+        assert _values(panel) == {"bme280": "20.0 C, 101.0 kPa"}
+
+        panel.upsert_sensor({"sensor": "bme280", "type": "power"})
+        assert panel.table.rowCount() == 0
+        panel.upsert_sensor(env)
+        assert _values(panel) == {"bme280": "20.0 C, 101.0 kPa"}
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_sensor_panel_adds_new_rows_once_per_batch():
+    app = _app()
+    panel = SensorPanel()
+    try:
+        panel.upsert_sensor({"sensor": "leak", "type": "leak", "leak": False})
+        inserted = []
+        panel.table.model().rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+        panel.upsert_sensor_batch(
+            [
+                {"sensor": "bme280", "type": "env", "temperature_c": 20.0, "pressure_kpa": 101.0},
+                {"sensor": "ads", "type": "adc", "channels": [1.0]},
+                {"sensor": "leak", "type": "power"},
+                {"sensor": "ads", "type": "power"},
+                {"sensor": "hb", "type": "heartbeat", "armed": False},
+            ]
+        )
+        assert inserted == [(0, 1)]
+        assert panel.table.rowCount() == 2
+        assert [panel.table.item(row, 0).text() for row in range(2)] == ["bme280", "hb"]
+        assert panel._rows == {"bme280": 0, "hb": 1}
+    finally:
+        panel.deleteLater()
+        app.processEvents()
+
+
+def test_raw_fallback_caps_oversized_messages():
+    small = {"sensor": "odd", "type": "mystery"}
+    assert _fmt_raw(small) == str(small)
+    text = _fmt_raw({"sensor": "odd", "type": "mystery", "blob": list(range(1000))})
+    assert len(text) == 256
+    assert text.endswith("...")
+
+
+def test_net_formatter_treats_null_fields_as_missing():
+    text = _fmt_net({"type": "net", "iface": None, "ip": "", "link": None, "counters": None, "is_tether": False})
+    assert text == "- - - - ip=- rx=- tx=- drop=-/- err=-/- (wifi/other)"
@@ -1,5 +1,6 @@
 import json
 import socket
+import sys
 import time
 
 import pytest
@@ -48,3 +49,4 @@ def test_sensor_subscriber_receives_messages():
 
     assert received
     assert received[0]["type"] == "heartbeat"
+    assert received[0]["type"] is sys.intern("heartbeat")
@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 
 from stereo.capture import StereoCaptureSession
-from stereo.pairs import load_stereo_pairs
+from stereo.pairs import load_stereo_pairs, stereo_pairs_from_config
 from video.cam import SnapshotImagePacket, StereoImagePairPacket
 
 
@@ -97,6 +97,14 @@ def test_load_stereo_pairs_from_streams_config(tmp_path: Path):
     assert pairs[0].max_pair_delta_ms == 50
 
 
+def test_stereo_pairs_from_parsed_config_match_file_loader(tmp_path: Path):
+    cfg_path = tmp_path / "streams.json"
+    _write_stereo_config(cfg_path)
+    cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+
+    assert stereo_pairs_from_config(cfg) == load_stereo_pairs(cfg_path)
+
+
 def test_stereo_capture_session_writes_rov_pair_and_manifest(tmp_path: Path):
     cfg_path = tmp_path / "streams.json"
     _write_stereo_config(cfg_path)
@@ -16,3 +16,30 @@ def test_stream_recorder_writes_jsonl(tmp_path: Path):
     assert len(lines) == 2
     a = json.loads(lines[0])
     assert set(a.keys()) == {"t", "stream", "msg"}
+
+
+def test_stream_recorder_writes_queued_burst_in_order(tmp_path: Path):
+    out = tmp_path / "streams.jsonl"
+    rec = StreamRecorder(out)
+    for seq in range(200):
+        rec.record("pilot", {"type": "pilot", "seq": seq})
+    rec.start()
+    rec.stop()
+
+    seqs = [json.loads(line)["msg"]["seq"] for line in out.read_text().strip().splitlines()]
+    assert seqs == list(range(200))
+    assert rec.dropped == 0
+
+
+def test_stream_recorder_drops_oldest_when_backlog_is_full(tmp_path: Path):
+    out = tmp_path / "streams.jsonl"
+    rec = StreamRecorder(out)
+    rec.MAX_QUEUED = 5
+    for seq in range(8):
+        rec.record("pilot", {"type": "pilot", "seq": seq})
+    rec.start()
+    rec.stop()
+
+    seqs = [json.loads(line)["msg"]["seq"] for line in out.read_text().strip().splitlines()]
+    assert seqs == [3, 4, 5, 6, 7]
+    assert rec.dropped == 3
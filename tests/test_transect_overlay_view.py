@@ -16,7 +16,7 @@ import pytest
 
 pytest.importorskip("PyQt6")
 
-from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtCore import QRectF, QSize, Qt
 from PyQt6.QtWidgets import QApplication, QWidget
 
 from gui.transect_overlay_view import (
@@ -62,6 +62,52 @@ def test_submitting_a_frame_builds_a_qimage_and_paints():
         # BGR red -> RGB red at pixel (0,0).
         px = view._qimage.pixelColor(0, 0)
         assert (px.red(), px.green(), px.blue()) == (255, 0, 0)
+        # The QImage wraps the (already contiguous) frame instead of copying it.
+        assert view._frame is frame
+    finally:
+        view.hide()
+        view.deleteLater()
+        app.processEvents()
+
+
+def test_scaled_frame_is_reused_and_fast_while_resizing():
+    app = _app()
+    view = TransectOverlayView()
+    try:
+        view._on_frame(np.zeros((48, 64, 3), np.uint8))
+        view._resize_settle_timer.stop()
+        size = QSize(128, 128)
+
+        first = view._scaled_image(size)
+        assert view._scaled_image(size) is first
+        assert (first.width(), first.height()) == (128, 96)
+
+        view._resize_settle_timer.start(10_000)
+        fast = view._scaled_image(size)
+        assert fast is not first
+        view._resize_settle_timer.stop()
+        assert view._scaled_image(size) is not fast
+    finally:
+        view.hide()
+        view.deleteLater()
+        app.processEvents()
+
+
+def test_large_frame_is_area_downscaled_from_the_array():
+    app = _app()
+    view = TransectOverlayView()
+    try:
+        frame = np.zeros((1080, 1920, 3), np.uint8)
+        frame[:, :960] = (255, 0, 0)
+        view._on_frame(frame)
+        view._resize_settle_timer.stop()
+
+        scaled = view._scaled_image(QSize(960, 960))
+        assert (scaled.width(), scaled.height()) == (960, 540)
+        assert view._scaled_frame is not None
+        assert view._scaled_frame.shape == (540, 960, 3)
+        assert scaled.pixelColor(10, 10).blue() == 255
+        assert view._frame is frame
     finally:
         view.hide()
         view.deleteLater()
@@ -67,6 +67,10 @@ class _ActivatingDummyVideoWidget(_DummyVideoWidget):
     activated = pyqtSignal()
 
 
+class _StatefulDummyVideoWidget(_DummyVideoWidget):
+    stateChanged = pyqtSignal(str)
+
+
 def _app() -> QApplication:
     app = QApplication.instance()
     if app is None:
@@ -179,6 +183,31 @@ def test_video_tabs_widget_activation_selects_matching_pane(monkeypatch):
         app.processEvents()
 
 
+def test_video_tabs_relays_widget_state_changes_with_stream_name(monkeypatch):
+    app = _app()
+    monkeypatch.setattr("gui.video_tabs.QSettings", lambda *args, **kwargs: _FakeSettings())
+    monkeypatch.setattr("gui.video_tabs.VideoWidget", _StatefulDummyVideoWidget)
+
+    tabs = VideoTabs(
+        _DummyManager(
+            default_pane_order=["Primary Camera", "Aux Camera"],
+            default_layout_count=2,
+        ),
+        stream_names=["Primary Camera", "Aux Camera"],
+    )
+    try:
+        app.processEvents()
+        seen = []
+        tabs.streamStateChanged.connect(lambda name, state: seen.append((name, state)))
+        tabs._widgets["Aux Camera"].stateChanged.emit("playing")
+        tabs._widgets["Primary Camera"].stateChanged.emit("stalled")
+        assert seen == [("Aux Camera", "playing"), ("Primary Camera", "stalled")]
+    finally:
+        tabs.close()
+        tabs.deleteLater()
+        app.processEvents()
+
+
 def test_video_tabs_flashes_snapshot_badge_on_matching_stream(monkeypatch):
     app = _app()
     monkeypatch.setattr("gui.video_tabs.QSettings", lambda *args, **kwargs: _FakeSettings())
@@ -313,6 +342,17 @@ def test_video_tabs_stops_hidden_streams_after_layout_shrinks(monkeypatch):
         assert tabs._widgets["Primary Camera"] is not None
         assert tabs._widgets["Aux Camera"] is None
         assert tabs._widgets["Arm Camera"] is None
+
+        placeholder = tabs._placeholders["Aux Camera"]
+        assert not placeholder.isHidden()
+        assert placeholder.text() == "Aux Camera\n(starting when needed)"
+        assert tabs._containers["Aux Camera"].layout().count() == 1
+
+        tabs.set_layout_count(4)
+        app.processEvents()
+        assert tabs._widgets["Aux Camera"] is not None
+        assert tabs._placeholders["Aux Camera"] is placeholder
+        assert placeholder.isHidden()
     finally:
         tabs.close()
         tabs.deleteLater()
@@ -409,6 +449,42 @@ def test_video_tabs_propagates_square_display_to_widgets(monkeypatch):
         app.processEvents()
 
 
+def test_video_tabs_does_not_build_a_second_widget_while_one_is_starting(monkeypatch):
+    app = _app()
+    fake_settings = _FakeSettings({"video/layout_count": 1})
+    monkeypatch.setattr("gui.video_tabs.QSettings", lambda *args, **kwargs: fake_settings)
+    built = []
+    holder = {}
+
+    class _ReentrantVideoWidget(_DummyVideoWidget):
+        def __init__(self, manager, stream_name: str, parent=None, *, autostart: bool = True):
+            built.append(stream_name)
+            tabs = holder.get("tabs")
+            if tabs is not None:
+                tabs._ensure_stream_started(stream_name)
+            super().__init__(manager, stream_name, parent, autostart=autostart)
+
+    monkeypatch.setattr("gui.video_tabs.VideoWidget", _ReentrantVideoWidget)
+    tabs = VideoTabs(
+        _DummyManager(default_pane_order=["Primary Camera", "Aux Camera"]),
+        stream_names=["Primary Camera", "Aux Camera"],
+    )
+    try:
+        app.processEvents()
+        holder["tabs"] = tabs
+        built.clear()
+        tabs._stop_stream_widget("Primary Camera")
+        tabs._ensure_stream_started("Primary Camera")
+        assert built == ["Primary Camera"]
+        assert tabs._starting == set()
+        assert tabs._widgets["Primary Camera"] is not None
+    finally:
+        holder.clear()
+        tabs.close()
+        tabs.deleteLater()
+        app.processEvents()
+
+
 def test_video_tabs_can_suspend_and_resume_visible_streams(monkeypatch):
     app = _app()
     fake_settings = _FakeSettings({"video/layout_count": 2})
@@ -457,6 +533,11 @@ def test_video_tabs_defers_video_autostart_until_link_ok(monkeypatch):
         app.processEvents()
 
         assert all(widget.rov_link_statuses[-1] == "OK" for widget in visible_widgets)
+
+        counts = [len(widget.rov_link_statuses) for widget in visible_widgets]
+        tabs.set_rov_link_status("OK")
+        tabs.set_tether_status(True, "")
+        assert [len(widget.rov_link_statuses) for widget in visible_widgets] == counts
     finally:
         tabs.close()
         tabs.deleteLater()
@@ -621,6 +621,8 @@ class RemoteCameraManager:
     def __init__(self, config_path: str):
         with open(config_path, "r") as f:
             cfg = json.load(f)
+        # Parsed streams.json, so other readers (stereo pairs) needn't re-read it.
+        self.config = cfg
 
         # ROV RPC endpoint comes from config (single source of truth).
         self.rov = ROVStreams(endpoint=VIDEO_RPC_ENDPOINT)